@@ -0,0 +1,106 @@
+param(
+    [string]$BaseUrl = "http://127.0.0.1:8000",
+    [string]$BackendDir = "C:\Users\Ha22y\OneDrive\Desktop\Bridge US V2\WebSite\BackEnd",
+    [string]$TargetLanguage = "zh",
+    [int]$TimeoutSeconds = 120
+)
+
+# Requires OPENAI_API_KEY and TRANSLATION_WORKER_EMBEDDED_LOOPS=0 on the API server,
+# so translations are produced only by the standalone worker started below.
+
+$apiBase = "$BaseUrl/api"
+$random = Get-Random -Maximum 999999
+$email = "test$random@example.com"
+$password = "TestPass123!"
+$displayName = "WorkerUser$random"
+# A code-like token survives translation unchanged, so it is searchable in every language.
+$token = "brg$random"
+
+function Get-Token {
+    param(
+        [string]$Email,
+        [string]$DisplayName
+    )
+
+    $sendCodeBody = @{
+        email = $Email
+        purpose = "register"
+    } | ConvertTo-Json
+
+    $sendCode = Invoke-RestMethod -Method Post -Uri "$apiBase/auth/send-code" -ContentType "application/json" -Body $sendCodeBody
+    if (-not $sendCode.code) {
+        Write-Host "Email verification code missing. Check email settings."
+        exit 1
+    }
+
+    $registerBody = @{
+        email = $Email
+        password = $password
+        display_name = $DisplayName
+        code = $sendCode.code
+    } | ConvertTo-Json
+
+    $register = Invoke-RestMethod -Method Post -Uri "$apiBase/auth/register" -ContentType "application/json" -Body $registerBody
+    return $register.access_token
+}
+
+if (!(Test-Path $BackendDir)) {
+    Write-Host "Backend directory not found: $BackendDir"
+    exit 1
+}
+
+$worker = $null
+try {
+    $accessToken = Get-Token -Email $email -DisplayName $displayName
+    if (-not $accessToken) {
+        Write-Host "Failed to register and get access token."
+        exit 1
+    }
+
+    $headers = @{
+        Authorization = "Bearer $accessToken"
+    }
+
+    $createBody = @{
+        title = "Worker search $token"
+        content = "Campus housing guide, reference code $token."
+        language = "en"
+        status = "published"
+        tags = @("housing")
+    } | ConvertTo-Json
+
+    $created = Invoke-RestMethod -Method Post -Uri "$apiBase/posts" -Headers $headers -ContentType "application/json" -Body $createBody
+    if (-not $created.id) {
+        Write-Host "Post creation failed."
+        exit 1
+    }
+    $postId = $created.id
+
+    $worker = Start-Process -FilePath "python" -ArgumentList "-m", "app.workers.translation", "--concurrency", "2" -WorkingDirectory $BackendDir -PassThru -NoNewWindow
+
+    $deadline = (Get-Date).AddSeconds($TimeoutSeconds)
+    $found = $false
+    while ((Get-Date) -lt $deadline) {
+        $search = Invoke-RestMethod -Method Get -Uri "$apiBase/search?q=$token&language=$TargetLanguage&limit=10&offset=0"
+        if ($search.total -ge 1) {
+            $found = $true
+            break
+        }
+        Start-Sleep -Seconds 2
+    }
+    if (-not $found) {
+        Write-Host "Worker-translated post is not searchable in $TargetLanguage."
+        exit 1
+    }
+} catch {
+    Write-Host "Step10 translation worker search test failed."
+    Write-Host $_.Exception.Message
+    exit 1
+} finally {
+    if ($null -ne $worker -and -not $worker.HasExited) {
+        Stop-Process -Id $worker.Id
+    }
+}
+
+Write-Host "Step10 translation worker search test passed."
+Write-Host ("post_id: {0}" -f $postId)
@@ -0,0 +1,33 @@
+param(
+    [string]$BackendDir = "C:\Users\Ha22y\OneDrive\Desktop\Bridge US V2\WebSite\BackEnd"
+)
+
+if (!(Test-Path $BackendDir)) {
+    Write-Host "Backend directory not found: $BackendDir"
+    exit 1
+}
+
+Set-Location $BackendDir
+
+# Casts a helpful vote whose counter delta is still buffered, runs a reconcile pass in between,
+# then drains the buffer and checks the vote was counted exactly once. Uses a throwaway SQLite file.
+$dbPath = Join-Path ([System.IO.Path]::GetTempPath()) ("bridgeus-reconcile-{0}.db" -f (Get-Random -Maximum 999999))
+$previousUrl = $env:DATABASE_URL
+$previousFlush = $env:VOTE_BUFFER_FLUSH_MS
+try {
+    $env:DATABASE_URL = "sqlite+aiosqlite:///$($dbPath -replace '\\', '/')"
+    $env:VOTE_BUFFER_FLUSH_MS = "60000"
+    python -m app.tasks.counter_reconcile_check
+    $exitCode = $LASTEXITCODE
+} finally {
+    $env:DATABASE_URL = $previousUrl
+    $env:VOTE_BUFFER_FLUSH_MS = $previousFlush
+    Remove-Item -Path $dbPath -ErrorAction SilentlyContinue
+}
+
+if ($exitCode -ne 0) {
+    Write-Host "Step11 counter reconcile check failed."
+    exit 1
+}
+
+Write-Host "Step11 counter reconcile check passed."
@@ -0,0 +1,21 @@
+param(
+    [string]$BackendDir = "C:\Users\Ha22y\OneDrive\Desktop\Bridge US V2\WebSite\BackEnd"
+)
+
+if (!(Test-Path $BackendDir)) {
+    Write-Host "Backend directory not found: $BackendDir"
+    exit 1
+}
+
+Set-Location $BackendDir
+
+# Seeds sample rows inside a transaction on DATABASE_URL (SQLite or Postgres), calls the hot service functions,
+# runs EXPLAIN on the SQL they issue, then rolls everything back.
+# Fails when a query falls back to a full table scan, e.g. after an index is dropped.
+python -m app.tasks.query_plan_check
+if ($LASTEXITCODE -ne 0) {
+    Write-Host "Step2 query plan check failed. Run Alembic upgrade head and review the scans above."
+    exit 1
+}
+
+Write-Host "Step2 query plan check passed."
@@ -0,0 +1,103 @@
+"""add translation jobs table and hot path indexes
+
+Revision ID: a3d9e4c71b20
+Revises: f2a4c8d1a7b3
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a3d9e4c71b20"
+down_revision = "f2a4c8d1a7b3"
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, partial where clause)
+INDEXES = (
+    ("ix_posts_status_created_at", "posts", ["status", "created_at"], None),
+    ("ix_posts_author_id_created_at", "posts", ["author_id", "created_at"], None),
+    ("ix_post_tags_tag_id", "post_tags", ["tag_id"], None),
+    ("ix_helpfulness_votes_target", "helpfulness_votes", ["target_type", "target_id"], None),
+    ("ix_accuracy_feedbacks_post_id", "accuracy_feedbacks", ["post_id"], None),
+    ("ix_notifications_user_id_created_at", "notifications", ["user_id", "created_at"], None),
+    ("ix_notifications_dedupe", "notifications", ["user_id", "type", "dedupe_key"], "dedupe_key IS NOT NULL"),
+    ("ix_replies_post_id_status_created_at", "replies", ["post_id", "status", "created_at"], None),
+    ("ix_replies_author_id_created_at", "replies", ["author_id", "created_at"], None),
+    (
+        "ix_email_verification_codes_email_purpose",
+        "email_verification_codes",
+        ["email", "purpose", "created_at"],
+        None,
+    ),
+    ("ix_user_sessions_refresh_token_hash", "user_sessions", ["refresh_token_hash"], None),
+    ("ix_user_sessions_user_id", "user_sessions", ["user_id"], None),
+    ("ix_reports_created_at", "reports", ["created_at"], None),
+    ("ix_reports_reporter_id_created_at", "reports", ["reporter_id", "created_at"], None),
+    ("ix_moderation_actions_created_at", "moderation_actions", ["created_at"], None),
+    ("ix_moderation_logs_created_at", "moderation_logs", ["created_at"], None),
+    ("ix_moderation_logs_user_id_created_at", "moderation_logs", ["user_id", "created_at"], None),
+    ("ix_moderation_logs_target", "moderation_logs", ["target_type", "target_id"], None),
+    ("ix_translation_jobs_status_next_run_at", "translation_jobs", ["status", "next_run_at"], None),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # translation_jobs used to be created at runtime by ensure_translation_job_schema.
+    if op.get_context().as_sql or not sa.inspect(bind).has_table("translation_jobs"):
+        op.create_table(
+            "translation_jobs",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("target_type", sa.String(length=16), nullable=False),
+            sa.Column("target_id", sa.String(length=36), nullable=False),
+            sa.Column("language", sa.String(length=8), nullable=False),
+            sa.Column("status", sa.String(length=32), nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("max_attempts", sa.Integer(), nullable=False),
+            sa.Column("last_error", sa.Text(), nullable=True),
+            sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("next_run_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP")),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP")),
+            sa.PrimaryKeyConstraint("id", name=op.f("pk_translation_jobs")),
+            sa.UniqueConstraint(
+                "target_type", "target_id", "language", name=op.f("uq_translation_jobs_target_type")
+            ),
+        )
+
+    if bind.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            for name, table, columns, where in INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    postgresql_concurrently=True,
+                    postgresql_where=sa.text(where) if where else None,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                sqlite_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
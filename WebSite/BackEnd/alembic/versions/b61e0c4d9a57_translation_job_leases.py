@@ -0,0 +1,23 @@
+"""add lease owner to translation jobs
+
+Revision ID: b61e0c4d9a57
+Revises: d8b4e6a2c913
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b61e0c4d9a57"
+down_revision = "d8b4e6a2c913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("translation_jobs", sa.Column("locked_by", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("translation_jobs", "locked_by")
@@ -0,0 +1,139 @@
+"""add post full-text search index
+
+Revision ID: b7e2f0c9d4a1
+Revises: a3d9e4c71b20
+Create Date: 2026-10-17
+"""
+
+import hashlib
+import html
+import json
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b7e2f0c9d4a1"
+down_revision = "a3d9e4c71b20"
+branch_labels = None
+depends_on = None
+
+# The backfill below is frozen at this revision so later changes to the app cannot alter what it writes.
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACED_SCRIPT_RE = re.compile(r"([\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af])")
+_POSTGRES_CONFIGS = {"en": "english"}
+
+
+def _collect_text(obj: object, fields: list[str]) -> None:
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key in {"text", "caption"} and isinstance(value, str) and value.strip():
+                fields.append(value)
+            elif key != "file" and isinstance(value, (dict, list)):
+                _collect_text(value, fields)
+    elif isinstance(obj, list):
+        for value in obj:
+            if isinstance(value, str) and value.strip():
+                fields.append(value)
+            elif isinstance(value, (dict, list)):
+                _collect_text(value, fields)
+
+
+def _document_text(content: str) -> str:
+    try:
+        payload = json.loads(content)
+    except Exception:
+        payload = None
+    if isinstance(payload, dict) and isinstance(payload.get("blocks"), list):
+        fields: list[str] = []
+        _collect_text(payload, fields)
+        value = "\n".join(fields)
+    else:
+        value = content
+    return " ".join(html.unescape(_TAG_RE.sub(" ", value)).split())
+
+
+def _segment(value: str) -> str:
+    return " ".join(_SPACED_SCRIPT_RE.sub(r" \1 ", value).split())
+
+
+def _sqlite_rowid(post_id: str, language: str) -> int:
+    digest = hashlib.sha1(f"{post_id}:{language}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") >> 1
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            """
+            CREATE TABLE IF NOT EXISTS post_search_documents (
+                post_id VARCHAR(36) NOT NULL REFERENCES posts (id) ON DELETE CASCADE,
+                language VARCHAR(8) NOT NULL,
+                config REGCONFIG NOT NULL,
+                title TEXT NOT NULL DEFAULT '',
+                body TEXT NOT NULL DEFAULT '',
+                document TSVECTOR GENERATED ALWAYS AS (
+                    setweight(to_tsvector(config, title), 'A') || setweight(to_tsvector(config, body), 'B')
+                ) STORED,
+                CONSTRAINT pk_post_search_documents PRIMARY KEY (post_id, language)
+            )
+            """
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_post_search_documents_document "
+            "ON post_search_documents USING GIN (document)"
+        )
+    elif bind.dialect.name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS post_search_fts USING fts5("
+            "post_id UNINDEXED, language UNINDEXED, title, body, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+    else:
+        return
+
+    if op.get_context().as_sql:
+        return
+    rows = bind.execute(
+        sa.text(
+            "SELECT post_id, language, title, content FROM post_translations "
+            "WHERE status = 'ready' AND content IS NOT NULL"
+        )
+    ).all()
+    for post_id, language, title, content in rows:
+        params = {
+            "post_id": post_id,
+            "language": language,
+            "title": _segment(title or ""),
+            "body": _segment(_document_text(content)),
+        }
+        if bind.dialect.name == "postgresql":
+            bind.execute(
+                sa.text(
+                    "INSERT INTO post_search_documents (post_id, language, config, title, body) "
+                    "VALUES (:post_id, :language, CAST(:config AS regconfig), :title, :body) "
+                    "ON CONFLICT (post_id, language) DO UPDATE SET "
+                    "config = EXCLUDED.config, title = EXCLUDED.title, body = EXCLUDED.body"
+                ),
+                {**params, "config": _POSTGRES_CONFIGS.get(language, "simple")},
+            )
+        else:
+            rowid = _sqlite_rowid(post_id, language)
+            bind.execute(sa.text("DELETE FROM post_search_fts WHERE rowid = :rowid"), {"rowid": rowid})
+            bind.execute(
+                sa.text(
+                    "INSERT INTO post_search_fts (rowid, post_id, language, title, body) "
+                    "VALUES (:rowid, :post_id, :language, :title, :body)"
+                ),
+                {**params, "rowid": rowid},
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP TABLE IF EXISTS post_search_documents")
+    elif bind.dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS post_search_fts")
@@ -0,0 +1,61 @@
+"""add post trending scores
+
+Revision ID: c5f1a8e3b640
+Revises: b7e2f0c9d4a1
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c5f1a8e3b640"
+down_revision = "b7e2f0c9d4a1"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("ix_helpfulness_votes_created_at", "helpfulness_votes", ["created_at"]),
+    ("ix_accuracy_feedbacks_created_at", "accuracy_feedbacks", ["created_at"]),
+    ("ix_post_views_created_at", "post_views", ["created_at"]),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "post_trending_scores",
+        sa.Column("post_id", sa.String(length=36), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.ForeignKeyConstraint(
+            ["post_id"],
+            ["posts.id"],
+            name=op.f("fk_post_trending_scores_post_id_posts"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("post_id", name=op.f("pk_post_trending_scores")),
+    )
+    op.create_index("ix_post_trending_scores_score", "post_trending_scores", ["score"])
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_index("ix_post_trending_scores_score", table_name="post_trending_scores")
+    op.drop_table("post_trending_scores")
@@ -0,0 +1,56 @@
+"""add running accuracy sums for delta counter updates
+
+Revision ID: d8b4e6a2c913
+Revises: c5f1a8e3b640
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d8b4e6a2c913"
+down_revision = "c5f1a8e3b640"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "posts",
+        sa.Column("accuracy_sum", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "profiles",
+        sa.Column("accuracy_sum", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "profiles",
+        sa.Column("accuracy_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(
+        """
+        UPDATE posts SET
+            accuracy_sum = COALESCE(
+                (SELECT SUM(rating) FROM accuracy_feedbacks WHERE accuracy_feedbacks.post_id = posts.id), 0
+            ),
+            accuracy_count = (SELECT COUNT(*) FROM accuracy_feedbacks WHERE accuracy_feedbacks.post_id = posts.id)
+        """
+    )
+    op.execute(
+        """
+        UPDATE profiles SET
+            accuracy_sum = COALESCE(
+                (SELECT SUM(posts.accuracy_sum) FROM posts WHERE posts.author_id = profiles.user_id), 0
+            ),
+            accuracy_count = COALESCE(
+                (SELECT SUM(posts.accuracy_count) FROM posts WHERE posts.author_id = profiles.user_id), 0
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("profiles", "accuracy_count")
+    op.drop_column("profiles", "accuracy_sum")
+    op.drop_column("posts", "accuracy_sum")
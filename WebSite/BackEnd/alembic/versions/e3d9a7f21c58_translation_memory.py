@@ -0,0 +1,35 @@
+"""add translation memory
+
+Revision ID: e3d9a7f21c58
+Revises: b61e0c4d9a57
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e3d9a7f21c58"
+down_revision = "b61e0c4d9a57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "translation_memory",
+        sa.Column("segment_hash", sa.String(length=64), nullable=False),
+        sa.Column("source_language", sa.String(length=8), nullable=False),
+        sa.Column("target_language", sa.String(length=8), nullable=False),
+        sa.Column("model", sa.String(length=64), nullable=False),
+        sa.Column("translation", sa.Text(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)")),
+        sa.PrimaryKeyConstraint("segment_hash", "source_language", "target_language", "model"),
+    )
+    op.create_index("ix_translation_memory_last_used_at", "translation_memory", ["last_used_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_translation_memory_last_used_at", table_name="translation_memory")
+    op.drop_table("translation_memory")
@@ -0,0 +1,25 @@
+"""add row version counters for post validators
+
+Revision ID: f6c1b8d2e4a7
+Revises: e3d9a7f21c58
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f6c1b8d2e4a7"
+down_revision = "e3d9a7f21c58"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ("posts", "post_translations", "profiles"):
+        op.add_column(table, sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")))
+
+
+def downgrade() -> None:
+    for table in ("profiles", "post_translations", "posts"):
+        op.drop_column(table, "version")
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_admin_user, get_root_admin_user
+from app.core.auth import Principal, get_admin_user, get_root_admin_user
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.pagination import set_next_cursor
 from app.models.models import User
 from app.schemas.audit import AuditLogResponse
 from app.schemas.admin_stats import AdminStatsResponse
@@ -27,12 +28,15 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 
 @router.get("/users")
 async def users(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    items = await list_users(db, limit, offset)
+    items = await list_users(db, limit, offset, cursor=cursor)
+    set_next_cursor(response, items, limit)
     return [
         {"id": user.id, "email": user.email, "role": user.role, "status": user.status}
         for user in items
@@ -42,8 +46,8 @@ async def users(
 @router.get("/users/{user_id}")
 async def user_detail(
     user_id: str,
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await get_user_detail(db, user_id)
 
@@ -54,7 +58,7 @@ class SetRoleRequest(BaseModel):
 
 @router.get("/me")
 async def admin_me(
-    user: User = Depends(get_admin_user),
+    user: Principal = Depends(get_admin_user),
 ):
     is_root = bool(settings.root_account and user.email == settings.root_account)
     return {"id": user.id, "email": user.email, "role": user.role, "is_root": is_root}
@@ -62,20 +66,23 @@ async def admin_me(
 
 @router.get("/stats", response_model=AdminStatsResponse)
 async def stats(
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await get_admin_stats(db)
 
 
 @router.get("/audit/logs", response_model=list[AuditLogResponse])
 async def audit_logs(
+    response: Response,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    _: User = Depends(get_root_admin_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    _: Principal = Depends(get_root_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    items = await list_audit_logs(db, limit, offset)
+    items = await list_audit_logs(db, limit, offset, cursor=cursor)
+    set_next_cursor(response, items, limit)
     moderator_ids = {item.moderator_id for item in items}
     target_user_ids = {item.target_id for item in items if item.target_type == "user"}
     user_ids = moderator_ids | target_user_ids
@@ -107,7 +114,7 @@ async def audit_logs(
 @router.post("/users/{user_id}/ban")
 async def ban_user(
     user_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     user = await set_user_status(db, user_id, "banned", admin.id)
@@ -117,7 +124,7 @@ async def ban_user(
 @router.post("/users/{user_id}/unban")
 async def unban_user(
     user_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     user = await set_user_status(db, user_id, "active", admin.id)
@@ -127,7 +134,7 @@ async def unban_user(
 @router.post("/users/{user_id}/make-admin")
 async def make_admin(
     user_id: str,
-    admin: User = Depends(get_root_admin_user),
+    admin: Principal = Depends(get_root_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     user = await set_user_role(db, user_id, "admin", admin.id)
@@ -138,7 +145,7 @@ async def make_admin(
 async def set_role(
     user_id: str,
     payload: SetRoleRequest,
-    admin: User = Depends(get_root_admin_user),
+    admin: Principal = Depends(get_root_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     user = await set_user_role(db, user_id, payload.role, admin.id)
@@ -148,7 +155,7 @@ async def set_role(
 @router.post("/posts/{post_id}/hide")
 async def hide_post(
     post_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await admin_set_post_status(db, post_id, admin.id, "hidden", "admin_hide")
@@ -158,7 +165,7 @@ async def hide_post(
 @router.post("/posts/{post_id}/restore")
 async def restore_post(
     post_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await admin_set_post_status(db, post_id, admin.id, "published", "admin_restore")
@@ -168,7 +175,7 @@ async def restore_post(
 @router.post("/replies/{reply_id}/hide")
 async def hide_reply(
     reply_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     reply = await admin_set_reply_status(db, reply_id, admin.id, "hidden", "admin_hide")
@@ -178,7 +185,7 @@ async def hide_reply(
 @router.post("/replies/{reply_id}/restore")
 async def restore_reply(
     reply_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     reply = await admin_set_reply_status(db, reply_id, admin.id, "visible", "admin_restore")
@@ -187,7 +194,7 @@ async def restore_reply(
 
 @router.post("/posts/backfill-categories")
 async def backfill_categories(
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await backfill_post_categories(db, admin.id)
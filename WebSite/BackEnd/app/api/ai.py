@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_user
 from app.core.database import get_db
-from app.models.models import User
 from app.schemas.ai import (
     AIAskRequest,
     AIAskResponse,
@@ -22,7 +21,7 @@ router = APIRouter(prefix="/ai", tags=["ai"])
 @router.post("/ask", response_model=AIAskResponse)
 async def ask(
     payload: AIAskRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await enforce_ai_limit(db, user.id)
@@ -36,7 +35,7 @@ async def ask(
 @router.post("/translate", response_model=AITranslateResponse)
 async def translate(
     payload: AITranslateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await enforce_ai_limit(db, user.id)
@@ -47,7 +46,7 @@ async def translate(
 @router.post("/moderate", response_model=AIModerateResponse)
 async def moderate(
     payload: AIModerateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await enforce_ai_limit(db, user.id)
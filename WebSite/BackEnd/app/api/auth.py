@@ -3,9 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.errors import AppError
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_user
 from app.core.config import settings
-from app.models.models import User
 from app.schemas.auth import (
     ForgotPasswordRequest,
     LoginRequest,
@@ -66,7 +65,7 @@ async def send_code(payload: SendEmailCodeRequest, db: AsyncSession = Depends(ge
 @router.post("/reset-password")
 async def reset_password_endpoint(
     payload: ResetPasswordRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await reset_password(db, user.id, payload.current_password, payload.new_password)
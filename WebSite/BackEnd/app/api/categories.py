@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_admin_user
-from app.core.database import get_db
-from app.models.models import User
+from app.core.auth import Principal, get_admin_user
+from app.core.database import get_db, get_read_db
+from app.core.http_cache import conditional_response, make_etag
 from app.schemas.category import (
     CategoryCreateRequest,
     CategoryResponse,
@@ -21,8 +21,12 @@ router = APIRouter(prefix="/categories", tags=["categories"])
 
 
 @router.get("", response_model=list[CategoryResponse])
-async def get_categories(db: AsyncSession = Depends(get_db)):
+async def get_categories(request: Request, response: Response, db: AsyncSession = Depends(get_read_db)):
     categories = await list_categories(db)
+    etag = make_etag("categories", [(item.id, item.name, item.slug, item.sort_order, item.status) for item in categories])
+    not_modified = conditional_response(request, response, etag, surrogate_keys=["categories"])
+    if not_modified is not None:
+        return not_modified
     return [
         CategoryResponse(
             id=item.id,
@@ -38,7 +42,7 @@ async def get_categories(db: AsyncSession = Depends(get_db)):
 @router.post("", response_model=CategoryResponse)
 async def create(
     payload: CategoryCreateRequest,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     item = await create_category(db, payload, admin.id)
@@ -55,7 +59,7 @@ async def create(
 async def update(
     category_id: str,
     payload: CategoryUpdateRequest,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     item = await update_category(db, category_id, payload, admin.id)
@@ -71,7 +75,7 @@ async def update(
 @router.delete("/{category_id}")
 async def remove(
     category_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     await delete_category(db, category_id, admin.id)
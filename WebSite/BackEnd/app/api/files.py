@@ -4,11 +4,11 @@ import uuid
 from fastapi import APIRouter, Depends, Request, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_user
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.errors import AppError
-from app.models.models import File, User
+from app.models.models import File
 from app.schemas.file import FileUploadResponse
 
 
@@ -27,7 +27,7 @@ def _build_public_url(request: Request, filename: str) -> str:
 async def upload_file(
     request: Request,
     file: UploadFile,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     if file.content_type is None:
@@ -77,7 +77,7 @@ async def upload_file(
         size=total_size,
     )
     db.add(record)
-    await db.commit()
+    await db.flush()
     await db.refresh(record)
 
     return FileUploadResponse(
@@ -1,5 +1,9 @@
 from fastapi import APIRouter, Request
 
+from app.core.database import engine, pool_metrics, read_engines
+from app.core.singleflight import flight_groups
+from app.services.post_cache_service import post_cache
+
 
 router = APIRouter()
 
@@ -12,3 +16,12 @@ def health(request: Request):
         "request_id": getattr(request.state, "request_id", None),
     }
 
+
+@router.get("/health/metrics")
+def metrics():
+    result = {"db_pool": pool_metrics(engine)}
+    if read_engines:
+        result["db_read_pools"] = [pool_metrics(target) for target in read_engines]
+    result["post_cache"] = post_cache.stats()
+    result["singleflight"] = {name: group.metrics() for name, group in flight_groups.items()}
+    return result
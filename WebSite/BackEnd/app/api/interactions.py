@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_user
 from app.core.database import get_db
-from app.models.models import User
 from app.schemas.interaction import AccuracyFeedbackRequest, AccuracyResponse, HelpfulnessResponse
 from app.services.interaction_service import (
     delete_accuracy_feedback,
@@ -22,7 +21,7 @@ router = APIRouter(prefix="/interactions", tags=["interactions"])
 @router.post("/posts/{post_id}/helpful", response_model=HelpfulnessResponse)
 async def helpful_post(
     post_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await mark_helpful_post(db, user.id, post_id)
@@ -32,7 +31,7 @@ async def helpful_post(
 @router.delete("/posts/{post_id}/helpful", response_model=HelpfulnessResponse)
 async def unhelpful_post(
     post_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await unmark_helpful_post(db, user.id, post_id)
@@ -42,7 +41,7 @@ async def unhelpful_post(
 @router.post("/replies/{reply_id}/helpful", response_model=HelpfulnessResponse)
 async def helpful_reply(
     reply_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await mark_helpful_reply(db, user.id, reply_id)
@@ -52,7 +51,7 @@ async def helpful_reply(
 @router.delete("/replies/{reply_id}/helpful", response_model=HelpfulnessResponse)
 async def unhelpful_reply(
     reply_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await unmark_helpful_reply(db, user.id, reply_id)
@@ -63,7 +62,7 @@ async def unhelpful_reply(
 async def accuracy_feedback(
     post_id: str,
     payload: AccuracyFeedbackRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await submit_accuracy_feedback(db, user.id, post_id, payload)
@@ -74,7 +73,7 @@ async def accuracy_feedback(
 async def update_accuracy(
     post_id: str,
     payload: AccuracyFeedbackRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await update_accuracy_feedback(db, user.id, post_id, payload)
@@ -84,7 +83,7 @@ async def update_accuracy(
 @router.delete("/posts/{post_id}/accuracy", response_model=AccuracyResponse)
 async def delete_accuracy(
     post_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await delete_accuracy_feedback(db, user.id, post_id)
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_admin_user, get_current_user
-from app.core.database import get_db
+from app.core.auth import Principal, get_admin_user, get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.pagination import set_next_cursor
 from app.models.models import ModerationLog, PostTranslation, Profile, User
 from app.schemas.moderation import (
     AppealCreateRequest,
@@ -29,20 +30,23 @@ router = APIRouter(prefix="/moderation", tags=["moderation"])
 
 @router.get("/logs", response_model=list[ModerationLogResponse])
 async def get_logs(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    logs = await list_logs(db, limit, offset)
+    logs = await list_logs(db, limit, offset, cursor=cursor)
+    set_next_cursor(response, logs, limit)
     return [ModerationLogResponse(**log.__dict__) for log in logs]
 
 
 @router.get("/logs/{log_id}", response_model=ModerationLogResponse)
 async def get_log_item(
     log_id: str,
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     log = await get_log(db, log_id)
     return ModerationLogResponse(**log.__dict__)
@@ -51,30 +55,36 @@ async def get_log_item(
 @router.get("/users/{user_id}/logs", response_model=list[ModerationLogResponse])
 async def get_user_logs(
     user_id: str,
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    logs = await list_user_logs(db, user_id, limit, offset)
+    logs = await list_user_logs(db, user_id, limit, offset, cursor=cursor)
+    set_next_cursor(response, logs, limit)
     return [ModerationLogResponse(**log.__dict__) for log in logs]
 
 
 @router.get("/me/logs", response_model=list[ModerationLogResponse])
 async def get_my_logs(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    logs = await list_user_logs(db, user.id, limit, offset)
+    logs = await list_user_logs(db, user.id, limit, offset, cursor=cursor)
+    set_next_cursor(response, logs, limit)
     return [ModerationLogResponse(**log.__dict__) for log in logs]
 
 
 @router.post("/appeals", response_model=AppealResponse)
 async def submit_appeal(
     payload: AppealCreateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     appeal = await create_appeal(db, user.id, payload.target_type, payload.target_id, payload.reason)
@@ -85,8 +95,8 @@ async def submit_appeal(
 async def list_appeal_items(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     appeals = await list_appeals(db, limit, offset)
     return [AppealResponse(**appeal.__dict__) for appeal in appeals]
@@ -96,8 +106,8 @@ async def list_appeal_items(
 async def list_my_appeals(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     appeals = await list_user_appeals(db, user.id, limit, offset)
     return [AppealResponse(**appeal.__dict__) for appeal in appeals]
@@ -106,7 +116,7 @@ async def list_my_appeals(
 @router.post("/appeals/{appeal_id}/approve", response_model=AppealResponse)
 async def approve_appeal(
     appeal_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     appeal = await resolve_appeal(db, appeal_id, admin.id, "approved")
@@ -116,7 +126,7 @@ async def approve_appeal(
 @router.post("/appeals/{appeal_id}/reject", response_model=AppealResponse)
 async def reject_appeal(
     appeal_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     appeal = await resolve_appeal(db, appeal_id, admin.id, "rejected")
@@ -127,8 +137,8 @@ async def reject_appeal(
 async def get_pending_posts(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     posts = await list_pending_posts(db, limit, offset)
     if not posts:
@@ -197,7 +207,7 @@ async def get_pending_posts(
 async def approve_post(
     post_id: str,
     payload: ModerationDecisionRequest,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await resolve_post_review(db, post_id, admin.id, "approve", payload.reason)
@@ -208,7 +218,7 @@ async def approve_post(
 async def reject_post(
     post_id: str,
     payload: ModerationDecisionRequest,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await resolve_post_review(db, post_id, admin.id, "reject", payload.reason)
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_admin_user, get_current_user
-from app.core.database import get_db
+from app.core.auth import Principal, get_admin_user, get_current_user
+from app.core.database import get_db, get_read_db
 from app.core.errors import AppError
+from app.core.pagination import set_next_cursor
 from app.models.models import User
 from app.schemas.notification import (
     NotificationCreateRequest,
@@ -25,19 +26,22 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 @router.get("", response_model=list[NotificationResponse])
 async def list_my_notifications(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    items = await list_notifications(db, user.id, limit, offset)
+    items = await list_notifications(db, user.id, limit, offset, cursor=cursor)
+    set_next_cursor(response, items, limit)
     return [NotificationResponse(**item.__dict__) for item in items]
 
 
 @router.post("/read")
 async def mark_read_items(
     payload: NotificationReadRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await mark_read(db, user.id, payload.ids)
@@ -46,7 +50,7 @@ async def mark_read_items(
 
 @router.post("/read-all")
 async def mark_read_all(
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await mark_all_read(db, user.id)
@@ -56,7 +60,7 @@ async def mark_read_all(
 @router.post("", response_model=NotificationResponse)
 async def admin_create_notification(
     payload: NotificationCreateRequest,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(select(User).where(User.id == payload.user_id))
@@ -67,6 +71,6 @@ async def admin_create_notification(
         db, payload.user_id, payload.type, payload.payload, payload.dedupe_key
     )
     await log_action(db, admin.id, "notification", item.id, "notification_create", None)
-    await db.commit()
+    await db.flush()
     return NotificationResponse(**item.__dict__)
 
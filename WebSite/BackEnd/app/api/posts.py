@@ -1,24 +1,29 @@
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_user, get_optional_user
-from app.core.database import SessionLocal, get_db
+from app.core.auth import Principal, get_current_user, get_optional_user
+from app.core.database import get_db, get_read_db, unit_of_work
 from app.core.errors import AppError
-from app.models.models import User
+from app.core.http_cache import conditional_response, latest, make_etag
+from app.core.pagination import set_next_cursor
 from app.schemas.post import PostCreateRequest, PostResponse, PostUpdateRequest
 from app.services.post_service import (
     create_post,
     delete_post,
     get_post,
-    list_posts,
+    get_post_version,
+    hydrate_post,
+    hydrate_posts,
+    list_post_versions,
     list_user_posts,
     publish_post,
     process_post_submission,
     set_post_visibility,
     update_post,
 )
+from app.services.trending_service import record_post_view
 
 logger = logging.getLogger(__name__)
 
@@ -27,59 +32,97 @@ router = APIRouter(prefix="/posts", tags=["posts"])
 
 @router.get("", response_model=list[PostResponse])
 async def list_items(
+    request: Request,
+    response: Response,
     language: str = Query(default="en"),
     author_id: str | None = Query(default=None),
     include_hidden: bool = Query(default=False),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User | None = Depends(get_optional_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    user: Principal | None = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if include_hidden and (user is None or user.role != "admin"):
         raise AppError(code="forbidden", message="Admin only", status_code=403)
-    return await list_posts(
+    rows = await list_post_versions(
         db,
         language,
         limit,
         offset,
         author_id=author_id,
         include_hidden=include_hidden,
+        cursor=cursor,
+    )
+    posts = [post for post, _ in rows]
+    set_next_cursor(response, posts, limit)
+    not_modified = conditional_response(
+        request,
+        response,
+        make_etag("posts", language, [(post.id, version) for post, version in rows]),
+        latest(*(version.last_modified for _, version in rows)),
+        ["posts", *(f"post-{post.id}" for post in posts)],
+        public=user is None,
     )
+    if not_modified is not None:
+        return not_modified
+    return await hydrate_posts(db, posts, language)
 
 
 @router.get("/me", response_model=list[PostResponse])
 async def list_my_posts(
+    response: Response,
     language: str = Query(default="en"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await list_user_posts(db, user.id, language, limit, offset)
+    items = await list_user_posts(db, user.id, language, limit, offset, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return items
 
 
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_item(
     post_id: str,
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
     language: str = Query(default="en"),
-    user: User | None = Depends(get_optional_user),
-    db: AsyncSession = Depends(get_db),
+    user: Principal | None = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await get_post(db, post_id, language, user)
+    post, version = await get_post_version(db, post_id, language, user)
+    not_modified = conditional_response(
+        request,
+        response,
+        make_etag("post", post_id, language, version),
+        version.last_modified,
+        [f"post-{post_id}"],
+        public=user is None,
+    )
+    if not_modified is not None:
+        return not_modified
+    if post.status == "published":
+        client_ip = request.client.host if request.client else None
+        background_tasks.add_task(record_post_view, post_id, user.id if user else None, client_ip)
+    return await hydrate_post(db, post, language, version)
 
 
 @router.post("", response_model=PostResponse)
 async def create_item(
     payload: PostCreateRequest,
     background_tasks: BackgroundTasks,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await create_post(db, user.id, payload)
 
     async def _process(post_id: str) -> None:
         try:
-            async with SessionLocal() as session:
+            async with unit_of_work() as session:
                 await process_post_submission(session, post_id)
         except Exception:
             logger.exception("Post background processing failed", extra={"post_id": post_id})
@@ -92,7 +135,7 @@ async def create_item(
 async def update_item(
     post_id: str,
     payload: PostUpdateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await update_post(db, post_id, user.id, payload, is_admin=user.role == "admin")
@@ -102,7 +145,7 @@ async def update_item(
 @router.delete("/{post_id}")
 async def delete_item(
     post_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await delete_post(db, post_id, user.id, is_admin=user.role == "admin")
@@ -112,7 +155,7 @@ async def delete_item(
 @router.post("/{post_id}/hide", response_model=PostResponse)
 async def hide_item(
     post_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await set_post_visibility(db, post_id, user.id, "hidden", is_admin=user.role == "admin")
@@ -122,7 +165,7 @@ async def hide_item(
 @router.post("/{post_id}/restore", response_model=PostResponse)
 async def restore_item(
     post_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await set_post_visibility(db, post_id, user.id, "published", is_admin=user.role == "admin")
@@ -132,7 +175,7 @@ async def restore_item(
 @router.post("/{post_id}/publish", response_model=PostResponse)
 async def publish_item(
     post_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     post = await publish_post(db, post_id)
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_user
-from app.core.database import get_db
-from app.models.models import User
+from app.core.auth import Principal, get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.http_cache import conditional_response, make_etag
 from app.schemas.profile import ProfileResponse, ProfileUpdateRequest
 from app.services.profile_service import get_profile, update_profile
 
@@ -13,8 +13,8 @@ router = APIRouter(prefix="/profiles", tags=["profiles"])
 
 @router.get("/me", response_model=ProfileResponse)
 async def get_my_profile(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     profile = await get_profile(db, user.id)
     return ProfileResponse(
@@ -34,10 +34,12 @@ async def get_my_profile(
 @router.get("/{user_id}", response_model=ProfileResponse)
 async def get_profile_by_id(
     user_id: str,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ):
     profile = await get_profile(db, user_id)
-    return ProfileResponse(
+    item = ProfileResponse(
         user_id=profile.user_id,
         display_name=profile.display_name,
         avatar_url=profile.avatar_url,
@@ -49,12 +51,17 @@ async def get_profile_by_id(
         helpfulness_score=profile.helpfulness_score,
         accuracy_score=profile.accuracy_score,
     )
+    etag = make_etag("profile", item.model_dump())
+    not_modified = conditional_response(request, response, etag, profile.updated_at, [f"profile-{user_id}"])
+    if not_modified is not None:
+        return not_modified
+    return item
 
 
 @router.patch("/me", response_model=ProfileResponse)
 async def update_my_profile(
     payload: ProfileUpdateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     profile = await update_profile(db, user.id, payload)
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sqlalchemy import select
 
-from app.core.auth import get_current_admin_user, get_current_user, get_optional_user
-from app.core.database import get_db
+from app.core.auth import Principal, get_current_admin_user, get_current_user, get_optional_user
+from app.core.database import get_db, get_read_db
 from app.core.errors import AppError
+from app.core.http_cache import conditional_response, latest, make_etag
+from app.core.pagination import set_next_cursor
 from app.models.models import Post, Profile, User
 from app.schemas.reply import ReplyCreateRequest, ReplyResponse, ReplyUpdateRequest
 from app.services.reply_service import (
@@ -48,10 +50,13 @@ async def _resolve_author_names(db: AsyncSession, author_ids: set[str]) -> dict[
 @router.get("", response_model=list[ReplyResponse])
 async def get_replies(
     post_id: str,
+    request: Request,
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User | None = Depends(get_optional_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    user: Principal | None = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     post_result = await db.execute(select(Post).where(Post.id == post_id))
     post = post_result.scalar_one_or_none()
@@ -60,8 +65,26 @@ async def get_replies(
     if post.status != "published":
         if not user or (user.id != post.author_id and user.role != "admin"):
             raise AppError(code="post_not_found", message="Post not found", status_code=404)
-    replies = await list_replies(db, post_id, limit, offset)
+    replies = await list_replies(db, post_id, limit, offset, cursor=cursor)
+    set_next_cursor(response, replies, limit)
     author_map = await _resolve_author_names(db, {item.author_id for item in replies})
+    not_modified = conditional_response(
+        request,
+        response,
+        make_etag(
+            "replies",
+            post_id,
+            [
+                (item.id, item.updated_at, item.content, item.status, item.helpful_count, author_map.get(item.author_id))
+                for item in replies
+            ],
+        ),
+        latest(*(item.updated_at for item in replies)),
+        [f"post-{post_id}", f"replies-{post_id}"],
+        public=user is None,
+    )
+    if not_modified is not None:
+        return not_modified
     return [
         ReplyResponse(
             id=item.id,
@@ -80,13 +103,16 @@ async def get_replies(
 
 @router.get("/admin", response_model=list[ReplyResponse])
 async def get_all_replies(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     status: str | None = Query(default=None),
-    _: User = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    replies = await list_all_replies(db, limit, offset, status)
+    replies = await list_all_replies(db, limit, offset, status, cursor=cursor)
+    set_next_cursor(response, replies, limit)
     author_map = await _resolve_author_names(db, {item.author_id for item in replies})
     return [
         ReplyResponse(
@@ -106,12 +132,15 @@ async def get_all_replies(
 
 @router.get("/me", response_model=list[ReplyResponse])
 async def get_my_replies(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    replies = await list_user_replies(db, user.id, limit, offset)
+    replies = await list_user_replies(db, user.id, limit, offset, cursor=cursor)
+    set_next_cursor(response, replies, limit)
     author_map = await _resolve_author_names(db, {item.author_id for item in replies})
     return [
         ReplyResponse(
@@ -133,7 +162,7 @@ async def get_my_replies(
 async def create(
     payload: ReplyCreateRequest,
     post_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     reply = await create_reply(db, post_id, user.id, payload, is_admin=user.role == "admin")
@@ -156,7 +185,7 @@ async def create(
 async def update(
     reply_id: str,
     payload: ReplyUpdateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     reply = await update_reply(db, reply_id, user.id, payload)
@@ -178,7 +207,7 @@ async def update(
 @router.delete("/{reply_id}")
 async def remove(
     reply_id: str,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await delete_reply(db, reply_id, user.id)
@@ -188,7 +217,7 @@ async def remove(
 @router.patch("/{reply_id}/hide", response_model=ReplyResponse)
 async def admin_hide(
     reply_id: str,
-    user: User = Depends(get_current_admin_user),
+    user: Principal = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     reply = await admin_hide_reply(db, reply_id)
@@ -210,7 +239,7 @@ async def admin_hide(
 @router.patch("/{reply_id}/restore", response_model=ReplyResponse)
 async def admin_restore(
     reply_id: str,
-    user: User = Depends(get_current_admin_user),
+    user: Principal = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     reply = await admin_restore_reply(db, reply_id)
@@ -232,7 +261,7 @@ async def admin_restore(
 @router.delete("/{reply_id}/admin-delete")
 async def admin_remove(
     reply_id: str,
-    user: User = Depends(get_current_admin_user),
+    user: Principal = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     await admin_delete_reply(db, reply_id)
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_admin_user, get_current_user
-from app.core.database import get_db
-from app.models.models import User
+from app.core.auth import Principal, get_admin_user, get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.pagination import set_next_cursor
 from app.schemas.report import ReportCreateRequest, ReportResolveRequest, ReportResponse
 from app.services.report_service import create_report, list_my_reports, list_reports, resolve_report
 
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/reports", tags=["reports"])
 @router.post("", response_model=ReportResponse)
 async def create(
     payload: ReportCreateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     report = await create_report(
@@ -25,23 +25,29 @@ async def create(
 
 @router.get("/me", response_model=list[ReportResponse])
 async def my_reports(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    reports = await list_my_reports(db, user.id, limit, offset)
+    reports = await list_my_reports(db, user.id, limit, offset, cursor=cursor)
+    set_next_cursor(response, reports, limit)
     return [ReportResponse(**report.__dict__) for report in reports]
 
 
 @router.get("", response_model=list[ReportResponse])
 async def all_reports(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    reports = await list_reports(db, limit, offset)
+    reports = await list_reports(db, limit, offset, cursor=cursor)
+    set_next_cursor(response, reports, limit)
     return [ReportResponse(**report.__dict__) for report in reports]
 
 
@@ -49,7 +55,7 @@ async def all_reports(
 async def resolve(
     report_id: str,
     payload: ReportResolveRequest,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     report = await resolve_report(db, report_id, admin.id, payload.action, payload.note)
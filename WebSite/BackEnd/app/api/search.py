@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.schemas.search import SearchResponse, SuggestionResponse, TrendingResponse
 from app.services.search_service import search_posts, suggest_terms, trending_posts
 
@@ -18,19 +18,23 @@ async def search(
     sort: str = Query(default="newest"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    total_mode: str = Query(default="exact", pattern="^(exact|estimate|none)$"),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    items, total = await search_posts(db, q, language, category_id, tags, sort, limit, offset)
-    return SearchResponse(items=items, total=total)
+    items, total, has_more = await search_posts(
+        db, q, language, category_id, tags, sort, limit, offset, total_mode
+    )
+    return SearchResponse(items=items, total=total, has_more=has_more)
 
 
 @router.get("/suggestions", response_model=SuggestionResponse)
 async def suggestions(
     q: str | None = None,
+    language: str | None = Query(default=None),
     limit: int = Query(default=10, ge=1, le=50),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    items = await suggest_terms(db, q, limit)
+    items = await suggest_terms(db, q, limit, language)
     return SuggestionResponse(items=items)
 
 
@@ -38,7 +42,7 @@ async def suggestions(
 async def trending(
     language: str = Query(default="en"),
     limit: int = Query(default=10, ge=1, le=50),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     items = await trending_posts(db, language, limit)
     return TrendingResponse(items=items)
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_admin_user
-from app.core.database import get_db
+from app.core.auth import Principal, get_admin_user
+from app.core.database import get_db, get_read_db
 from app.core.errors import AppError
-from app.models.models import PostTag, Tag, User
+from app.core.http_cache import conditional_response, make_etag
+from app.models.models import PostTag, Tag
 from app.services.audit_service import log_action
+from app.services.post_service import touch_tagged_posts
 from app.schemas.tag import TagCreateRequest, TagResponse, TagUpdateRequest
 
 
@@ -14,23 +16,28 @@ router = APIRouter(prefix="/tags", tags=["tags"])
 
 
 @router.get("", response_model=list[TagResponse])
-async def list_tags(db: AsyncSession = Depends(get_db)):
+async def list_tags(request: Request, response: Response, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(Tag).order_by(Tag.name.asc()))
-    return [TagResponse(id=tag.id, name=tag.name, slug=tag.slug) for tag in result.scalars().all()]
+    tags = result.scalars().all()
+    etag = make_etag("tags", [(tag.id, tag.name, tag.slug) for tag in tags])
+    not_modified = conditional_response(request, response, etag, surrogate_keys=["tags"])
+    if not_modified is not None:
+        return not_modified
+    return [TagResponse(id=tag.id, name=tag.name, slug=tag.slug) for tag in tags]
 
 
 @router.post("", response_model=TagResponse)
 async def create_tag(
     payload: TagCreateRequest,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     tag = Tag(name=payload.name, slug=payload.slug)
     db.add(tag)
-    await db.commit()
+    await db.flush()
     await db.refresh(tag)
     await log_action(db, admin.id, "tag", tag.id, "tag_create", None)
-    await db.commit()
+    await db.flush()
     return TagResponse(id=tag.id, name=tag.name, slug=tag.slug)
 
 
@@ -38,7 +45,7 @@ async def create_tag(
 async def update_tag(
     tag_id: str,
     payload: TagUpdateRequest,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(select(Tag).where(Tag.id == tag_id))
@@ -50,8 +57,10 @@ async def update_tag(
         raise AppError(code="invalid_request", message="No fields to update", status_code=400)
     for key, value in data.items():
         setattr(tag, key, value)
+    if "slug" in data:
+        await touch_tagged_posts(db, tag.id)
     await log_action(db, admin.id, "tag", tag.id, "tag_update", None)
-    await db.commit()
+    await db.flush()
     await db.refresh(tag)
     return TagResponse(id=tag.id, name=tag.name, slug=tag.slug)
 
@@ -59,16 +68,17 @@ async def update_tag(
 @router.delete("/{tag_id}")
 async def delete_tag(
     tag_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(select(Tag).where(Tag.id == tag_id))
     tag = result.scalar_one_or_none()
     if tag is None:
         raise AppError(code="tag_not_found", message="Tag not found", status_code=404)
+    await touch_tagged_posts(db, tag_id)
     await db.execute(PostTag.__table__.delete().where(PostTag.tag_id == tag_id))
     await log_action(db, admin.id, "tag", tag.id, "tag_delete", None)
     await db.delete(tag)
-    await db.commit()
+    await db.flush()
     return {"status": "ok"}
 
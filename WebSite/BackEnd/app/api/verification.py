@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_admin_user, get_current_user
-from app.core.database import get_db
-from app.models.models import User
+from app.core.auth import Principal, get_admin_user, get_current_user
+from app.core.database import get_db, get_read_db
 from app.schemas.verification import VerificationStatusResponse, VerificationSubmitRequest
 from app.services.verification_service import (
     approve_verification,
@@ -20,7 +19,7 @@ router = APIRouter(prefix="/verification", tags=["verification"])
 @router.post("/submit", response_model=VerificationStatusResponse)
 async def submit(
     payload: VerificationSubmitRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     request = await submit_verification(db, user.id, payload.docs_url)
@@ -29,8 +28,8 @@ async def submit(
 
 @router.get("/status", response_model=VerificationStatusResponse | None)
 async def status(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     request = await get_latest_verification(db, user.id)
     if request is None:
@@ -40,8 +39,8 @@ async def status(
 
 @router.get("/queue")
 async def queue(
-    _: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     items = await list_verification_queue(db)
     return [
@@ -52,7 +51,7 @@ async def queue(
 @router.post("/{request_id}/approve")
 async def approve(
     request_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     await approve_verification(db, request_id, admin.id)
@@ -62,7 +61,7 @@ async def approve(
 @router.post("/{request_id}/reject")
 async def reject(
     request_id: str,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     await reject_verification(db, request_id, admin.id)
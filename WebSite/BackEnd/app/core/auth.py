@@ -1,20 +1,73 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import time
+
 from fastapi import Depends, Header
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_read_db
 from app.core.errors import AppError
 from app.core.security import decode_token
 from app.models.models import User
 
 
-async def get_current_user(
-    authorization: str | None = Header(default=None),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    if not authorization or not authorization.startswith("Bearer "):
-        raise AppError(code="unauthorized", message="Missing token", status_code=401)
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: str
+    email: str
+    role: str
+    status: str
+
+
+_principals: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+_PENDING_KEY = "principal_invalidations"
+
+
+def _cached_principal(user_id: str) -> Principal | None:
+    entry = _principals.get(user_id)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        _principals.pop(user_id, None)
+        return None
+    _principals.move_to_end(user_id)
+    return entry[1]
+
+
+def _store_principal(principal: Principal) -> None:
+    if settings.principal_cache_seconds <= 0:
+        return
+    _principals[principal.id] = (time.monotonic() + settings.principal_cache_seconds, principal)
+    _principals.move_to_end(principal.id)
+    while len(_principals) > settings.principal_cache_size:
+        _principals.popitem(last=False)
+
+
+def invalidate_principal(db: AsyncSession, user_id: str) -> None:
+    # Drop now, and again after commit so a request that read the old row meanwhile cannot re-cache it.
+    _principals.pop(user_id, None)
+    db.sync_session.info.setdefault(_PENDING_KEY, set()).add(user_id)
+
+
+def _invalidate_committed(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        _principals.pop(user_id, None)
+
+
+def _discard_invalidations(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_principal_invalidation() -> None:
+    if not event.contains(Session, "after_commit", _invalidate_committed):
+        event.listen(Session, "after_commit", _invalidate_committed)
+        event.listen(Session, "after_soft_rollback", _discard_invalidations)
+
+
+async def _load_principal(db: AsyncSession, authorization: str) -> Principal:
     token = authorization.split(" ", 1)[1]
     try:
         payload = decode_token(token)
@@ -23,51 +76,53 @@ async def get_current_user(
     user_id = payload.get("sub")
     if not user_id:
         raise AppError(code="invalid_token", message="Invalid token", status_code=401)
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if user is None:
-        raise AppError(code="unauthorized", message="User not found", status_code=401)
-    if user.status == "banned":
+    principal = _cached_principal(user_id)
+    if principal is None:
+        stmt = select(User.id, User.email, User.role, User.status).where(User.id == user_id)
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None and db.info.get("read_only"):
+            # A replica may not have the account yet (e.g. right after registration).
+            async with SessionLocal() as primary:
+                row = (await primary.execute(stmt)).one_or_none()
+        if row is None:
+            raise AppError(code="unauthorized", message="User not found", status_code=401)
+        principal = Principal(*row)
+        _store_principal(principal)
+    if principal.status == "banned":
         raise AppError(code="user_banned", message="User is banned", status_code=403)
-    return user
+    return principal
+
+
+async def get_current_user(
+    authorization: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_read_db),
+) -> Principal:
+    if not authorization or not authorization.startswith("Bearer "):
+        raise AppError(code="unauthorized", message="Missing token", status_code=401)
+    return await _load_principal(db, authorization)
 
 
 async def get_optional_user(
     authorization: str | None = Header(default=None),
-    db: AsyncSession = Depends(get_db),
-) -> User | None:
+    db: AsyncSession = Depends(get_read_db),
+) -> Principal | None:
     if not authorization or not authorization.startswith("Bearer "):
         return None
-    token = authorization.split(" ", 1)[1]
-    try:
-        payload = decode_token(token)
-    except ValueError as exc:
-        raise AppError(code="invalid_token", message="Invalid token", status_code=401) from exc
-    user_id = payload.get("sub")
-    if not user_id:
-        raise AppError(code="invalid_token", message="Invalid token", status_code=401)
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if user is None:
-        raise AppError(code="unauthorized", message="User not found", status_code=401)
-    if user.status == "banned":
-        raise AppError(code="user_banned", message="User is banned", status_code=403)
-    return user
+    return await _load_principal(db, authorization)
 
 
-async def get_admin_user(user: User = Depends(get_current_user)) -> User:
+async def get_admin_user(user: Principal = Depends(get_current_user)) -> Principal:
     if user.role != "admin":
         raise AppError(code="forbidden", message="Admin only", status_code=403)
     return user
 
 
-async def get_current_admin_user(user: User = Depends(get_current_user)) -> User:
+async def get_current_admin_user(user: Principal = Depends(get_current_user)) -> Principal:
     return await get_admin_user(user)
 
 
-async def get_root_admin_user(user: User = Depends(get_current_user)) -> User:
+async def get_root_admin_user(user: Principal = Depends(get_current_user)) -> Principal:
     await get_admin_user(user)
     if not settings.root_account or user.email != settings.root_account:
         raise AppError(code="forbidden", message="Root admin only", status_code=403)
     return user
-
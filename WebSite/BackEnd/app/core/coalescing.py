@@ -0,0 +1,131 @@
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable
+
+
+logger = logging.getLogger(__name__)
+
+FlushCallback = Callable[[dict[Hashable, float], list[Any]], Awaitable[None]]
+
+
+# Sums numeric deltas per key and queues items, handing both to `flush` every interval or max events.
+class CoalescingBuffer:
+    def __init__(
+        self, name: str, flush: FlushCallback, interval_ms: int, max_events: int, max_attempts: int = 10
+    ) -> None:
+        self.name = name
+        self._flush = flush
+        self._interval = interval_ms / 1000
+        self._max_events = max_events
+        self._max_attempts = max_attempts
+        self._failures = 0
+        self._attempts: dict[Hashable, int] = {}
+        self._deltas: dict[Hashable, float] = {}
+        self._items: list[Any] = []
+        self._events = 0
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def add(self, key: Hashable, delta: float) -> None:
+        self._deltas[key] = self._deltas.get(key, 0) + delta
+        self._note_event()
+
+    def append(self, item: Any) -> None:
+        self._items.append(item)
+        self._note_event()
+
+    def _note_event(self) -> None:
+        self._events += 1
+        if self._events >= self._max_events:
+            self._wake.set()
+
+    def pending(self, key: Hashable) -> bool:
+        return bool(self._deltas.get(key))
+
+    async def flush(self) -> None:
+        async with self._lock:
+            await self._flush_locked()
+
+    @asynccontextmanager
+    async def held(self) -> AsyncIterator[None]:
+        # Applies everything queued so far, then holds later flushes until the block exits.
+        async with self._lock:
+            await self._flush_locked()
+            yield
+
+    async def _flush_locked(self) -> None:
+        if not self._events:
+            return
+        deltas, items = self._deltas, self._items
+        self._deltas, self._items, self._events = {}, [], 0
+        if self._failures >= self._max_attempts or self._attempts:
+            await self._flush_each(deltas, items)
+            return
+        try:
+            await self._flush(deltas, items)
+        except Exception:
+            self._failures += 1
+            logger.exception("Flushing %s buffer failed; re-queued %s deltas", self.name, len(deltas))
+            self._requeue(deltas, items)
+        else:
+            self._failures = 0
+
+    async def _flush_each(self, deltas: dict[Hashable, float], items: list[Any]) -> None:
+        # The batch keeps failing: apply entries one at a time so a single bad one cannot hold back the
+        # rest, and drop an entry once it has failed on its own max_attempts times.
+        failed = False
+        entries = [(("delta", key), {key: delta}, []) for key, delta in deltas.items()]
+        entries += [(("item", repr(item)), {}, [item]) for item in items]
+        for marker, entry_deltas, entry_items in entries:
+            try:
+                await self._flush(entry_deltas, entry_items)
+            except Exception:
+                failed = True
+                attempts = self._attempts.get(marker, 0) + 1
+                if attempts >= self._max_attempts:
+                    self._attempts.pop(marker, None)
+                    logger.exception("Dropped %s buffer entry %r after %s attempts", self.name, marker, attempts)
+                else:
+                    self._attempts[marker] = attempts
+                    self._requeue(entry_deltas, entry_items)
+            else:
+                self._attempts.pop(marker, None)
+        if not failed:
+            self._failures = 0
+
+    def _requeue(self, deltas: dict[Hashable, float], items: list[Any]) -> None:
+        for key, delta in deltas.items():
+            self._deltas[key] = self._deltas.get(key, 0) + delta
+        self._items[:0] = items
+        self._events += len(deltas) + len(items)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None and self._interval > 0:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # Let an in-progress flush finish, then drain whatever arrived meanwhile.
+        self._stopping = True
+        self._wake.set()
+        await self._task
+        self._task = None
+        await self.flush()
@@ -16,14 +16,84 @@ class Settings(BaseSettings):
     api_prefix: str = "/api"
     cors_origins: str = "*"
     database_url: str = "sqlite+aiosqlite:///./bridgeus.db"
+    database_read_urls: str = ""
+    read_replica_health_seconds: float = 10
+    read_replica_health_timeout_seconds: float = 2
+    # A user who just wrote reads from the primary for this long, covering replica lag.
+    read_your_writes_seconds: float = 5
+    db_pool_size: int = 5
+    db_pool_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30
+    # Connections are replaced after this age instead of being pinged on every checkout.
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = False
+    db_pool_slow_checkout_ms: float = 100
+    # "throughput" turns on WAL/pragmas, a read-only pool for GETs and a single queued writer (file SQLite only).
+    sqlite_profile: str = "default"
+    sqlite_read_pool_size: int = 8
+    sqlite_writer_timeout_seconds: float = 30
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size_bytes: int = 268435456
+    sqlite_foreign_keys: bool = True
     jwt_secret: str = "change-this-secret"
     jwt_algorithm: str = "HS256"
+    jwt_verifier: str = "jose"
+    token_cache_size: int = 4096
     access_token_minutes: int = 30
     refresh_token_days: int = 14
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536
+    argon2_parallelism: int = 4
+    password_hash_workers: int = 4
+    password_hash_queue_limit: int = 64
+    principal_cache_seconds: int = 30
+    principal_cache_size: int = 10000
     openai_api_key: str | None = None
     openai_model: str = "gpt-4o-mini"
     openai_timeout_seconds: int = 45
     supported_languages: str = "en,zh,ko,vi,ne"
+    search_engine: str = "database"
+    search_index_snapshot_path: str | None = "search_index.snapshot"
+    search_count_cache_seconds: int = 30
+    search_catch_up_seconds: int = 15
+    post_cache_size: int = 5000
+    post_cache_max_bytes: int = 67108864
+    singleflight_timeout_seconds: float = 10
+    http_cache_control: str = "public, max-age=0, s-maxage=60, stale-while-revalidate=30"
+    http_surrogate_key_header: str = "Surrogate-Key"
+    trending_half_life_hours: float = 72
+    trending_refresh_seconds: int = 600
+    post_view_flush_ms: int = 2000
+    post_view_max_events: int = 500
+    post_view_dedupe_seconds: int = 1800
+    post_view_dedupe_size: int = 100000
+    suggestion_index_enabled: bool = True
+    suggestion_rebuild_seconds: int = 900
+    counter_reconcile_seconds: int = 3600
+    # Reconciliation only sees the vote buffer of its own process. Keep it on in exactly one API process, and
+    # set VOTE_BUFFER_FLUSH_MS=0 on the others, or their buffered deltas can be counted twice.
+    counter_reconcile_in_api: bool = True
+    counter_reconcile_batch_size: int = 500
+    vote_buffer_flush_ms: int = 250
+    vote_buffer_max_events: int = 500
+    translation_demand_flush_ms: int = 1000
+    translation_demand_max_events: int = 200
+    translation_worker_concurrency: int = 4
+    translation_worker_embedded_loops: int = 0
+    translation_worker_poll_seconds: float = 5
+    translation_worker_drain_seconds: float = 60
+    translation_lease_seconds: int = 120
+    translation_lease_heartbeat_seconds: int = 30
+    translation_claim_attempts: int = 5
+    translation_batch_max_languages: int = 4
+    translation_chunk_tokens: int = 2000
+    translation_chunk_parallelism: int = 4
+    translation_chunk_attempts: int = 2
+    translation_memory_enabled: bool = True
+    translation_memory_ttl_days: int = 180
+    translation_memory_max_entries: int = 500000
+    translation_memory_prune_seconds: int = 3600
     moderation_review_threshold: int = 60
     moderation_reject_threshold: int = 85
     email_code_expire_minutes: int = 10
@@ -1,12 +1,248 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+from contextlib import asynccontextmanager
+from itertools import count
+import logging
+import math
+import time
+
+from fastapi import Header
+from sqlalchemy import event, exc, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.core.periodic import start_periodic
+
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = {
+            "checkouts": 0,
+            "slow_checkouts": 0,
+            "timeouts": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+        }
+
+    # Times every checkout, including waits for a free connection and opening new ones.
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise
+        waited_ms = (time.perf_counter() - started) * 1000
+        self.stats["checkouts"] += 1
+        self.stats["wait_ms_total"] += waited_ms
+        self.stats["wait_ms_max"] = max(self.stats["wait_ms_max"], waited_ms)
+        if waited_ms >= settings.db_pool_slow_checkout_ms:
+            self.stats["slow_checkouts"] += 1
+        return connection
+
+
+def _is_sqlite_file(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def _engine_options(database_url: str) -> dict:
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and not _is_sqlite_file(database_url):
+        return options
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_pool_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+    )
+    return options
+
 
-engine = create_async_engine(settings.database_url, pool_pre_ping=True)
+def _sqlite_pragmas(read_only: bool):
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size_bytes}",
+        f"PRAGMA foreign_keys={'ON' if settings.sqlite_foreign_keys else 'OFF'}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+
+    def _on_connect(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return _on_connect
+
+
+def _sqlite_functions(dbapi_connection, _connection_record) -> None:
+    # Trending scores decay with exp(); SQLite builds without the math extension get a Python fallback.
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SELECT exp(0)")
+    except Exception:
+        dbapi_connection.create_function("exp", 1, math.exp, deterministic=True)
+    finally:
+        cursor.close()
+
+
+def create_engines(database_url: str, sqlite_profile: str = "default") -> tuple[AsyncEngine, AsyncEngine]:
+    options = _engine_options(database_url)
+    if sqlite_profile != "throughput" or not _is_sqlite_file(database_url):
+        engine = create_async_engine(database_url, **options)
+        if engine.dialect.name == "sqlite":
+            event.listen(engine.sync_engine, "connect", _sqlite_functions)
+        return engine, engine
+    # SQLite allows one writer at a time: a one-connection pool makes writers queue for it instead of
+    # failing with "database is locked", while WAL lets the read-only pool keep serving GETs meanwhile.
+    writer = create_async_engine(
+        database_url,
+        **{**options, "pool_size": 1, "max_overflow": 0, "pool_timeout": settings.sqlite_writer_timeout_seconds},
+    )
+    reader = create_async_engine(
+        database_url, **{**options, "pool_size": settings.sqlite_read_pool_size, "max_overflow": 0}
+    )
+    event.listen(writer.sync_engine, "connect", _sqlite_pragmas(read_only=False))
+    event.listen(reader.sync_engine, "connect", _sqlite_pragmas(read_only=True))
+    event.listen(writer.sync_engine, "connect", _sqlite_functions)
+    event.listen(reader.sync_engine, "connect", _sqlite_functions)
+    return writer, reader
+
+
+engine, _sqlite_read_engine = create_engines(settings.database_url, settings.sqlite_profile)
+replica_engines = [
+    create_async_engine(url, **_engine_options(url))
+    for url in (item.strip() for item in settings.database_read_urls.split(","))
+    if url
+]
+read_engines = replica_engines or ([_sqlite_read_engine] if _sqlite_read_engine is not engine else [])
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+ReadSessionLocal = async_sessionmaker(expire_on_commit=False, class_=AsyncSession)
 
+_read_healthy = [True] * len(read_engines)
+_read_turn = count()
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+# Read-your-writes travels with the client: a write response carries the time until which that client's
+# reads go to the primary, and the client sends it back, so the pin holds whichever process serves it.
+PRIMARY_UNTIL_HEADER = "X-Primary-Until"
 
-async def get_db():
+
+def pool_metrics(target: AsyncEngine | None = None) -> dict:
+    pool = (target or engine).sync_engine.pool
+    metrics = {"pool": type(pool).__name__}
+    if target in read_engines:
+        metrics["healthy"] = _read_healthy[read_engines.index(target)]
+    if isinstance(pool, InstrumentedQueuePool):
+        checkouts = pool.stats["checkouts"]
+        metrics.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            in_use=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            wait_ms_avg=round(pool.stats["wait_ms_total"] / checkouts, 3) if checkouts else 0.0,
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in pool.stats.items()},
+        )
+    return metrics
+
+
+@asynccontextmanager
+async def unit_of_work():
+    # Services stage changes with flush(); the boundary commits once, or rolls back on any error.
     async with SessionLocal() as session:
+        try:
+            yield session
+        except BaseException:
+            await session.rollback()
+            raise
+        await session.commit()
+
+
+async def commit_now(db: AsyncSession) -> None:
+    # Escape hatch for work that must be durable before a slow call (AI, email) or before raising.
+    await db.commit()
+
+
+def primary_pin(method: str) -> str | None:
+    if not replica_engines or method in _SAFE_METHODS:
+        return None
+    return f"{time.time() + settings.read_your_writes_seconds:.3f}"
+
+
+def _pinned_to_primary(primary_until: str | None) -> bool:
+    if not primary_until:
+        return False
+    try:
+        until = float(primary_until)
+    except ValueError:
+        return False
+    now = time.time()
+    # Values further out than one window were not issued by us and are ignored.
+    return now < until <= now + settings.read_your_writes_seconds
+
+
+def _next_read_engine() -> AsyncEngine | None:
+    healthy = [target for target, ok in zip(read_engines, _read_healthy) if ok]
+    if not healthy:
+        return None
+    return healthy[next(_read_turn) % len(healthy)]
+
+
+def _mark_read_engine(target: AsyncEngine, healthy: bool) -> None:
+    index = read_engines.index(target)
+    if _read_healthy[index] != healthy:
+        logger.warning("Read database %s is %s", target.url.render_as_string(), "back" if healthy else "down")
+    _read_healthy[index] = healthy
+
+
+async def check_read_engines() -> None:
+    for target in read_engines:
+        try:
+            async with asyncio.timeout(settings.read_replica_health_timeout_seconds):
+                async with target.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except Exception:
+            _mark_read_engine(target, False)
+        else:
+            _mark_read_engine(target, True)
+
+
+def start_read_replica_checks() -> None:
+    if replica_engines:
+        start_periodic("read_replica_health", settings.read_replica_health_seconds, check_read_engines)
+
+
+async def get_db():
+    async with unit_of_work() as session:
         yield session
 
+
+async def _get_read_only_db(x_primary_until: str | None = Header(default=None)):
+    # Read sessions never commit; info["read_only"] lets services route unavoidable writes elsewhere.
+    target = None if _pinned_to_primary(x_primary_until) else _next_read_engine()
+    async with ReadSessionLocal(bind=target or engine) as session:
+        session.info["read_only"] = True
+        try:
+            yield session
+        except exc.DBAPIError as error:
+            if target is not None and error.connection_invalidated:
+                _mark_read_engine(target, False)
+            raise
+
+
+# Without read databases, reads share the request's session (FastAPI caches the dependency).
+get_read_db = _get_read_only_db if read_engines else get_db
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import hashlib
+from typing import Iterable
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def latest(*values: datetime | None) -> datetime | None:
+    stamps = [_as_utc(value) for value in values if value is not None]
+    return max(stamps) if stamps else None
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/"x" still matches our strong "x".
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return etag in candidates
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    return last_modified.replace(microsecond=0) <= _as_utc(since)
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+    surrogate_keys: Iterable[str] = (),
+    public: bool = True,
+) -> Response | None:
+    response.headers["ETag"] = etag
+    response.headers["Vary"] = "Authorization"
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    if public and settings.http_cache_control:
+        response.headers["Cache-Control"] = settings.http_cache_control
+        keys = " ".join(dict.fromkeys(surrogate_keys))
+        if keys and settings.http_surrogate_key_header:
+            response.headers[settings.http_surrogate_key_header] = keys
+    else:
+        response.headers["Cache-Control"] = PRIVATE_CACHE_CONTROL
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        fresh = bool(if_modified_since and last_modified and _not_modified_since(if_modified_since, last_modified))
+    if not fresh:
+        return None
+    # A returned Response bypasses FastAPI's header merge, so carry the validators over explicitly.
+    return Response(status_code=304, headers=dict(response.headers))
@@ -4,6 +4,8 @@ import uuid
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.database import PRIMARY_UNTIL_HEADER, primary_pin
+
 
 class RequestIdMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
@@ -21,3 +23,12 @@ class ProcessTimeMiddleware(BaseHTTPMiddleware):
         response.headers["X-Process-Time"] = f"{time.perf_counter() - start:.6f}"
         return response
 
+
+
+class PrimaryPinMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        pin = primary_pin(request.method) if response.status_code < 400 else None
+        if pin:
+            response.headers[PRIMARY_UNTIL_HEADER] = pin
+        return response
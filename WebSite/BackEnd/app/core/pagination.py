@@ -0,0 +1,59 @@
+import base64
+from datetime import datetime
+import json
+
+from fastapi import Response
+from sqlalchemy import DateTime, and_, literal, or_
+from sqlalchemy.dialects import sqlite
+
+from app.core.errors import AppError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# SQLite stores server_default timestamps as "YYYY-MM-DD HH:MM:SS"; binding the cursor in the same
+# text format keeps string comparison on created_at consistent with the stored values.
+_CURSOR_TIME = DateTime(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(item_id)
+    except Exception as exc:
+        raise AppError(code="invalid_cursor", message="Invalid cursor", status_code=400) from exc
+
+
+def paginate(stmt, created_column, id_column, limit: int, offset: int, cursor: str | None, ascending: bool = False):
+    if ascending:
+        stmt = stmt.order_by(created_column.asc(), id_column.asc())
+    else:
+        stmt = stmt.order_by(created_column.desc(), id_column.desc())
+    if not cursor:
+        return stmt.limit(limit).offset(offset)
+
+    created_at, item_id = decode_cursor(cursor)
+    boundary = literal(created_at, _CURSOR_TIME)
+    if ascending:
+        after = or_(created_column > boundary, and_(created_column == boundary, id_column > item_id))
+    else:
+        after = or_(created_column < boundary, and_(created_column == boundary, id_column < item_id))
+    return stmt.where(after).limit(limit)
+
+
+def set_next_cursor(response: Response, items: list, limit: int) -> None:
+    if not items or len(items) < limit:
+        return
+    last = items[-1]
+    if isinstance(last, dict):
+        created_at, item_id = last.get("created_at"), last.get("id")
+    else:
+        created_at, item_id = last.created_at, last.id
+    if created_at is None or item_id is None:
+        return
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(created_at, item_id)
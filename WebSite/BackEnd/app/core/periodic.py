@@ -0,0 +1,35 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+
+logger = logging.getLogger(__name__)
+
+_tasks: dict[str, asyncio.Task] = {}
+
+
+async def _run_every(name: str, interval_seconds: float, job: Callable[[], Awaitable[None]]) -> None:
+    while True:
+        try:
+            await job()
+        except Exception:
+            logger.exception("Periodic job %s failed", name)
+        await asyncio.sleep(interval_seconds)
+
+
+def start_periodic(name: str, interval_seconds: float, job: Callable[[], Awaitable[None]]) -> None:
+    if interval_seconds <= 0 or name in _tasks:
+        return
+    _tasks[name] = asyncio.create_task(_run_every(name, interval_seconds, job))
+
+
+async def stop_periodic() -> None:
+    tasks = list(_tasks.values())
+    _tasks.clear()
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
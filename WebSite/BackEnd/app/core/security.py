@@ -1,22 +1,63 @@
+import asyncio
+import base64
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
+import hmac
+import json
 from datetime import datetime, timedelta, timezone
+import time
 import uuid
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.errors import AppError
+
+# Hashes made with other parameters still verify; needs_update() flags them for a rehash on login.
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__time_cost=settings.argon2_time_cost,
+    argon2__memory_cost=settings.argon2_memory_cost,
+    argon2__parallelism=settings.argon2_parallelism,
+)
+# argon2-cffi releases the GIL, so a small thread pool keeps hashing off the event loop.
+_hash_executor: ThreadPoolExecutor | None = None
+_hash_pending = 0
+
+
+async def _run_hashing(fn, *args):
+    global _hash_executor, _hash_pending
+    if _hash_pending >= settings.password_hash_workers + settings.password_hash_queue_limit:
+        raise AppError(code="auth_busy", message="Too many requests, try again shortly", status_code=503)
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers, thread_name_prefix="password-hash"
+        )
+    _hash_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+    finally:
+        _hash_pending -= 1
+
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+async def hash_password_async(password: str) -> str:
+    return await _run_hashing(pwd_context.hash, password)
 
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def verify_password_async(password: str, password_hash: str) -> tuple[bool, str | None]:
+    # Returns (valid, replacement hash when the stored one uses outdated parameters).
+    return await _run_hashing(pwd_context.verify_and_update, password, password_hash)
 
 
-def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password, password_hash)
+def shutdown_password_hashing() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=True)
+        _hash_executor = None
 
 
 def hash_token(token: str) -> str:
@@ -44,9 +85,65 @@ def create_refresh_token(subject: str) -> str:
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
-def decode_token(token: str) -> Dict[str, Any]:
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_verified_tokens: OrderedDict[bytes, tuple[float, Dict[str, Any]]] = OrderedDict()
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _jose_verify(token: str) -> Dict[str, Any]:
     try:
         return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
     except JWTError as exc:
         raise ValueError("invalid_token") from exc
 
+
+def _hmac_verify(token: str) -> Dict[str, Any]:
+    # Same checks python-jose applies to our tokens (alg, signature, exp, nbf, iat), without its generic machinery.
+    digest = _HMAC_DIGESTS.get(settings.jwt_algorithm)
+    if digest is None:
+        return _jose_verify(token)
+    try:
+        signing_input, signature = token.rsplit(".", 1)
+        header_segment, payload_segment = signing_input.split(".")
+        header = json.loads(_b64decode(header_segment))
+        expected = hmac.new(settings.jwt_secret.encode("utf-8"), signing_input.encode("ascii"), digest).digest()
+        if header.get("alg") != settings.jwt_algorithm or not hmac.compare_digest(expected, _b64decode(signature)):
+            raise ValueError("invalid_token")
+        claims = json.loads(_b64decode(payload_segment))
+    except (ValueError, TypeError, UnicodeError) as exc:
+        raise ValueError("invalid_token") from exc
+    if not isinstance(claims, dict):
+        raise ValueError("invalid_token")
+    now = time.time()
+    for name in ("exp", "nbf", "iat"):
+        if name in claims and not isinstance(claims[name], (int, float)):
+            raise ValueError("invalid_token")
+    if "exp" in claims and claims["exp"] < now:
+        raise ValueError("invalid_token")
+    if "nbf" in claims and claims["nbf"] > now:
+        raise ValueError("invalid_token")
+    return claims
+
+
+TOKEN_VERIFIERS: Dict[str, Callable[[str], Dict[str, Any]]] = {"jose": _jose_verify, "hmac": _hmac_verify}
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = _verified_tokens.get(key)
+    if cached is not None:
+        if cached[0] > time.time():
+            _verified_tokens.move_to_end(key)
+            return dict(cached[1])
+        _verified_tokens.pop(key, None)
+    claims = TOKEN_VERIFIERS[settings.jwt_verifier](token)
+    expires = claims.get("exp")
+    if settings.token_cache_size > 0 and isinstance(expires, (int, float)):
+        _verified_tokens[key] = (float(expires), dict(claims))
+        while len(_verified_tokens) > settings.token_cache_size:
+            _verified_tokens.popitem(last=False)
+    return claims
+
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from app.core.config import settings
+
+
+T = TypeVar("T")
+
+flight_groups: dict[str, "SingleFlight"] = {}
+
+
+class _LeaderCancelled(Exception):
+    pass
+
+
+# Concurrent calls with the same key share one in-flight `fn()`; its result or exception goes to every waiter.
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.stats = {"leaders": 0, "shared": 0, "timeouts": 0, "errors": 0}
+        flight_groups[name] = self
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                return await self._lead(key, fn)
+            self.stats["shared"] += 1
+            timeout = settings.singleflight_timeout_seconds
+            done, _ = await asyncio.wait({future}, timeout=timeout if timeout > 0 else None)
+            if not done:
+                # A stuck leader should not hold every follower hostage; fall back to computing independently.
+                self.stats["timeouts"] += 1
+                return await fn()
+            try:
+                return future.result()
+            except _LeaderCancelled:
+                continue
+
+    async def _lead(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.stats["leaders"] += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # The leader's request went away; waiters retry and one of them takes over.
+            self._settle(future, _LeaderCancelled())
+            raise
+        except Exception as exc:
+            self.stats["errors"] += 1
+            self._settle(future, exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    @staticmethod
+    def _settle(future: asyncio.Future, exc: BaseException) -> None:
+        future.set_exception(exc)
+        # Mark retrieved so an error nobody else waited on is not reported as "never retrieved".
+        future.exception()
+
+    def metrics(self) -> dict:
+        return {"in_flight": self.in_flight, **self.stats}
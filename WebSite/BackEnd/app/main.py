@@ -21,13 +21,38 @@ from app.api.tags import router as tags_router
 from app.api.verification import router as verification_router
 from app.api.admin import router as admin_router
 from app.api.files import router as files_router
+from app.core.auth import register_principal_invalidation
 from app.core.config import settings
-from app.core.database import SessionLocal
+from app.core.database import (
+    PRIMARY_UNTIL_HEADER,
+    SessionLocal,
+    engine,
+    replica_engines,
+    start_read_replica_checks,
+    unit_of_work,
+)
 from app.core.errors import AppError, app_error_handler, http_exception_handler
 from app.core.logging import setup_logging
-from app.core.middleware import ProcessTimeMiddleware, RequestIdMiddleware
+from app.core.middleware import PrimaryPinMiddleware, ProcessTimeMiddleware, RequestIdMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.periodic import stop_periodic
+from app.core.security import shutdown_password_hashing
 from app.services.auth_service import ensure_root_admin
 from app.services.category_service import ensure_default_categories
+from app.services.fulltext_service import init_fulltext_backend, register_fulltext_sync
+from app.services.post_cache_service import register_post_cache_invalidation
+from app.services.interaction_service import start_counter_reconciliation, vote_buffer
+from app.services.post_translation_service import translation_demand
+from app.services.search_index_service import (
+    load_search_index,
+    register_search_index_sync,
+    save_search_index,
+    start_search_index_catch_up,
+)
+from app.services.suggestion_service import register_suggestion_sync, start_suggestion_refresh
+from app.services.trending_service import start_trending_refresh, view_buffer
+from app.services.translation_memory_service import start_translation_memory_pruning
+from app.workers.translation import start_embedded_worker, stop_embedded_worker
 
 
 def create_app() -> FastAPI:
@@ -36,24 +61,61 @@ def create_app() -> FastAPI:
 
     app.add_middleware(RequestIdMiddleware)
     app.add_middleware(ProcessTimeMiddleware)
+    if replica_engines:
+        app.add_middleware(PrimaryPinMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins.split(","),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, PRIMARY_UNTIL_HEADER],
     )
 
     app.add_exception_handler(AppError, app_error_handler)
     app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 
     os.makedirs(settings.uploads_dir, exist_ok=True)
+    register_principal_invalidation()
+    register_post_cache_invalidation()
+    register_fulltext_sync()
+    if settings.search_engine == "memory":
+        register_search_index_sync()
+    if settings.suggestion_index_enabled:
+        register_suggestion_sync()
 
     @app.on_event("startup")
     async def _ensure_root_admin() -> None:
-        async with SessionLocal() as session:
+        async with unit_of_work() as session:
             await ensure_root_admin(session)
             await ensure_default_categories(session)
+        await init_fulltext_backend(engine)
+        if settings.search_engine == "memory":
+            async with SessionLocal() as session:
+                await load_search_index(session, settings.search_index_snapshot_path)
+            start_search_index_catch_up()
+        start_read_replica_checks()
+        start_trending_refresh()
+        if settings.counter_reconcile_in_api:
+            start_counter_reconciliation()
+        vote_buffer.start()
+        view_buffer.start()
+        translation_demand.start()
+        await start_embedded_worker()
+        start_translation_memory_pruning()
+        if settings.suggestion_index_enabled:
+            start_suggestion_refresh()
+
+    @app.on_event("shutdown")
+    async def _shutdown() -> None:
+        await vote_buffer.stop()
+        await view_buffer.stop()
+        await translation_demand.stop()
+        await stop_embedded_worker()
+        await stop_periodic()
+        shutdown_password_hashing()
+        if settings.search_engine == "memory":
+            save_search_index(settings.search_index_snapshot_path)
 
     app.include_router(health_router, prefix=settings.api_prefix)
     app.include_router(auth_router, prefix=settings.api_prefix)
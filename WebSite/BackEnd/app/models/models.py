@@ -9,11 +9,13 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 
 from app.models.base import Base
@@ -39,6 +41,10 @@ class User(Base):
 
 class UserSession(Base):
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        Index("ix_user_sessions_refresh_token_hash", "refresh_token_hash"),
+        Index("ix_user_sessions_user_id", "user_id"),
+    )
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -52,6 +58,7 @@ class UserSession(Base):
 
 class EmailVerificationCode(Base):
     __tablename__ = "email_verification_codes"
+    __table_args__ = (Index("ix_email_verification_codes_email_purpose", "email", "purpose", "created_at"),)
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     email = Column(String(255), nullable=False)
@@ -85,8 +92,11 @@ class Profile(Base):
     credibility_score = Column(Integer, default=0, nullable=False)
     helpfulness_score = Column(Integer, default=0, nullable=False)
     accuracy_score = Column(Integer, default=0, nullable=False)
+    accuracy_sum = Column(Integer, default=0, nullable=False)
+    accuracy_count = Column(Integer, default=0, nullable=False)
     badges = Column(JSON, nullable=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    version = Column(Integer, default=1, server_default=text("1"), nullable=False, onupdate=text("version + 1"))
 
 
 class File(Base):
@@ -134,6 +144,10 @@ class Tag(Base):
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_status_created_at", "status", "created_at"),
+        Index("ix_posts_author_id_created_at", "author_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     author_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -142,10 +156,14 @@ class Post(Base):
     status = Column(String(32), default="draft", nullable=False)
     helpful_count = Column(Integer, default=0, nullable=False)
     accuracy_avg = Column(Float, default=0, nullable=False)
+    accuracy_sum = Column(Integer, default=0, nullable=False)
     accuracy_count = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     published_at = Column(DateTime(timezone=True), nullable=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Bumped by every UPDATE, including Core statements; validators and caches key on it because
+    # updated_at has one-second resolution on SQLite.
+    version = Column(Integer, default=1, server_default=text("1"), nullable=False, onupdate=text("version + 1"))
 
 
 class PostTranslation(Base):
@@ -163,10 +181,15 @@ class PostTranslation(Base):
     status = Column(String(32), default="ready", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    version = Column(Integer, default=1, server_default=text("1"), nullable=False, onupdate=text("version + 1"))
 
 
 class Reply(Base):
     __tablename__ = "replies"
+    __table_args__ = (
+        Index("ix_replies_post_id_status_created_at", "post_id", "status", "created_at"),
+        Index("ix_replies_author_id_created_at", "author_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     post_id = Column(String(36), ForeignKey("posts.id"), nullable=False)
@@ -193,6 +216,7 @@ class ReplyTranslation(Base):
 
 class PostTag(Base):
     __tablename__ = "post_tags"
+    __table_args__ = (Index("ix_post_tags_tag_id", "tag_id"),)
 
     post_id = Column(String(36), ForeignKey("posts.id"), primary_key=True)
     tag_id = Column(String(36), ForeignKey("tags.id"), primary_key=True)
@@ -200,7 +224,11 @@ class PostTag(Base):
 
 class HelpfulnessVote(Base):
     __tablename__ = "helpfulness_votes"
-    __table_args__ = (UniqueConstraint("user_id", "target_type", "target_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "target_type", "target_id"),
+        Index("ix_helpfulness_votes_target", "target_type", "target_id"),
+        Index("ix_helpfulness_votes_created_at", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -211,7 +239,11 @@ class HelpfulnessVote(Base):
 
 class AccuracyFeedback(Base):
     __tablename__ = "accuracy_feedbacks"
-    __table_args__ = (UniqueConstraint("user_id", "post_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "post_id"),
+        Index("ix_accuracy_feedbacks_post_id", "post_id"),
+        Index("ix_accuracy_feedbacks_created_at", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -223,6 +255,7 @@ class AccuracyFeedback(Base):
 
 class PostView(Base):
     __tablename__ = "post_views"
+    __table_args__ = (Index("ix_post_views_created_at", "created_at"),)
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     post_id = Column(String(36), ForeignKey("posts.id"), nullable=False)
@@ -231,6 +264,15 @@ class PostView(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+class PostTrendingScore(Base):
+    __tablename__ = "post_trending_scores"
+    __table_args__ = (Index("ix_post_trending_scores_score", "score"),)
+
+    post_id = Column(String(36), ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(Float, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
 class SavedPost(Base):
     __tablename__ = "saved_posts"
 
@@ -241,6 +283,10 @@ class SavedPost(Base):
 
 class Report(Base):
     __tablename__ = "reports"
+    __table_args__ = (
+        Index("ix_reports_created_at", "created_at"),
+        Index("ix_reports_reporter_id_created_at", "reporter_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     reporter_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -256,6 +302,7 @@ class Report(Base):
 
 class ModerationAction(Base):
     __tablename__ = "moderation_actions"
+    __table_args__ = (Index("ix_moderation_actions_created_at", "created_at"),)
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     moderator_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -268,6 +315,11 @@ class ModerationAction(Base):
 
 class ModerationLog(Base):
     __tablename__ = "moderation_logs"
+    __table_args__ = (
+        Index("ix_moderation_logs_created_at", "created_at"),
+        Index("ix_moderation_logs_user_id_created_at", "user_id", "created_at"),
+        Index("ix_moderation_logs_target", "target_type", "target_id"),
+    )
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     target_type = Column(String(16), nullable=False)
@@ -296,6 +348,17 @@ class Appeal(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+        Index(
+            "ix_notifications_dedupe",
+            "user_id",
+            "type",
+            "dedupe_key",
+            postgresql_where=text("dedupe_key IS NOT NULL"),
+            sqlite_where=text("dedupe_key IS NOT NULL"),
+        ),
+    )
 
     id = Column(String(36), primary_key=True, default=uuid_str)
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -306,6 +369,42 @@ class Notification(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+class TranslationJob(Base):
+    __tablename__ = "translation_jobs"
+    __table_args__ = (
+        UniqueConstraint("target_type", "target_id", "language"),
+        Index("ix_translation_jobs_status_next_run_at", "status", "next_run_at"),
+    )
+
+    id = Column(String(36), primary_key=True, default=uuid_str)
+    target_type = Column(String(16), nullable=False)
+    target_id = Column(String(36), nullable=False)
+    language = Column(String(8), nullable=False)
+    status = Column(String(32), default="pending", nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    last_error = Column(Text, nullable=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    locked_by = Column(String(64), nullable=True)
+    next_run_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+
+class TranslationMemory(Base):
+    __tablename__ = "translation_memory"
+    __table_args__ = (Index("ix_translation_memory_last_used_at", "last_used_at"),)
+
+    segment_hash = Column(String(64), primary_key=True)
+    source_language = Column(String(8), primary_key=True)
+    target_language = Column(String(8), primary_key=True)
+    model = Column(String(64), primary_key=True)
+    translation = Column(Text, nullable=False)
+    last_used_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
 __all__ = [
     "User",
     "UserSession",
@@ -324,11 +423,14 @@ __all__ = [
     "HelpfulnessVote",
     "AccuracyFeedback",
     "PostView",
+    "PostTrendingScore",
     "SavedPost",
     "Report",
     "ModerationAction",
     "ModerationLog",
     "Appeal",
     "Notification",
+    "TranslationJob",
+    "TranslationMemory",
 ]
 
@@ -5,7 +5,8 @@ from app.schemas.post import PostResponse
 
 class SearchResponse(BaseModel):
     items: list[PostResponse] = Field(default_factory=list)
-    total: int = 0
+    total: int | None = 0
+    has_more: bool = False
 
 
 class SuggestionResponse(BaseModel):
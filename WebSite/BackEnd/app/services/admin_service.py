@@ -3,15 +3,18 @@ from datetime import datetime, timezone
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.auth import invalidate_principal
 from app.core.errors import AppError
 from app.core.config import settings
+from app.core.pagination import paginate
 from app.models.models import Category, Post, PostTag, Reply, Tag, User, Report, Profile, UserSession
 from app.services.audit_service import log_action
 from app.services.notification_service import create_notification
+from app.services.post_cache_service import invalidate_post
 
 
-async def list_users(db: AsyncSession, limit: int, offset: int) -> list[User]:
-    result = await db.execute(select(User).order_by(User.created_at.desc()).limit(limit).offset(offset))
+async def list_users(db: AsyncSession, limit: int, offset: int, cursor: str | None = None) -> list[User]:
+    result = await db.execute(paginate(select(User), User.created_at, User.id, limit, offset, cursor))
     return list(result.scalars().all())
 
 
@@ -90,6 +93,7 @@ async def set_user_status(db: AsyncSession, user_id: str, status: str, admin_id:
                     status_code=400,
                 )
     user.status = status
+    invalidate_principal(db, user_id)
     await log_action(db, admin_id, "user", user_id, f"user_{status}", None)
     await create_notification(
         db,
@@ -98,7 +102,7 @@ async def set_user_status(db: AsyncSession, user_id: str, status: str, admin_id:
         {"status": status},
         dedupe_key=f"account_status:{user_id}:{status}",
     )
-    await db.commit()
+    await db.flush()
     await db.refresh(user)
     return user
 
@@ -114,8 +118,9 @@ async def set_user_role(db: AsyncSession, user_id: str, role: str, admin_id: str
         raise AppError(code="forbidden", message="Root admin cannot be demoted", status_code=403)
     if user.role != role:
         user.role = role
+        invalidate_principal(db, user_id)
         await log_action(db, admin_id, "user", user_id, f"user_role_{role}", None)
-        await db.commit()
+        await db.flush()
         await db.refresh(user)
     return user
 
@@ -130,8 +135,9 @@ async def admin_set_post_status(
     post.status = status
     if status == "published" and post.published_at is None:
         post.published_at = datetime.now(timezone.utc)
+    invalidate_post(db, post_id)
     await log_action(db, admin_id, "post", post_id, f"post_{status}", reason)
-    await db.commit()
+    await db.flush()
     await db.refresh(post)
     return post
 
@@ -145,7 +151,7 @@ async def admin_set_reply_status(
         raise AppError(code="reply_not_found", message="Reply not found", status_code=404)
     reply.status = status
     await log_action(db, admin_id, "reply", reply_id, f"reply_{status}", reason)
-    await db.commit()
+    await db.flush()
     await db.refresh(reply)
     return reply
 
@@ -174,10 +180,11 @@ async def backfill_post_categories(db: AsyncSession, admin_id: str) -> dict:
         slug = _infer_category_slug(tags)
         chosen = category_by_slug.get(slug) if slug else None
         post.category_id = (chosen or default_category).id
+        invalidate_post(db, post.id)
         updated += 1
 
     await log_action(db, admin_id, "post", "bulk", "post_backfill_category", None)
-    await db.commit()
+    await db.flush()
     return {"updated": updated}
 
 
@@ -1,10 +1,12 @@
 import asyncio
+import copy
 import json
 
 from openai import BadRequestError, OpenAI
 
 from app.core.config import settings
 from app.core.errors import AppError
+from app.services.translation_memory_service import recall_segments, remember_segments, segment_hash
 
 
 def _get_client() -> OpenAI:
@@ -13,68 +15,199 @@ def _get_client() -> OpenAI:
     return OpenAI(api_key=settings.openai_api_key, timeout=settings.openai_timeout_seconds)
 
 
-def translate_text(text: str, source_lang: str, target_lang: str) -> str:
-    title, content = translate_post("", text, source_lang, target_lang)
-    return content
-
-
 async def translate_text_async(text: str, source_lang: str, target_lang: str) -> str:
-    return await asyncio.to_thread(translate_text, text, source_lang, target_lang)
-
-
-def translate_post(
-    title: str, content: str, source_lang: str, target_lang: str
-) -> tuple[str, str]:
-    return translate_post_preserving_content(title, content, source_lang, target_lang)
+    title, content = await translate_post_async("", text, source_lang, target_lang)
+    return content
 
 
 async def translate_post_async(
     title: str, content: str, source_lang: str, target_lang: str
 ) -> tuple[str, str]:
-    return await asyncio.to_thread(translate_post, title, content, source_lang, target_lang)
-
+    translated = await _translate_with_memory(title, content, source_lang, [target_lang])
+    if target_lang not in translated:
+        raise AppError(code="ai_translation_failed", message="Translation failed", status_code=500)
+    return translated[target_lang]
 
-def translate_post_preserving_content(
-    title: str, content: str, source_lang: str, target_lang: str
-) -> tuple[str, str]:
-    editor_payload = _load_editorjs(content)
-    if editor_payload is None:
-        return _translate_plain_post(title, content, source_lang, target_lang)
 
-    fields: list[str] = []
-    paths: list[tuple] = []
-    _collect_editorjs_fields(editor_payload, (), fields, paths)
-    translated_title, translated_fields = _translate_structured_fields(title, fields, source_lang, target_lang)
-    for path, translated in zip(paths, translated_fields):
-        _set_path(editor_payload, path, translated)
-    return translated_title, json.dumps(editor_payload, ensure_ascii=False)
+async def translate_content_preserving_structure_async(
+    content: str, source_lang: str, target_lang: str
+) -> str:
+    _, translated = await translate_post_async("", content, source_lang, target_lang)
+    return translated
 
 
-def translate_content_preserving_structure(content: str, source_lang: str, target_lang: str) -> str:
-    _, translated = translate_post_preserving_content("", content, source_lang, target_lang)
-    return translated
+async def translate_post_multi_async(
+    title: str, content: str, source_lang: str, target_langs: list[str]
+) -> dict[str, tuple[str, str]]:
+    return await _translate_with_memory(title, content, source_lang, target_langs)
 
 
-async def translate_content_preserving_structure_async(
-    content: str, source_lang: str, target_lang: str
-) -> str:
-    return await asyncio.to_thread(translate_content_preserving_structure, content, source_lang, target_lang)
+async def _translate_with_memory(
+    title: str, content: str, source_lang: str, target_langs: list[str]
+) -> dict[str, tuple[str, str]]:
+    editor_payload = _load_editorjs(content)
+    fields: list[str] = []
+    paths: list[tuple] = []
+    if editor_payload is None:
+        if content.strip():
+            fields.append(content)
+    else:
+        _collect_editorjs_fields(editor_payload, (), fields, paths)
+
+    # Segments already in the translation memory are reused; only the misses go to the model.
+    segments = [segment for segment in [title, *fields] if segment.strip()]
+    recalled = await recall_segments(segments, source_lang, target_langs)
+    known = {language: dict(recalled.get(language, {})) for language in target_langs}
+    missing_title = ""
+    missing_fields: list[str] = []
+    missing_languages: list[str] = []
+    seen: set[str] = set()
+    for language in target_langs:
+        title_missing = bool(title.strip()) and segment_hash(title) not in known[language]
+        field_misses = [field for field in fields if segment_hash(field) not in known[language]]
+        if not title_missing and not field_misses:
+            continue
+        missing_languages.append(language)
+        if title_missing:
+            missing_title = title
+        for field in field_misses:
+            if segment_hash(field) not in seen:
+                seen.add(segment_hash(field))
+                missing_fields.append(field)
+
+    if missing_languages:
+        learned, error = await _translate_chunked(missing_title, missing_fields, source_lang, missing_languages)
+        for language, pairs in learned.items():
+            for segment, translated in pairs.items():
+                known[language][segment_hash(segment)] = translated
+        # Chunks that did succeed are remembered, so a retry only pays for the ones that failed.
+        await remember_segments(source_lang, learned)
+        if error is not None:
+            raise error
+
+    results: dict[str, tuple[str, str]] = {}
+    for language in target_langs:
+        translations = known[language]
+        if any(segment_hash(segment) not in translations for segment in segments):
+            continue
+        translated_title = translations[segment_hash(title)].strip() if title.strip() else ""
+        if editor_payload is None:
+            translated_content = translations[segment_hash(content)].strip() if content.strip() else content
+            if content.strip() and not translated_content:
+                continue
+            results[language] = (translated_title, translated_content)
+            continue
+        payload = copy.deepcopy(editor_payload)
+        for path, segment in zip(paths, fields):
+            _set_path(payload, path, translations[segment_hash(segment)])
+        results[language] = (translated_title, json.dumps(payload, ensure_ascii=False))
+    return results
+
+
+async def translate_content_multi_async(
+    content: str, source_lang: str, target_langs: list[str]
+) -> dict[str, str]:
+    translated = await translate_post_multi_async("", content, source_lang, target_langs)
+    return {language: item[1] for language, item in translated.items()}
+
+
+async def _translate_chunked(
+    title: str, fields: list[str], source_lang: str, target_langs: list[str]
+) -> tuple[dict[str, dict[str, str]], Exception | None]:
+    # Output grows with every target language, so the per-chunk budget is shared between them.
+    budget = max(settings.translation_chunk_tokens // len(target_langs), 1)
+    chunks = _chunk_fields(fields, budget) or [[]]
+    semaphore = asyncio.Semaphore(max(settings.translation_chunk_parallelism, 1))
+
+    async def run(chunk_title: str, chunk: list[str]) -> dict[str, tuple[str, list[str]]]:
+        async with semaphore:
+            return await _translate_chunk(chunk_title, chunk, source_lang, target_langs)
+
+    outcomes = await asyncio.gather(
+        *(run(title if index == 0 else "", chunk) for index, chunk in enumerate(chunks)),
+        return_exceptions=True,
+    )
+    learned: dict[str, dict[str, str]] = {}
+    error = None
+    for index, (chunk, outcome) in enumerate(zip(chunks, outcomes)):
+        if isinstance(outcome, Exception):
+            error = outcome
+            continue
+        for language, (translated_title, translated_fields) in outcome.items():
+            pairs = learned.setdefault(language, {})
+            pairs.update(zip(chunk, translated_fields))
+            if index == 0 and title:
+                pairs[title] = translated_title
+    return learned, error
+
+
+async def _translate_chunk(
+    title: str, fields: list[str], source_lang: str, target_langs: list[str]
+) -> dict[str, tuple[str, list[str]]]:
+    results: dict[str, tuple[str, list[str]]] = {}
+    pending = list(target_langs)
+    error = None
+    for _ in range(max(settings.translation_chunk_attempts, 1)):
+        try:
+            if len(pending) == 1:
+                results[pending[0]] = await asyncio.to_thread(
+                    _translate_structured_fields, title, fields, source_lang, pending[0]
+                )
+            else:
+                results.update(
+                    await asyncio.to_thread(_translate_structured_fields_multi, title, fields, source_lang, pending)
+                )
+        except Exception as exc:
+            error = exc
+        pending = [language for language in target_langs if language not in results]
+        if not pending:
+            break
+    if not results and error is not None:
+        raise error
+    return results
+
+
+def _chunk_fields(fields: list[str], budget: int) -> list[list[str]]:
+    # Fields are never split, so markup inside a block stays intact; an oversized field gets a chunk of its own.
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    used = 0
+    for field in fields:
+        cost = _estimate_tokens(field)
+        if current and used + cost > budget:
+            chunks.append(current)
+            current = []
+            used = 0
+        current.append(field)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _estimate_tokens(text: str) -> int:
+    # About four characters per token for Latin text and roughly one per character for CJK scripts.
+    wide = sum(1 for char in text if ord(char) > 0x2E7F)
+    return (len(text) - wide) // 4 + wide + 1
 
 
-def _translate_plain_post(
-    title: str, content: str, source_lang: str, target_lang: str
-) -> tuple[str, str]:
+def _translate_structured_fields(
+    title: str, fields: list[str], source_lang: str, target_lang: str
+) -> tuple[str, list[str]]:
+    if not fields and not title:
+        return "", []
     client = _get_client()
     prompt = (
-        f"Translate the following JSON from {source_lang} to {target_lang}. "
-        "Keep the meaning and tone. Return ONLY valid JSON with keys "
-        '"title" and "content".'
+        f"Translate this JSON from {source_lang} to {target_lang}. "
+        "Return ONLY valid JSON with keys title and fields. "
+        "fields must be an array with the same length and order. "
+        "Preserve HTML tags, URLs, variables, numbers, and punctuation where possible."
     )
-    payload = {"title": title, "content": content}
+    payload = {"title": title, "fields": fields}
     response = _chat_complete(
         client,
         [
-            {"role": "system", "content": "You are a precise translator."},
+            {"role": "system", "content": "You are a precise translator for structured rich text."},
             {"role": "user", "content": prompt},
             {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
         ],
@@ -85,24 +218,26 @@ def _translate_plain_post(
     try:
         data = json.loads(output_text)
         translated_title = (data.get("title") or "").strip()
-        translated_content = (data.get("content") or "").strip()
-        if not translated_content:
-            raise ValueError("empty content")
-        return translated_title, translated_content
+        translated_fields = data.get("fields")
+        if not isinstance(translated_fields, list) or len(translated_fields) != len(fields):
+            raise ValueError("field count mismatch")
+        return translated_title, [str(item) for item in translated_fields]
     except Exception:
         raise AppError(code="ai_translation_failed", message="Translation failed", status_code=500)
 
 
-def _translate_structured_fields(
-    title: str, fields: list[str], source_lang: str, target_lang: str
-) -> tuple[str, list[str]]:
+def _translate_structured_fields_multi(
+    title: str, fields: list[str], source_lang: str, target_langs: list[str]
+) -> dict[str, tuple[str, list[str]]]:
     if not fields and not title:
-        return "", []
+        return {language: ("", []) for language in target_langs}
     client = _get_client()
+    # One request for every target language: the source tokens are sent once instead of once per language.
     prompt = (
-        f"Translate this JSON from {source_lang} to {target_lang}. "
-        "Return ONLY valid JSON with keys title and fields. "
-        "fields must be an array with the same length and order. "
+        f"Translate this JSON from {source_lang} into each of these languages: {', '.join(target_langs)}. "
+        "Return ONLY a valid JSON object whose keys are exactly those language codes. "
+        "Each value must be an object with keys title and fields. "
+        "fields must be an array with the same length and order as the input fields. "
         "Preserve HTML tags, URLs, variables, numbers, and punctuation where possible."
     )
     payload = {"title": title, "fields": fields}
@@ -115,17 +250,24 @@ def _translate_structured_fields(
         ],
     )
     output_text = (response.choices[0].message.content or "").strip()
-    if not output_text:
-        raise AppError(code="ai_translation_failed", message="Translation failed", status_code=500)
     try:
         data = json.loads(output_text)
-        translated_title = (data.get("title") or "").strip()
-        translated_fields = data.get("fields")
-        if not isinstance(translated_fields, list) or len(translated_fields) != len(fields):
-            raise ValueError("field count mismatch")
-        return translated_title, [str(item) for item in translated_fields]
     except Exception:
         raise AppError(code="ai_translation_failed", message="Translation failed", status_code=500)
+    if not isinstance(data, dict):
+        raise AppError(code="ai_translation_failed", message="Translation failed", status_code=500)
+    results: dict[str, tuple[str, list[str]]] = {}
+    for language in target_langs:
+        item = data.get(language)
+        if not isinstance(item, dict):
+            continue
+        translated_fields = item.get("fields")
+        if not isinstance(translated_fields, list) or len(translated_fields) != len(fields):
+            continue
+        results[language] = ((item.get("title") or "").strip(), [str(value) for value in translated_fields])
+    if not results:
+        raise AppError(code="ai_translation_failed", message="Translation failed", status_code=500)
+    return results
 
 
 def _load_editorjs(content: str) -> dict | None:
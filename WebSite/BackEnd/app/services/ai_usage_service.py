@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.database import commit_now
 from app.core.errors import AppError
 from app.models.models import AIUsage
 
@@ -19,10 +20,10 @@ async def enforce_ai_limit(db: AsyncSession, user_id: str) -> None:
     if usage is None:
         usage = AIUsage(user_id=user_id, usage_date=today, count=1)
         db.add(usage)
-        await db.commit()
+        await commit_now(db)
         return
     if usage.count >= settings.ai_daily_limit:
         raise AppError(code="ai_rate_limited", message="AI daily limit reached", status_code=429)
     usage.count += 1
-    await db.commit()
+    await commit_now(db)
 
@@ -1,15 +1,15 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import paginate
 from app.models.models import ModerationAction
 
 
-async def list_audit_logs(db: AsyncSession, limit: int, offset: int) -> list[ModerationAction]:
+async def list_audit_logs(
+    db: AsyncSession, limit: int, offset: int, cursor: str | None = None
+) -> list[ModerationAction]:
     result = await db.execute(
-        select(ModerationAction)
-        .order_by(ModerationAction.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        paginate(select(ModerationAction), ModerationAction.created_at, ModerationAction.id, limit, offset, cursor)
     )
     return list(result.scalars().all())
 
@@ -4,15 +4,17 @@ import secrets
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.auth import invalidate_principal
 from app.core.errors import AppError
 from app.core.config import settings
+from app.core.database import commit_now
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
+    hash_password_async,
     hash_token,
-    verify_password,
+    verify_password_async,
 )
 from app.models.models import EmailVerificationCode, Profile, User, UserSession
 from app.services.email_service import send_email
@@ -26,14 +28,13 @@ async def register_user(
     if existing.scalar_one_or_none() is not None:
         raise AppError(code="email_exists", message="Email already registered", status_code=409)
 
-    user = User(email=email, password_hash=hash_password(password))
+    user = User(email=email, password_hash=await hash_password_async(password))
     profile = Profile(user_id=user.id, display_name=display_name)
 
     db.add(user)
     await db.flush()
     profile.user_id = user.id
     db.add(profile)
-    await db.commit()
 
     return await issue_tokens(db, user.id)
 
@@ -41,10 +42,15 @@ async def register_user(
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> tuple[str, str]:
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalar_one_or_none()
-    if user is None or not verify_password(password, user.password_hash):
+    if user is None:
+        raise AppError(code="invalid_credentials", message="Invalid credentials", status_code=401)
+    valid, new_hash = await verify_password_async(password, user.password_hash)
+    if not valid:
         raise AppError(code="invalid_credentials", message="Invalid credentials", status_code=401)
     if user.status == "banned":
         raise AppError(code="user_banned", message="User is banned", status_code=403)
+    if new_hash:
+        user.password_hash = new_hash
     return await issue_tokens(db, user.id)
 
 
@@ -64,7 +70,7 @@ async def issue_tokens(db: AsyncSession, user_id: str) -> tuple[str, str]:
     )
     db.add(session)
     user.last_login_at = datetime.now(timezone.utc)
-    await db.commit()
+    await db.flush()
     return access_token, refresh_token
 
 
@@ -94,7 +100,7 @@ async def revoke_refresh_token(db: AsyncSession, refresh_token: str) -> None:
     if session is None:
         return
     session.revoked_at = datetime.now(timezone.utc)
-    await db.commit()
+    await db.flush()
 
 
 async def reset_password(
@@ -102,9 +108,13 @@ async def reset_password(
 ) -> None:
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
-    if user is None or not verify_password(current_password, user.password_hash):
+    if user is None:
         raise AppError(code="invalid_credentials", message="Invalid credentials", status_code=401)
-    user.password_hash = hash_password(new_password)
+    valid, _ = await verify_password_async(current_password, user.password_hash)
+    if not valid:
+        raise AppError(code="invalid_credentials", message="Invalid credentials", status_code=401)
+    user.password_hash = await hash_password_async(new_password)
+    invalidate_principal(db, user.id)
     await revoke_user_sessions(db, user.id)
     from app.services.notification_service import create_notification
 
@@ -115,7 +125,6 @@ async def reset_password(
         {"method": "current_password"},
         dedupe_key=f"password_changed:{user.id}:{datetime.utcnow().date()}",
     )
-    await db.commit()
 
 
 async def send_email_code(db: AsyncSession, email: str, purpose: str) -> str:
@@ -129,7 +138,7 @@ async def send_email_code(db: AsyncSession, email: str, purpose: str) -> str:
             expires_at=expires_at,
         )
     )
-    await db.commit()
+    await commit_now(db)
     if settings.smtp_host or settings.email_smtp_host or settings.email_host:
         subject = "BridgeUS verification code"
         plain = (
@@ -193,7 +202,7 @@ async def verify_email_code(db: AsyncSession, email: str, code: str, purpose: st
     if record is None or record.expires_at < datetime.utcnow():
         raise AppError(code="invalid_code", message="Invalid or expired code", status_code=400)
     record.used_at = datetime.now(timezone.utc)
-    await db.commit()
+    await db.flush()
 
 
 async def reset_password_with_code(
@@ -204,7 +213,8 @@ async def reset_password_with_code(
     user = result.scalar_one_or_none()
     if user is None:
         raise AppError(code="user_not_found", message="User not found", status_code=404)
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await hash_password_async(new_password)
+    invalidate_principal(db, user.id)
     await revoke_user_sessions(db, user.id)
     from app.services.notification_service import create_notification
 
@@ -215,7 +225,6 @@ async def reset_password_with_code(
         {"method": "email_code"},
         dedupe_key=f"password_changed:{user.id}:{datetime.utcnow().date()}",
     )
-    await db.commit()
 
 
 async def revoke_user_sessions(db: AsyncSession, user_id: str) -> None:
@@ -226,7 +235,7 @@ async def revoke_user_sessions(db: AsyncSession, user_id: str) -> None:
     now = datetime.now(timezone.utc)
     for session in sessions:
         session.revoked_at = now
-    await db.commit()
+    await db.flush()
 
 
 async def ensure_root_admin(db: AsyncSession) -> None:
@@ -237,7 +246,7 @@ async def ensure_root_admin(db: AsyncSession) -> None:
     if user is None:
         user = User(
             email=settings.root_account,
-            password_hash=hash_password(settings.root_password),
+            password_hash=await hash_password_async(settings.root_password),
             role="admin",
             status="active",
         )
@@ -246,9 +255,9 @@ async def ensure_root_admin(db: AsyncSession) -> None:
         await db.flush()
         profile.user_id = user.id
         db.add(profile)
-        await db.commit()
+        await db.flush()
         return
     if user.role != "admin":
         user.role = "admin"
-        await db.commit()
+        await db.flush()
 
@@ -23,10 +23,10 @@ async def create_category(db: AsyncSession, payload: CategoryCreateRequest, admi
         status=payload.status,
     )
     db.add(category)
-    await db.commit()
+    await db.flush()
     await db.refresh(category)
     await log_action(db, admin_id, "category", category.id, "category_create", None)
-    await db.commit()
+    await db.flush()
     return category
 
 
@@ -45,7 +45,7 @@ async def update_category(
     for key, value in data.items():
         setattr(category, key, value)
     await log_action(db, admin_id, "category", category.id, "category_update", None)
-    await db.commit()
+    await db.flush()
     await db.refresh(category)
     return category
 
@@ -60,7 +60,7 @@ async def delete_category(db: AsyncSession, category_id: str, admin_id: str) ->
         post.category_id = None
     await log_action(db, admin_id, "category", category.id, "category_delete", None)
     await db.delete(category)
-    await db.commit()
+    await db.flush()
 
 
 async def ensure_default_categories(db: AsyncSession) -> None:
@@ -77,5 +77,5 @@ async def ensure_default_categories(db: AsyncSession) -> None:
     ]
     for name, slug, order in defaults:
         db.add(Category(name=name, slug=slug, sort_order=order, status="active"))
-    await db.commit()
+    await db.flush()
 
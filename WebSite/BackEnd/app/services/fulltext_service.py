@@ -0,0 +1,191 @@
+import hashlib
+import html
+import logging
+import re
+
+from sqlalchemy import column, event, func, literal_column, table, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.models.models import Post, PostTranslation
+from app.services.ai_service import _collect_editorjs_fields, _load_editorjs
+
+
+logger = logging.getLogger(__name__)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+# Han, Hiragana/Katakana and Hangul have no reliable word boundaries for the built-in tokenizers,
+# so every character becomes its own token and queries match them as phrases.
+_SPACED_SCRIPT_RE = re.compile(r"([ᄀ-ᇿ぀-ヿ㄰-㆏㐀-䶿一-鿿가-힯])")
+_POSTGRES_CONFIGS = {"en": "english"}
+
+
+def search_document_text(content: str) -> str:
+    payload = _load_editorjs(content)
+    if payload is None:
+        text_value = content
+    else:
+        fields: list[str] = []
+        _collect_editorjs_fields(payload, (), fields, [])
+        text_value = "\n".join(fields)
+    return " ".join(html.unescape(_TAG_RE.sub(" ", text_value)).split())
+
+
+def _segment(value: str) -> str:
+    return " ".join(_SPACED_SCRIPT_RE.sub(r" \1 ", value).split())
+
+
+def build_match_query(query: str) -> str:
+    terms = []
+    for term in query.replace('"', " ").split():
+        segmented = _segment(term)
+        if segmented:
+            terms.append(f'"{segmented}"')
+    return " ".join(terms)
+
+
+class SqliteFts5Backend:
+    name = "sqlite_fts5"
+    table_name = "post_search_fts"
+
+    def __init__(self) -> None:
+        self.fts = table(self.table_name, column("rowid"), column("post_id"), column("language"))
+
+    async def is_ready(self, engine: AsyncEngine) -> bool:
+        async with engine.connect() as connection:
+            result = await connection.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": self.table_name},
+            )
+            return result.scalar_one_or_none() is not None
+
+    def upsert(self, connection, post_id: str, language: str, title: str, body: str) -> None:
+        rowid = _document_rowid(post_id, language)
+        connection.execute(text(f"DELETE FROM {self.table_name} WHERE rowid = :rowid"), {"rowid": rowid})
+        connection.execute(
+            text(
+                f"INSERT INTO {self.table_name} (rowid, post_id, language, title, body) "
+                "VALUES (:rowid, :post_id, :language, :title, :body)"
+            ),
+            {"rowid": rowid, "post_id": post_id, "language": language, "title": _segment(title), "body": _segment(body)},
+        )
+
+    def delete(self, connection, post_id: str, language: str) -> None:
+        connection.execute(
+            text(f"DELETE FROM {self.table_name} WHERE rowid = :rowid"),
+            {"rowid": _document_rowid(post_id, language)},
+        )
+
+    def apply(self, stmt, match_query: str, language: str):
+        stmt = stmt.join(self.fts, self.fts.c.post_id == Post.id).where(
+            self.fts.c.language == language,
+            literal_column(self.table_name).op("MATCH")(match_query),
+        )
+        # bm25() is lower-is-better; columns are post_id, language, title, body.
+        rank = func.bm25(literal_column(self.table_name), 0.0, 0.0, 10.0, 1.0)
+        return stmt, rank.asc()
+
+
+class PostgresTsvectorBackend:
+    name = "postgres_tsvector"
+    table_name = "post_search_documents"
+
+    def __init__(self) -> None:
+        self.documents = table(self.table_name, column("post_id"), column("language"), column("document"))
+
+    async def is_ready(self, engine: AsyncEngine) -> bool:
+        async with engine.connect() as connection:
+            result = await connection.execute(text("SELECT to_regclass(:name)"), {"name": self.table_name})
+            return result.scalar_one_or_none() is not None
+
+    def upsert(self, connection, post_id: str, language: str, title: str, body: str) -> None:
+        connection.execute(
+            text(
+                f"INSERT INTO {self.table_name} (post_id, language, config, title, body) "
+                "VALUES (:post_id, :language, CAST(:config AS regconfig), :title, :body) "
+                "ON CONFLICT (post_id, language) DO UPDATE SET "
+                "config = EXCLUDED.config, title = EXCLUDED.title, body = EXCLUDED.body"
+            ),
+            {
+                "post_id": post_id,
+                "language": language,
+                "config": postgres_config(language),
+                "title": _segment(title),
+                "body": _segment(body),
+            },
+        )
+
+    def delete(self, connection, post_id: str, language: str) -> None:
+        connection.execute(
+            text(f"DELETE FROM {self.table_name} WHERE post_id = :post_id AND language = :language"),
+            {"post_id": post_id, "language": language},
+        )
+
+    def apply(self, stmt, match_query: str, language: str):
+        # A constant regconfig keeps the predicate on the GIN index.
+        ts_query = func.websearch_to_tsquery(literal_column(f"'{postgres_config(language)}'::regconfig"), match_query)
+        stmt = stmt.join(self.documents, self.documents.c.post_id == Post.id).where(
+            self.documents.c.language == language,
+            self.documents.c.document.op("@@")(ts_query),
+        )
+        return stmt, func.ts_rank_cd(self.documents.c.document, ts_query).desc()
+
+
+def postgres_config(language: str) -> str:
+    return _POSTGRES_CONFIGS.get(language, "simple")
+
+
+def _document_rowid(post_id: str, language: str) -> int:
+    digest = hashlib.sha1(f"{post_id}:{language}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") >> 1
+
+
+_BACKENDS = {
+    "sqlite": SqliteFts5Backend,
+    "postgresql": PostgresTsvectorBackend,
+}
+_active_backend: SqliteFts5Backend | PostgresTsvectorBackend | None = None
+
+
+def get_fulltext_backend() -> SqliteFts5Backend | PostgresTsvectorBackend | None:
+    return _active_backend
+
+
+async def init_fulltext_backend(engine: AsyncEngine) -> None:
+    global _active_backend
+    backend_class = _BACKENDS.get(engine.dialect.name)
+    if backend_class is None:
+        _active_backend = None
+        return
+    backend = backend_class()
+    if not await backend.is_ready(engine):
+        logger.warning("Full-text index %s is missing; search falls back to ILIKE", backend.table_name)
+        _active_backend = None
+        return
+    _active_backend = backend
+
+
+def _sync_search_documents(session: Session, _flush_context) -> None:
+    backend = _active_backend
+    if backend is None:
+        return
+    connection = session.connection()
+    for item in list(session.new) + list(session.dirty):
+        if not isinstance(item, PostTranslation) or item.post_id is None:
+            continue
+        if item.status == "ready" and item.content:
+            backend.upsert(connection, item.post_id, item.language, item.title or "", search_document_text(item.content))
+        else:
+            backend.delete(connection, item.post_id, item.language)
+    for item in session.deleted:
+        if isinstance(item, PostTranslation):
+            backend.delete(connection, item.post_id, item.language)
+        elif isinstance(item, Post):
+            connection.execute(
+                text(f"DELETE FROM {backend.table_name} WHERE post_id = :post_id"), {"post_id": item.id}
+            )
+
+
+def register_fulltext_sync() -> None:
+    if not event.contains(Session, "after_flush", _sync_search_documents):
+        event.listen(Session, "after_flush", _sync_search_documents)
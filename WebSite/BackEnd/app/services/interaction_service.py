@@ -1,11 +1,28 @@
-from sqlalchemy import delete, func, or_, select
+import logging
+
+from sqlalchemy import Integer, case, cast, delete, func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.coalescing import CoalescingBuffer
+from app.core.config import settings
+from app.core.database import SessionLocal, commit_now
 from app.core.errors import AppError
+from app.core.periodic import start_periodic
 from app.models.models import AccuracyFeedback, HelpfulnessVote, Post, PostTranslation, Profile, Reply
 from app.schemas.interaction import AccuracyFeedbackRequest
-from app.services.notification_service import create_notification
+from app.services.notification_service import add_notifications, create_notification
+from app.services.post_cache_service import invalidate_post
+from app.services.trending_service import (
+    ACCURACY_WEIGHT,
+    HELPFUL_WEIGHT,
+    add_trending_amount,
+    bump_trending_score,
+    trending_amount,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 async def mark_helpful_post(db: AsyncSession, user_id: str, post_id: str) -> None:
@@ -15,45 +32,33 @@ async def mark_helpful_post(db: AsyncSession, user_id: str, post_id: str) -> Non
         raise AppError(code="post_not_found", message="Post not found", status_code=404)
     try:
         db.add(HelpfulnessVote(user_id=user_id, target_type="post", target_id=post_id))
-        await db.commit()
+        await commit_now(db)
     except IntegrityError:
         await db.rollback()
         raise AppError(code="already_voted", message="Already voted", status_code=409)
-    await _recompute_post_helpful(db, post_id)
-    await _recompute_user_helpfulness(db, post.author_id)
-    if post.author_id != user_id:
-        title_result = await db.execute(
-            select(PostTranslation.title).where(
-                PostTranslation.post_id == post_id,
-                PostTranslation.language == post.original_language,
-            )
-        )
-        post_title = title_result.scalar_one_or_none()
-        author_result = await db.execute(select(Profile.display_name).where(Profile.user_id == user_id))
-        from_user_name = author_result.scalar_one_or_none()
-        await create_notification(
-            db,
-            post.author_id,
-            "post_helpful",
-            {"post_id": post_id, "post_title": post_title, "from_user_name": from_user_name},
-            dedupe_key=f"post_helpful:{post_id}:{user_id}",
-        )
+    notify = post.author_id != user_id
+    await _record_helpful_effects("post", post_id, post.author_id, user_id, 1, notify=notify)
 
 
 async def unmark_helpful_post(db: AsyncSession, user_id: str, post_id: str) -> None:
-    await db.execute(
-        delete(HelpfulnessVote).where(
+    removed = await db.execute(
+        delete(HelpfulnessVote)
+        .where(
             HelpfulnessVote.user_id == user_id,
             HelpfulnessVote.target_type == "post",
             HelpfulnessVote.target_id == post_id,
         )
+        .returning(HelpfulnessVote.created_at)
     )
-    await db.commit()
-    post_result = await db.execute(select(Post).where(Post.id == post_id))
-    post = post_result.scalar_one_or_none()
-    if post is not None:
-        await _recompute_post_helpful(db, post_id)
-        await _recompute_user_helpfulness(db, post.author_id)
+    voted_at = removed.scalars().all()
+    if not voted_at:
+        return
+    author_result = await db.execute(select(Post.author_id).where(Post.id == post_id))
+    author_id = author_result.scalar_one_or_none()
+    # Commit before handing off: the buffer flushes through its own session and may need this connection.
+    await commit_now(db)
+    if author_id is not None:
+        await _record_helpful_effects("post", post_id, author_id, user_id, -len(voted_at), voted_at=voted_at)
 
 
 async def mark_helpful_reply(db: AsyncSession, user_id: str, reply_id: str) -> None:
@@ -63,48 +68,143 @@ async def mark_helpful_reply(db: AsyncSession, user_id: str, reply_id: str) -> N
         raise AppError(code="reply_not_found", message="Reply not found", status_code=404)
     try:
         db.add(HelpfulnessVote(user_id=user_id, target_type="reply", target_id=reply_id))
-        await db.commit()
+        await commit_now(db)
     except IntegrityError:
         await db.rollback()
         raise AppError(code="already_voted", message="Already voted", status_code=409)
-    await _recompute_reply_helpful(db, reply_id)
-    await _recompute_reply_author_helpfulness(db, reply.author_id)
-    if reply.author_id != user_id:
-        excerpt = " ".join(reply.content.split()).strip()
-        if len(excerpt) > 120:
-            excerpt = f"{excerpt[:120]}..."
-        author_result = await db.execute(select(Profile.display_name).where(Profile.user_id == user_id))
-        from_user_name = author_result.scalar_one_or_none()
-        await create_notification(
-            db,
-            reply.author_id,
-            "reply_helpful",
-            {"reply_id": reply_id, "reply_excerpt": excerpt, "from_user_name": from_user_name},
-            dedupe_key=f"reply_helpful:{reply_id}:{user_id}",
-        )
+    notify = reply.author_id != user_id
+    await _record_helpful_effects("reply", reply_id, reply.author_id, user_id, 1, notify=notify)
 
 
 async def unmark_helpful_reply(db: AsyncSession, user_id: str, reply_id: str) -> None:
-    await db.execute(
+    removed = await db.execute(
         delete(HelpfulnessVote).where(
             HelpfulnessVote.user_id == user_id,
             HelpfulnessVote.target_type == "reply",
             HelpfulnessVote.target_id == reply_id,
         )
     )
-    await db.commit()
-    reply_result = await db.execute(select(Reply).where(Reply.id == reply_id))
-    reply = reply_result.scalar_one_or_none()
-    if reply is not None:
-        await _recompute_reply_helpful(db, reply_id)
-        await _recompute_reply_author_helpfulness(db, reply.author_id)
+    if not removed.rowcount:
+        return
+    author_result = await db.execute(select(Reply.author_id).where(Reply.id == reply_id))
+    author_id = author_result.scalar_one_or_none()
+    await commit_now(db)
+    if author_id is not None:
+        await _record_helpful_effects("reply", reply_id, author_id, user_id, -removed.rowcount)
+
+
+async def _record_helpful_effects(
+    target_type: str,
+    target_id: str,
+    author_id: str,
+    voter_id: str,
+    delta: int,
+    notify: bool = False,
+    voted_at: list | None = None,
+) -> None:
+    # The vote row is committed first because the buffer applies its effects from another session.
+    vote_buffer.add(("helpful", target_type, target_id), delta)
+    vote_buffer.add(("author_helpful", author_id), delta)
+    if target_type == "post":
+        for at in voted_at or [None] * max(delta, 0):
+            sign = 1 if delta > 0 else -1
+            vote_buffer.add(("trending", target_id), trending_amount(sign * HELPFUL_WEIGHT, at))
+    if notify:
+        vote_buffer.append((target_type, target_id, author_id, voter_id))
+    if not vote_buffer.running:
+        await vote_buffer.flush()
+
+
+async def _flush_vote_effects(deltas: dict, notifications: list) -> None:
+    async with SessionLocal() as db:
+        # Posts or replies deleted since the vote was buffered would fail the whole batch; skip their effects.
+        post_ids = {key[-1] for key in deltas if key[0] == "trending" or key[:2] == ("helpful", "post")}
+        post_ids |= {target_id for target_type, target_id, _, _ in notifications if target_type == "post"}
+        reply_ids = {key[2] for key in deltas if key[:2] == ("helpful", "reply")}
+        reply_ids |= {target_id for target_type, target_id, _, _ in notifications if target_type == "reply"}
+        existing = {("post", post_id) for post_id in await _existing_ids(db, Post, post_ids)}
+        existing |= {("reply", reply_id) for reply_id in await _existing_ids(db, Reply, reply_ids)}
+        notifications = [vote for vote in notifications if (vote[0], vote[1]) in existing]
+        for key, delta in deltas.items():
+            if not delta:
+                continue
+            if key[0] == "trending" and ("post", key[1]) not in existing:
+                continue
+            if key[0] == "helpful" and (key[1], key[2]) not in existing:
+                continue
+            if key[0] == "helpful":
+                model = Post if key[1] == "post" else Reply
+                await db.execute(
+                    update(model).where(model.id == key[2]).values(helpful_count=model.helpful_count + int(delta))
+                )
+                if key[1] == "post":
+                    invalidate_post(db, key[2])
+            elif key[0] == "author_helpful":
+                await db.execute(
+                    update(Profile)
+                    .where(Profile.user_id == key[1])
+                    .values(helpfulness_score=Profile.helpfulness_score + int(delta))
+                )
+            elif key[0] == "trending":
+                await add_trending_amount(db, key[1], delta)
+        if notifications:
+            await add_notifications(db, await _vote_notifications(db, notifications))
+        await db.commit()
+
+
+async def _existing_ids(db: AsyncSession, model, ids: set[str]) -> set[str]:
+    if not ids:
+        return set()
+    result = await db.execute(select(model.id).where(model.id.in_(ids)))
+    return set(result.scalars().all())
+
+
+async def _vote_notifications(db: AsyncSession, votes: list) -> list[tuple[str, str, dict, str]]:
+    post_ids = {target_id for target_type, target_id, _, _ in votes if target_type == "post"}
+    reply_ids = {target_id for target_type, target_id, _, _ in votes if target_type == "reply"}
+    voter_ids = {voter_id for _, _, _, voter_id in votes}
+    titles: dict[str, str] = {}
+    if post_ids:
+        result = await db.execute(
+            select(PostTranslation.post_id, PostTranslation.title)
+            .join(Post, Post.id == PostTranslation.post_id)
+            .where(PostTranslation.post_id.in_(post_ids), PostTranslation.language == Post.original_language)
+        )
+        titles = dict(result.all())
+    contents: dict[str, str] = {}
+    if reply_ids:
+        result = await db.execute(select(Reply.id, Reply.content).where(Reply.id.in_(reply_ids)))
+        contents = dict(result.all())
+    names_result = await db.execute(
+        select(Profile.user_id, Profile.display_name).where(Profile.user_id.in_(voter_ids))
+    )
+    names = dict(names_result.all())
+
+    notifications = []
+    for target_type, target_id, author_id, voter_id in votes:
+        if target_type == "post":
+            payload = {"post_id": target_id, "post_title": titles.get(target_id), "from_user_name": names.get(voter_id)}
+            notifications.append((author_id, "post_helpful", payload, f"post_helpful:{target_id}:{voter_id}"))
+        else:
+            excerpt = " ".join((contents.get(target_id) or "").split()).strip()
+            if len(excerpt) > 120:
+                excerpt = f"{excerpt[:120]}..."
+            payload = {"reply_id": target_id, "reply_excerpt": excerpt, "from_user_name": names.get(voter_id)}
+            notifications.append((author_id, "reply_helpful", payload, f"reply_helpful:{target_id}:{voter_id}"))
+    return notifications
+
+
+vote_buffer = CoalescingBuffer(
+    "vote_effects", _flush_vote_effects, settings.vote_buffer_flush_ms, settings.vote_buffer_max_events
+)
 
 
 async def submit_accuracy_feedback(
     db: AsyncSession, user_id: str, post_id: str, payload: AccuracyFeedbackRequest
 ) -> None:
     post_result = await db.execute(select(Post).where(Post.id == post_id))
-    if post_result.scalar_one_or_none() is None:
+    post = post_result.scalar_one_or_none()
+    if post is None:
         raise AppError(code="post_not_found", message="Post not found", status_code=404)
     try:
         db.add(
@@ -115,37 +215,35 @@ async def submit_accuracy_feedback(
                 note=payload.note,
             )
         )
-        await db.commit()
+        await db.flush()
     except IntegrityError:
         await db.rollback()
         raise AppError(code="already_rated", message="Already rated", status_code=409)
-    post_result = await db.execute(select(Post).where(Post.id == post_id))
-    post = post_result.scalar_one_or_none()
-    if post is not None:
-        await _recompute_post_accuracy(db, post_id)
-        await _recompute_user_accuracy(db, post.author_id)
-        if post.author_id != user_id:
-            title_result = await db.execute(
-                select(PostTranslation.title).where(
-                    PostTranslation.post_id == post_id,
-                    PostTranslation.language == post.original_language,
-                )
-            )
-            post_title = title_result.scalar_one_or_none()
-            author_result = await db.execute(select(Profile.display_name).where(Profile.user_id == user_id))
-            from_user_name = author_result.scalar_one_or_none()
-            await create_notification(
-                db,
-                post.author_id,
-                "post_rated",
-                {
-                    "post_id": post_id,
-                    "post_title": post_title,
-                    "from_user_name": from_user_name,
-                    "rating": payload.rating,
-                },
-                dedupe_key=f"post_rated:{post_id}:{user_id}",
+    await _apply_accuracy_delta(db, post_id, post.author_id, payload.rating, 1)
+    await bump_trending_score(db, post_id, ACCURACY_WEIGHT * payload.rating / 5)
+    await db.flush()
+    if post.author_id != user_id:
+        title_result = await db.execute(
+            select(PostTranslation.title).where(
+                PostTranslation.post_id == post_id,
+                PostTranslation.language == post.original_language,
             )
+        )
+        post_title = title_result.scalar_one_or_none()
+        author_result = await db.execute(select(Profile.display_name).where(Profile.user_id == user_id))
+        from_user_name = author_result.scalar_one_or_none()
+        await create_notification(
+            db,
+            post.author_id,
+            "post_rated",
+            {
+                "post_id": post_id,
+                "post_title": post_title,
+                "from_user_name": from_user_name,
+                "rating": payload.rating,
+            },
+            dedupe_key=f"post_rated:{post_id}:{user_id}",
+        )
 
 
 async def update_accuracy_feedback(
@@ -160,14 +258,16 @@ async def update_accuracy_feedback(
     feedback = result.scalar_one_or_none()
     if feedback is None:
         raise AppError(code="feedback_not_found", message="Feedback not found", status_code=404)
+    rating_delta = payload.rating - feedback.rating
     feedback.rating = payload.rating
     feedback.note = payload.note
-    await db.commit()
-    post_result = await db.execute(select(Post).where(Post.id == post_id))
-    post = post_result.scalar_one_or_none()
-    if post is not None:
-        await _recompute_post_accuracy(db, post_id)
-        await _recompute_user_accuracy(db, post.author_id)
+    if rating_delta:
+        author_result = await db.execute(select(Post.author_id).where(Post.id == post_id))
+        author_id = author_result.scalar_one_or_none()
+        if author_id is not None:
+            await _apply_accuracy_delta(db, post_id, author_id, rating_delta, 0)
+        await bump_trending_score(db, post_id, ACCURACY_WEIGHT * rating_delta / 5, at=feedback.created_at)
+    await db.flush()
 
 
 async def delete_accuracy_feedback(db: AsyncSession, user_id: str, post_id: str) -> None:
@@ -180,97 +280,193 @@ async def delete_accuracy_feedback(db: AsyncSession, user_id: str, post_id: str)
     feedback = result.scalar_one_or_none()
     if feedback is None:
         raise AppError(code="feedback_not_found", message="Feedback not found", status_code=404)
+    author_result = await db.execute(select(Post.author_id).where(Post.id == post_id))
+    author_id = author_result.scalar_one_or_none()
+    if author_id is not None:
+        await _apply_accuracy_delta(db, post_id, author_id, -feedback.rating, -1)
+    await bump_trending_score(db, post_id, -ACCURACY_WEIGHT * feedback.rating / 5, at=feedback.created_at)
     await db.delete(feedback)
-    await db.commit()
-    post_result = await db.execute(select(Post).where(Post.id == post_id))
-    post = post_result.scalar_one_or_none()
-    if post is not None:
-        await _recompute_post_accuracy(db, post_id)
-        await _recompute_user_accuracy(db, post.author_id)
+    await db.flush()
 
 
-async def _recompute_post_helpful(db: AsyncSession, post_id: str) -> None:
-    count_result = await db.execute(
-        select(func.count(HelpfulnessVote.id)).where(
-            HelpfulnessVote.target_type == "post",
-            HelpfulnessVote.target_id == post_id,
+def _average(total, count):
+    return case((count > 0, total * 1.0 / count), else_=0.0)
+
+
+async def _apply_accuracy_delta(
+    db: AsyncSession, post_id: str, author_id: str, rating_delta: int, count_delta: int
+) -> None:
+    # SET expressions read the pre-update row, so sum, count and average move together atomically.
+    post_sum = Post.accuracy_sum + rating_delta
+    post_count = Post.accuracy_count + count_delta
+    await db.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(accuracy_sum=post_sum, accuracy_count=post_count, accuracy_avg=_average(post_sum, post_count))
+    )
+    invalidate_post(db, post_id)
+    profile_sum = Profile.accuracy_sum + rating_delta
+    profile_count = Profile.accuracy_count + count_delta
+    await db.execute(
+        update(Profile)
+        .where(Profile.user_id == author_id)
+        .values(
+            accuracy_sum=profile_sum,
+            accuracy_count=profile_count,
+            accuracy_score=cast(func.round(_average(profile_sum, profile_count)), Integer),
         )
     )
-    count = count_result.scalar_one() or 0
-    post_result = await db.execute(select(Post).where(Post.id == post_id))
-    post = post_result.scalar_one_or_none()
-    if post is None:
-        return
-    post.helpful_count = int(count)
-    await db.commit()
 
 
-async def _recompute_post_accuracy(db: AsyncSession, post_id: str) -> None:
-    avg_result = await db.execute(
-        select(func.avg(AccuracyFeedback.rating), func.count(AccuracyFeedback.id)).where(
-            AccuracyFeedback.post_id == post_id
+async def _reconcile_targets(db: AsyncSession, model, target_type: str, after: str, batch_size: int):
+    rows = (
+        await db.execute(
+            select(model.id, model.helpful_count).where(model.id > after).order_by(model.id).limit(batch_size)
         )
-    )
-    avg, count = avg_result.one()
-    post_result = await db.execute(select(Post).where(Post.id == post_id))
-    post = post_result.scalar_one_or_none()
-    if post is None:
-        return
-    post.accuracy_avg = float(avg or 0)
-    post.accuracy_count = int(count or 0)
-    await db.commit()
-
-
-async def _recompute_user_helpfulness(db: AsyncSession, user_id: str) -> None:
-    post_ids = select(Post.id).where(Post.author_id == user_id)
-    reply_ids = select(Reply.id).where(Reply.author_id == user_id)
-    count_result = await db.execute(
-        select(func.count(HelpfulnessVote.id)).where(
-            or_(
-                (HelpfulnessVote.target_type == "post") & (HelpfulnessVote.target_id.in_(post_ids)),
-                (HelpfulnessVote.target_type == "reply") & (HelpfulnessVote.target_id.in_(reply_ids)),
+    ).all()
+    if not rows:
+        return None, 0
+    ids = [row[0] for row in rows]
+    counts = dict(
+        (
+            await db.execute(
+                select(HelpfulnessVote.target_id, func.count(HelpfulnessVote.id))
+                .where(HelpfulnessVote.target_type == target_type, HelpfulnessVote.target_id.in_(ids))
+                .group_by(HelpfulnessVote.target_id)
             )
-        )
+        ).all()
     )
-    count = count_result.scalar_one() or 0
-    profile_result = await db.execute(select(Profile).where(Profile.user_id == user_id))
-    profile = profile_result.scalar_one_or_none()
-    if profile is None:
-        return
-    profile.helpfulness_score = int(count)
-    await db.commit()
+    repaired = 0
+    for target_id, helpful_count in rows:
+        expected = int(counts.get(target_id, 0))
+        if vote_buffer.pending(("helpful", target_type, target_id)):
+            # The vote row is already counted above; writing now would count its buffered delta twice.
+            continue
+        if helpful_count != expected:
+            await db.execute(update(model).where(model.id == target_id).values(helpful_count=expected))
+            if model is Post:
+                invalidate_post(db, target_id)
+            repaired += 1
+    return ids[-1], repaired
 
 
-async def _recompute_reply_author_helpfulness(db: AsyncSession, user_id: str) -> None:
-    await _recompute_user_helpfulness(db, user_id)
+async def _reconcile_post_accuracy(db: AsyncSession, after: str, batch_size: int):
+    rows = (
+        await db.execute(
+            select(Post.id, Post.accuracy_sum, Post.accuracy_count)
+            .where(Post.id > after)
+            .order_by(Post.id)
+            .limit(batch_size)
+        )
+    ).all()
+    if not rows:
+        return None, 0
+    ids = [row[0] for row in rows]
+    totals = {
+        post_id: (int(total or 0), int(count or 0))
+        for post_id, total, count in (
+            await db.execute(
+                select(AccuracyFeedback.post_id, func.sum(AccuracyFeedback.rating), func.count(AccuracyFeedback.id))
+                .where(AccuracyFeedback.post_id.in_(ids))
+                .group_by(AccuracyFeedback.post_id)
+            )
+        ).all()
+    }
+    repaired = 0
+    for post_id, accuracy_sum, accuracy_count in rows:
+        total, count = totals.get(post_id, (0, 0))
+        if (accuracy_sum, accuracy_count) != (total, count):
+            await db.execute(
+                update(Post)
+                .where(Post.id == post_id)
+                .values(accuracy_sum=total, accuracy_count=count, accuracy_avg=total / count if count else 0.0)
+            )
+            invalidate_post(db, post_id)
+            repaired += 1
+    return ids[-1], repaired
 
 
-async def _recompute_reply_helpful(db: AsyncSession, reply_id: str) -> None:
-    count_result = await db.execute(
-        select(func.count(HelpfulnessVote.id)).where(
-            HelpfulnessVote.target_type == "reply",
-            HelpfulnessVote.target_id == reply_id,
+async def _reconcile_profiles(db: AsyncSession, after: str, batch_size: int):
+    rows = (
+        await db.execute(
+            select(Profile.user_id, Profile.helpfulness_score, Profile.accuracy_sum, Profile.accuracy_count)
+            .where(Profile.user_id > after)
+            .order_by(Profile.user_id)
+            .limit(batch_size)
         )
-    )
-    count = count_result.scalar_one() or 0
-    reply_result = await db.execute(select(Reply).where(Reply.id == reply_id))
-    reply = reply_result.scalar_one_or_none()
-    if reply is None:
-        return
-    reply.helpful_count = int(count)
-    await db.commit()
+    ).all()
+    if not rows:
+        return None, 0
+    ids = [row[0] for row in rows]
+    helpful: dict[str, int] = {}
+    for model, target_type in ((Post, "post"), (Reply, "reply")):
+        result = await db.execute(
+            select(model.author_id, func.count(HelpfulnessVote.id))
+            .join(model, model.id == HelpfulnessVote.target_id)
+            .where(HelpfulnessVote.target_type == target_type, model.author_id.in_(ids))
+            .group_by(model.author_id)
+        )
+        for author_id, count in result.all():
+            helpful[author_id] = helpful.get(author_id, 0) + int(count)
+    accuracy = {
+        author_id: (int(total or 0), int(count or 0))
+        for author_id, total, count in (
+            await db.execute(
+                select(Post.author_id, func.sum(AccuracyFeedback.rating), func.count(AccuracyFeedback.id))
+                .join(Post, Post.id == AccuracyFeedback.post_id)
+                .where(Post.author_id.in_(ids))
+                .group_by(Post.author_id)
+            )
+        ).all()
+    }
+    repaired = 0
+    for user_id, helpfulness_score, accuracy_sum, accuracy_count in rows:
+        expected_helpful = helpful.get(user_id, 0)
+        total, count = accuracy.get(user_id, (0, 0))
+        if vote_buffer.pending(("author_helpful", user_id)):
+            continue
+        if (helpfulness_score, accuracy_sum, accuracy_count) != (expected_helpful, total, count):
+            await db.execute(
+                update(Profile)
+                .where(Profile.user_id == user_id)
+                .values(
+                    helpfulness_score=expected_helpful,
+                    accuracy_sum=total,
+                    accuracy_count=count,
+                    accuracy_score=int(total / count + 0.5) if count else 0,
+                )
+            )
+            repaired += 1
+    return ids[-1], repaired
 
 
-async def _recompute_user_accuracy(db: AsyncSession, user_id: str) -> None:
-    post_ids = select(Post.id).where(Post.author_id == user_id)
-    avg_result = await db.execute(
-        select(func.avg(AccuracyFeedback.rating)).where(AccuracyFeedback.post_id.in_(post_ids))
+async def reconcile_interaction_counters(db: AsyncSession, batch_size: int = 500) -> int:
+    passes = (
+        (_reconcile_targets, (Post, "post")),
+        (_reconcile_targets, (Reply, "reply")),
+        (_reconcile_post_accuracy, ()),
+        (_reconcile_profiles, ()),
     )
-    avg = avg_result.scalar_one() or 0
-    profile_result = await db.execute(select(Profile).where(Profile.user_id == user_id))
-    profile = profile_result.scalar_one_or_none()
-    if profile is None:
-        return
-    profile.accuracy_score = int(round(avg, 0))
-    await db.commit()
+    repaired = 0
+    for reconcile, args in passes:
+        after = ""
+        while after is not None:
+            # Buffered vote deltas are applied first and held back until the batch commits, so a recount
+            # never races a flush; targets voted on during the batch are skipped until the next pass.
+            async with vote_buffer.held():
+                after, fixed = await reconcile(db, *args, after, batch_size)
+                repaired += fixed
+                # One short transaction per batch keeps row locks brief on busy tables.
+                await db.commit()
+    return repaired
+
+
+async def _reconcile_job() -> None:
+    async with SessionLocal() as session:
+        repaired = await reconcile_interaction_counters(session, settings.counter_reconcile_batch_size)
+    if repaired:
+        logger.warning("Repaired %s drifted interaction counters", repaired)
+
 
+def start_counter_reconciliation() -> None:
+    start_periodic("counter_reconcile", settings.counter_reconcile_seconds, _reconcile_job)
@@ -6,9 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.errors import AppError
+from app.core.pagination import paginate
 from app.models.models import Appeal, ModerationAction, ModerationLog, Post, PostTranslation
 from app.services.ai_service import moderate_text_async
 from app.services.notification_service import create_notification
+from app.services.post_cache_service import invalidate_post
 from app.services.post_translation_service import enqueue_missing_post_translations
 
 
@@ -81,20 +83,25 @@ async def screen_post(db: AsyncSession, post: Post, title: str, content: str) ->
     return log
 
 
-async def list_logs(db: AsyncSession, limit: int, offset: int) -> list[ModerationLog]:
+async def list_logs(db: AsyncSession, limit: int, offset: int, cursor: str | None = None) -> list[ModerationLog]:
     result = await db.execute(
-        select(ModerationLog).order_by(ModerationLog.created_at.desc()).limit(limit).offset(offset)
+        paginate(select(ModerationLog), ModerationLog.created_at, ModerationLog.id, limit, offset, cursor)
     )
     return list(result.scalars().all())
 
 
-async def list_user_logs(db: AsyncSession, user_id: str, limit: int, offset: int) -> list[ModerationLog]:
+async def list_user_logs(
+    db: AsyncSession, user_id: str, limit: int, offset: int, cursor: str | None = None
+) -> list[ModerationLog]:
     result = await db.execute(
-        select(ModerationLog)
-        .where(ModerationLog.user_id == user_id)
-        .order_by(ModerationLog.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        paginate(
+            select(ModerationLog).where(ModerationLog.user_id == user_id),
+            ModerationLog.created_at,
+            ModerationLog.id,
+            limit,
+            offset,
+            cursor,
+        )
     )
     return list(result.scalars().all())
 
@@ -110,7 +117,7 @@ async def get_log(db: AsyncSession, log_id: str) -> ModerationLog:
 async def create_appeal(db: AsyncSession, user_id: str, target_type: str, target_id: str, reason: str) -> Appeal:
     appeal = Appeal(user_id=user_id, target_type=target_type, target_id=target_id, reason=reason)
     db.add(appeal)
-    await db.commit()
+    await db.flush()
     await db.refresh(appeal)
     return appeal
 
@@ -141,7 +148,7 @@ async def resolve_appeal(db: AsyncSession, appeal_id: str, reviewer_id: str, sta
     appeal.status = status
     appeal.reviewer_id = reviewer_id
     appeal.reviewed_at = datetime.now(timezone.utc)
-    await db.commit()
+    await db.flush()
     await db.refresh(appeal)
     await create_notification(
         db,
@@ -176,6 +183,7 @@ async def resolve_post_review(
         post.status = "hidden"
     else:
         raise AppError(code="invalid_action", message="Invalid action", status_code=400)
+    invalidate_post(db, post.id)
 
     db.add(
         ModerationAction(
@@ -186,7 +194,7 @@ async def resolve_post_review(
             reason=reason,
         )
     )
-    await db.commit()
+    await db.flush()
     await db.refresh(post)
     title_result = await db.execute(
         select(PostTranslation.title).where(
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import paginate
 from app.models.models import Notification
 
 
@@ -26,20 +27,47 @@ async def create_notification(
             return found
     notification = Notification(user_id=user_id, type=type_, payload=payload, dedupe_key=dedupe_key)
     db.add(notification)
-    await db.commit()
+    await db.flush()
     await db.refresh(notification)
     return notification
 
 
+async def add_notifications(
+    db: AsyncSession, notifications: list[tuple[str, str, dict | None, str | None]]
+) -> int:
+    keyed = [item for item in notifications if item[3]]
+    existing: set[tuple[str, str, str]] = set()
+    if keyed:
+        result = await db.execute(
+            select(Notification.user_id, Notification.type, Notification.dedupe_key).where(
+                Notification.user_id.in_({item[0] for item in keyed}),
+                Notification.dedupe_key.in_({item[3] for item in keyed}),
+            )
+        )
+        existing = {tuple(row) for row in result.all()}
+    added = 0
+    for user_id, type_, payload, dedupe_key in notifications:
+        if dedupe_key:
+            if (user_id, type_, dedupe_key) in existing:
+                continue
+            existing.add((user_id, type_, dedupe_key))
+        db.add(Notification(user_id=user_id, type=type_, payload=payload, dedupe_key=dedupe_key))
+        added += 1
+    return added
+
+
 async def list_notifications(
-    db: AsyncSession, user_id: str, limit: int, offset: int
+    db: AsyncSession, user_id: str, limit: int, offset: int, cursor: str | None = None
 ) -> list[Notification]:
     result = await db.execute(
-        select(Notification)
-        .where(Notification.user_id == user_id)
-        .order_by(Notification.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        paginate(
+            select(Notification).where(Notification.user_id == user_id),
+            Notification.created_at,
+            Notification.id,
+            limit,
+            offset,
+            cursor,
+        )
     )
     return list(result.scalars().all())
 
@@ -52,7 +80,7 @@ async def mark_read(db: AsyncSession, user_id: str, ids: list[str]) -> None:
     now = datetime.now(timezone.utc)
     for item in items:
         item.read_at = now
-    await db.commit()
+    await db.flush()
 
 
 async def mark_all_read(db: AsyncSession, user_id: str) -> None:
@@ -61,5 +89,5 @@ async def mark_all_read(db: AsyncSession, user_id: str) -> None:
     now = datetime.now(timezone.utc)
     for item in items:
         item.read_at = now
-    await db.commit()
+    await db.flush()
 
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+import sys
+from typing import Hashable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+
+_PENDING_KEY = "post_cache_invalidations"
+
+
+def _payload_size(payload: dict) -> int:
+    size = sys.getsizeof(payload)
+    for value in payload.values():
+        size += sys.getsizeof(value)
+        if isinstance(value, list):
+            size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+class PostCache:
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[str, str], tuple[Hashable, dict, int]] = OrderedDict()
+        self._languages: dict[str, set[str]] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def generation(self, post_id: str) -> tuple[int, int]:
+        return self._epoch, self._generations.get(post_id, 0)
+
+    def get(self, post_id: str, language: str, version: Hashable) -> dict | None:
+        entry = self._entries.get((post_id, language))
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((post_id, language))
+        self.hits += 1
+        return dict(entry[1])
+
+    def put(self, post_id: str, language: str, version: Hashable, payload: dict, generation: tuple[int, int]) -> None:
+        if settings.post_cache_size <= 0 or generation != self.generation(post_id):
+            # Invalidated while this payload was being hydrated; it may already be stale.
+            return
+        size = _payload_size(payload)
+        if size > settings.post_cache_max_bytes:
+            return
+        self._discard((post_id, language))
+        self._entries[(post_id, language)] = (version, dict(payload), size)
+        self._languages.setdefault(post_id, set()).add(language)
+        self.bytes += size
+        while self._entries and (
+            len(self._entries) > settings.post_cache_size or self.bytes > settings.post_cache_max_bytes
+        ):
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, post_id: str) -> None:
+        for language in list(self._languages.get(post_id, ())):
+            self._discard((post_id, language))
+        if len(self._generations) >= max(settings.post_cache_size, 1) * 4:
+            self._generations.clear()
+            self._epoch += 1
+        self._generations[post_id] = self._generations.get(post_id, 0) + 1
+        self.invalidations += 1
+
+    def invalidate_author(self, author_id: str) -> None:
+        post_ids = {key[0] for key, entry in self._entries.items() if entry[1]["author_id"] == author_id}
+        for post_id in post_ids:
+            self.invalidate(post_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._languages.clear()
+        self._generations.clear()
+        self._epoch += 1
+        self.bytes = 0
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_entries": settings.post_cache_size,
+            "max_bytes": settings.post_cache_max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _discard(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.bytes -= entry[2]
+        languages = self._languages.get(key[0])
+        if languages is not None:
+            languages.discard(key[1])
+            if not languages:
+                del self._languages[key[0]]
+
+
+post_cache = PostCache()
+
+
+def _apply(item: tuple[str, str | None]) -> None:
+    kind, target_id = item
+    if kind == "post":
+        post_cache.invalidate(target_id)
+    elif kind == "author":
+        post_cache.invalidate_author(target_id)
+    else:
+        post_cache.clear()
+
+
+def _defer(db: AsyncSession, item: tuple[str, str | None]) -> None:
+    # Drop now, and again after commit so a reader that saw the old rows meanwhile cannot re-cache them.
+    _apply(item)
+    db.sync_session.info.setdefault(_PENDING_KEY, set()).add(item)
+
+
+def invalidate_post(db: AsyncSession, post_id: str) -> None:
+    _defer(db, ("post", post_id))
+
+
+def invalidate_author_posts(db: AsyncSession, author_id: str) -> None:
+    _defer(db, ("author", author_id))
+
+
+def invalidate_all_posts(db: AsyncSession) -> None:
+    _defer(db, ("all", None))
+
+
+def _invalidate_committed(session: Session) -> None:
+    for item in session.info.pop(_PENDING_KEY, ()):
+        _apply(item)
+
+
+def _discard_invalidations(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_post_cache_invalidation() -> None:
+    if not event.contains(Session, "after_commit", _invalidate_committed):
+        event.listen(Session, "after_commit", _invalidate_committed)
+        event.listen(Session, "after_soft_rollback", _discard_invalidations)
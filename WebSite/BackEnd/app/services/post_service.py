@@ -1,20 +1,67 @@
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.auth import Principal
 from app.core.config import settings
+from app.core.database import commit_now
 from app.core.errors import AppError
-from app.models.models import Category, Post, PostTag, PostTranslation, Profile, Tag, User
+from app.core.http_cache import latest
+from app.core.pagination import paginate
+from app.core.singleflight import SingleFlight
+from app.models.models import (
+    AccuracyFeedback,
+    Category,
+    Post,
+    PostTag,
+    PostTranslation,
+    PostTrendingScore,
+    PostView,
+    Profile,
+    Reply,
+    ReplyTranslation,
+    SavedPost,
+    Tag,
+)
 from app.services.notification_service import create_notification
+from app.services.post_cache_service import invalidate_all_posts, invalidate_post, post_cache
 from app.schemas.post import PostCreateRequest, PostUpdateRequest
 from app.services.moderation_service import screen_post
 from app.services.post_translation_service import (
     enqueue_missing_post_translations,
-    ensure_pending_post_translation,
+    note_missing_post_translation,
 )
 
 
+@dataclass(frozen=True, slots=True)
+class PostVersion:
+    # Row version counters identify the content; the timestamps only feed Last-Modified.
+    version: int
+    updated_at: datetime | None
+    status: str
+    category_id: str | None
+    helpful_count: int
+    accuracy_count: int
+    accuracy_avg: float
+    translation_version: int | None
+    translation_updated_at: datetime | None
+    translation_status: str | None
+    original_version: int | None
+    original_updated_at: datetime | None
+    author_version: int | None
+    author_updated_at: datetime | None
+
+    @property
+    def last_modified(self) -> datetime | None:
+        return latest(self.updated_at, self.translation_updated_at, self.original_updated_at, self.author_updated_at)
+
+
+post_flight = SingleFlight("post_detail")
+
+
 def _languages() -> list[str]:
     return [lang.strip() for lang in settings.supported_languages.split(",") if lang.strip()]
 
@@ -67,7 +114,7 @@ async def create_post(db: AsyncSession, author_id: str, payload: PostCreateReque
     if payload.tags:
         await _apply_tags(db, post.id, payload.tags)
 
-    await db.commit()
+    await db.flush()
     await db.refresh(post)
     return post
 
@@ -90,6 +137,10 @@ async def update_post(
         if payload.status == "published" and post.published_at is None:
             post.published_at = datetime.now(timezone.utc)
 
+    if payload.tags is not None:
+        await _apply_tags(db, post.id, payload.tags)
+        post.updated_at = datetime.now(timezone.utc)
+
     if payload.title is not None or payload.content is not None:
         translation_result = await db.execute(
             select(PostTranslation).where(
@@ -105,12 +156,9 @@ async def update_post(
         if payload.content is not None:
             original.content = payload.content
 
-        if payload.tags is not None:
-            await _apply_tags(db, post.id, payload.tags)
-
         if post.status == "published":
             content_for_ai = _extract_editorjs_text(original.content)
-            await db.commit()
+            await commit_now(db)
             await screen_post(db, post, original.title, content_for_ai)
             if post.status == "published":
                 await _translate_missing(
@@ -122,7 +170,8 @@ async def update_post(
                     reset_existing=True,
                 )
 
-    await db.commit()
+    invalidate_post(db, post.id)
+    await db.flush()
     await db.refresh(post)
     return post
 
@@ -134,8 +183,14 @@ async def delete_post(db: AsyncSession, post_id: str, author_id: str, is_admin:
         raise AppError(code="post_not_found", message="Post not found", status_code=404)
     if post.author_id != author_id and not is_admin:
         raise AppError(code="forbidden", message="Not allowed", status_code=403)
+    # Child rows reference posts without ON DELETE CASCADE; remove them first so enforced foreign keys hold.
+    reply_ids = select(Reply.id).where(Reply.post_id == post_id)
+    await db.execute(ReplyTranslation.__table__.delete().where(ReplyTranslation.reply_id.in_(reply_ids)))
+    for model in (Reply, PostTranslation, PostTag, PostView, AccuracyFeedback, SavedPost, PostTrendingScore):
+        await db.execute(model.__table__.delete().where(model.post_id == post_id))
     await db.delete(post)
-    await db.commit()
+    invalidate_post(db, post_id)
+    await db.flush()
 
 
 async def list_posts(
@@ -145,18 +200,81 @@ async def list_posts(
     offset: int,
     author_id: str | None = None,
     include_hidden: bool = False,
+    cursor: str | None = None,
 ) -> list[dict]:
+    rows = await list_post_versions(
+        db, language, limit, offset, author_id=author_id, include_hidden=include_hidden, cursor=cursor
+    )
+    return await hydrate_posts(db, [post for post, _ in rows], language)
+
+
+async def list_post_versions(
+    db: AsyncSession,
+    language: str,
+    limit: int,
+    offset: int,
+    author_id: str | None = None,
+    include_hidden: bool = False,
+    cursor: str | None = None,
+) -> list[tuple[Post, PostVersion]]:
     stmt = select(Post)
     if not include_hidden:
         stmt = stmt.where(Post.status == "published")
     if author_id:
         stmt = stmt.where(Post.author_id == author_id)
-    result = await db.execute(stmt.order_by(Post.created_at.desc()).limit(limit).offset(offset))
-    posts = result.scalars().all()
-    return [await _to_response(db, post, language) for post in posts]
+    result = await db.execute(_with_versions(paginate(stmt, Post.created_at, Post.id, limit, offset, cursor), language))
+    return [(row[0], _post_version(*row)) for row in result.all()]
+
+
+def _with_versions(stmt, language: str):
+    # Unique (post_id, language) and profile primary key joins: one row per post, no content columns.
+    requested = aliased(PostTranslation)
+    original = aliased(PostTranslation)
+    return (
+        stmt.add_columns(
+            requested.version,
+            requested.updated_at,
+            requested.status,
+            original.version,
+            original.updated_at,
+            Profile.version,
+            Profile.updated_at,
+        )
+        .outerjoin(requested, and_(requested.post_id == Post.id, requested.language == language))
+        .outerjoin(original, and_(original.post_id == Post.id, original.language == Post.original_language))
+        .outerjoin(Profile, Profile.user_id == Post.author_id)
+    )
+
+
+def _post_version(
+    post: Post,
+    translation_version: int | None,
+    translation_updated_at: datetime | None,
+    translation_status: str | None,
+    original_version: int | None,
+    original_updated_at: datetime | None,
+    author_version: int | None,
+    author_updated_at: datetime | None,
+) -> PostVersion:
+    return PostVersion(
+        version=post.version,
+        updated_at=post.updated_at,
+        status=post.status,
+        category_id=post.category_id,
+        helpful_count=post.helpful_count,
+        accuracy_count=post.accuracy_count,
+        accuracy_avg=post.accuracy_avg,
+        translation_version=translation_version,
+        translation_updated_at=translation_updated_at,
+        translation_status=translation_status,
+        original_version=original_version,
+        original_updated_at=original_updated_at,
+        author_version=author_version,
+        author_updated_at=author_updated_at,
+    )
 
 
-def _can_view_post(post: Post, user: User | None) -> bool:
+def _can_view_post(post: Post, user: Principal | None) -> bool:
     if post.status == "published":
         return True
     if user and (user.id == post.author_id or user.role == "admin"):
@@ -165,27 +283,47 @@ def _can_view_post(post: Post, user: User | None) -> bool:
 
 
 async def list_user_posts(
-    db: AsyncSession, user_id: str, language: str, limit: int, offset: int
+    db: AsyncSession, user_id: str, language: str, limit: int, offset: int, cursor: str | None = None
 ) -> list[dict]:
     result = await db.execute(
-        select(Post)
-        .where(Post.author_id == user_id)
-        .order_by(Post.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        paginate(select(Post).where(Post.author_id == user_id), Post.created_at, Post.id, limit, offset, cursor)
     )
-    posts = result.scalars().all()
-    return [await _to_response(db, post, language) for post in posts]
+    posts = list(result.scalars().all())
+    return await _to_responses(db, posts, language)
 
 
-async def get_post(db: AsyncSession, post_id: str, language: str, user: User | None = None) -> dict:
-    result = await db.execute(select(Post).where(Post.id == post_id))
-    post = result.scalar_one_or_none()
-    if post is None:
-        raise AppError(code="post_not_found", message="Post not found", status_code=404)
-    if not _can_view_post(post, user):
+async def get_post(db: AsyncSession, post_id: str, language: str, user: Principal | None = None) -> dict:
+    post, version = await get_post_version(db, post_id, language, user)
+    return await hydrate_post(db, post, language, version)
+
+
+async def get_post_version(
+    db: AsyncSession, post_id: str, language: str, user: Principal | None = None
+) -> tuple[Post, PostVersion]:
+    result = await db.execute(_with_versions(select(Post).where(Post.id == post_id), language))
+    row = result.one_or_none()
+    if row is None or not _can_view_post(row[0], user):
         raise AppError(code="post_not_found", message="Post not found", status_code=404)
-    return await _to_response(db, post, language)
+    return row[0], _post_version(*row)
+
+
+async def hydrate_post(db: AsyncSession, post: Post, language: str, version: PostVersion) -> dict:
+    cached = post_cache.get(post.id, language, version)
+    if cached is not None:
+        return cached
+
+    async def _hydrate() -> dict:
+        generation = post_cache.generation(post.id)
+        response = await _to_response(db, post, language)
+        post_cache.put(post.id, language, version, response, generation)
+        return response
+
+    # Callers that observed the same version would build the same payload, whichever session they hold.
+    return dict(await post_flight.do((post.id, language, version), _hydrate))
+
+
+async def hydrate_posts(db: AsyncSession, posts: list[Post], language: str) -> list[dict]:
+    return await _to_responses(db, posts, language)
 
 
 async def set_post_visibility(
@@ -204,7 +342,8 @@ async def set_post_visibility(
         post.published_at = datetime.now(timezone.utc)
     if status == "published":
         await _translate_missing(db, post.id, post.original_language, "", "")
-    await db.commit()
+    invalidate_post(db, post.id)
+    await db.flush()
     await db.refresh(post)
     return post
 
@@ -224,11 +363,12 @@ async def publish_post(db: AsyncSession, post_id: str) -> Post:
     if original is None:
         raise AppError(code="post_translation_missing", message="Original translation missing", status_code=500)
     content_for_ai = _extract_editorjs_text(original.content)
-    await db.commit()
+    await commit_now(db)
     await screen_post(db, post, original.title, content_for_ai)
     if post.status == "published":
         await _translate_missing(db, post.id, post.original_language, original.title, content_for_ai)
-    await db.commit()
+    invalidate_post(db, post.id)
+    await db.flush()
     await db.refresh(post)
     return post
 
@@ -245,44 +385,68 @@ async def _translate_missing(
 
 
 async def _to_response(db: AsyncSession, post: Post, language: str) -> dict:
+    responses = await _to_responses(db, [post], language)
+    return responses[0]
+
+
+async def _to_responses(db: AsyncSession, posts: list[Post], language: str) -> list[dict]:
+    if not posts:
+        return []
+    post_ids = [post.id for post in posts]
+    wanted_languages = {language} | {post.original_language for post in posts}
     translation_result = await db.execute(
         select(PostTranslation).where(
-            PostTranslation.post_id == post.id,
-            PostTranslation.language == language,
+            PostTranslation.post_id.in_(post_ids),
+            PostTranslation.language.in_(wanted_languages),
         )
     )
-    requested_translation = translation_result.scalar_one_or_none()
+    translations: dict[tuple[str, str], PostTranslation] = {
+        (item.post_id, item.language): item for item in translation_result.scalars().all()
+    }
+
+    # GETs stay read-only: missing translations are only noted, and a background flush enqueues them.
+    for post in posts:
+        if language != post.original_language and (post.id, language) not in translations:
+            note_missing_post_translation(post.id, language)
+
+    tag_result = await db.execute(
+        select(PostTag.post_id, Tag.slug)
+        .join(Tag, Tag.id == PostTag.tag_id)
+        .where(PostTag.post_id.in_(post_ids))
+    )
+    tags_by_post: dict[str, list[str]] = {}
+    for post_id, slug in tag_result.all():
+        tags_by_post.setdefault(post_id, []).append(slug)
+
+    author_ids = {post.author_id for post in posts}
+    author_result = await db.execute(
+        select(Profile.user_id, Profile.display_name).where(Profile.user_id.in_(author_ids))
+    )
+    author_names = {user_id: display_name for user_id, display_name in author_result.all()}
+
+    return [
+        _build_response(post, language, translations, tags_by_post.get(post.id, []), author_names.get(post.author_id))
+        for post in posts
+    ]
+
+
+def _build_response(
+    post: Post,
+    language: str,
+    translations: dict[tuple[str, str], PostTranslation],
+    tags: list[str],
+    author_name: str | None,
+) -> dict:
+    requested_translation = translations.get((post.id, language))
     translation = requested_translation
     if translation is not None and (translation.status != "ready" or not translation.content):
         translation = None
     if translation is None:
-        if language in _languages() and language != post.original_language:
-            if requested_translation is None:
-                await ensure_pending_post_translation(db, post.id, language)
-        if translation is None:
-            fallback_result = await db.execute(
-                select(PostTranslation).where(
-                    PostTranslation.post_id == post.id,
-                    PostTranslation.language == post.original_language,
-                )
-            )
-            translation = fallback_result.scalar_one_or_none()
+        translation = translations.get((post.id, post.original_language))
     if translation is None:
         raise AppError(code="post_translation_missing", message="Translation missing", status_code=500)
     translation_status = "ready" if requested_translation is not None and requested_translation.status == "ready" else "pending"
 
-    tag_result = await db.execute(
-        select(Tag.slug)
-        .join(PostTag, Tag.id == PostTag.tag_id)
-        .where(PostTag.post_id == post.id)
-    )
-    tags = [row[0] for row in tag_result.all()]
-
-    author_result = await db.execute(
-        select(Profile.display_name).where(Profile.user_id == post.author_id)
-    )
-    author_name = author_result.scalar_one_or_none()
-
     return {
         "id": post.id,
         "author_id": post.author_id,
@@ -320,7 +484,7 @@ async def process_post_submission(db: AsyncSession, post_id: str) -> None:
     if original is None:
         raise AppError(code="post_translation_missing", message="Original translation missing", status_code=500)
 
-    await db.commit()
+    await commit_now(db)
     await screen_post(db, post, original.title, original.content)
     if post.status == "published":
         await _translate_missing(db, post.id, post.original_language, original.title, original.content)
@@ -331,7 +495,8 @@ async def process_post_submission(db: AsyncSession, post_id: str) -> None:
             {"post_id": post.id, "post_title": original.title, "status": "published"},
             dedupe_key=f"post_published:{post.id}",
         )
-    await db.commit()
+    invalidate_post(db, post.id)
+    await db.flush()
 
 
 async def _apply_tags(db: AsyncSession, post_id: str, tag_slugs: list[str]) -> None:
@@ -354,6 +519,17 @@ async def _apply_tags(db: AsyncSession, post_id: str, tag_slugs: list[str]) -> N
         db.add(PostTag(post_id=post_id, tag_id=tags[slug].id))
 
 
+async def touch_tagged_posts(db: AsyncSession, tag_id: str) -> None:
+    # Post responses carry tag slugs, so renaming or deleting a tag is a new version of every post using it.
+    await db.execute(
+        update(Post)
+        .where(Post.id.in_(select(PostTag.post_id).where(PostTag.tag_id == tag_id)))
+        .values(updated_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+    invalidate_all_posts(db)
+
+
 async def _validate_category(db: AsyncSession, category_id: str) -> None:
     result = await db.execute(select(Category).where(Category.id == category_id))
     category = result.scalar_one_or_none()
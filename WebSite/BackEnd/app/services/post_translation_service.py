@@ -1,22 +1,32 @@
 from datetime import datetime, timedelta, timezone
 import logging
+from typing import Callable
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, event, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.coalescing import CoalescingBuffer
 from app.core.config import settings
-from app.core.database import engine
+from app.core.database import SessionLocal, engine
 from app.models.base import Base
 from app.models.models import Post, PostTranslation, Profile, Reply, ReplyTranslation, TranslationJob
+from app.services.post_cache_service import invalidate_post
 from app.services.ai_service import (
+    translate_content_multi_async,
     translate_content_preserving_structure_async,
     translate_post_async,
+    translate_post_multi_async,
 )
 
 
 logger = logging.getLogger(__name__)
 
 RETRY_DELAYS = (timedelta(minutes=1), timedelta(minutes=5), timedelta(minutes=30))
+JOB_CHANNEL = "translation_jobs"
+_ENQUEUED_KEY = "translation_jobs_enqueued"
+
+_wakeups: list[Callable[[], None]] = []
 
 
 def _languages() -> list[str]:
@@ -67,7 +77,9 @@ async def enqueue_missing_post_translations(
             created += 1
 
     if created:
+        invalidate_post(db, post_id)
         await db.flush()
+        await notify_translation_workers(db)
     return created
 
 
@@ -106,15 +118,118 @@ async def enqueue_reply_translations(
 
     if created:
         await db.flush()
+        await notify_translation_workers(db)
+    return created
+
+
+async def enqueue_missing_post_translations_batch(db: AsyncSession, post_ids: set[str]) -> int:
+    if not post_ids:
+        return 0
+    result = await db.execute(
+        select(Post.id, Post.original_language).where(Post.id.in_(post_ids), Post.status == "published")
+    )
+    originals = dict(result.all())
+    if not originals:
+        return 0
+    result = await db.execute(
+        select(PostTranslation.post_id, PostTranslation.language, PostTranslation.status, PostTranslation.content != "")
+        .where(PostTranslation.post_id.in_(originals))
+    )
+    translations = {(post_id, language): (status, has_content) for post_id, language, status, has_content in result.all()}
+    result = await db.execute(
+        select(TranslationJob).where(TranslationJob.target_type == "post", TranslationJob.target_id.in_(originals))
+    )
+    jobs = {(job.target_id, job.language): job for job in result.scalars().all()}
+
+    created = 0
+    for post_id, original_language in originals.items():
+        changed = False
+        for language in _languages():
+            if language == original_language:
+                continue
+            translation = translations.get((post_id, language))
+            if translation is None:
+                db.add(
+                    PostTranslation(
+                        post_id=post_id,
+                        language=language,
+                        title="",
+                        content="",
+                        status="pending",
+                        translated_by="ai",
+                        model=settings.openai_model,
+                    )
+                )
+                changed = True
+            elif translation == ("ready", True):
+                continue
+            job = jobs.get((post_id, language))
+            if job is None:
+                db.add(_new_job("post", post_id, language))
+                changed = True
+            elif _revive_job(job, reset=False):
+                changed = True
+        if changed:
+            invalidate_post(db, post_id)
+            created += 1
+    if created:
+        await db.flush()
+        await notify_translation_workers(db)
     return created
 
 
-async def ensure_pending_post_translation(db: AsyncSession, post_id: str, language: str) -> None:
+async def notify_translation_workers(db: AsyncSession) -> None:
+    connection = await db.connection()
+    if connection.dialect.name == "postgresql":
+        # NOTIFY is transactional: listeners hear it only once the new jobs are committed.
+        await db.execute(text(f"NOTIFY {JOB_CHANNEL}"))
+    db.sync_session.info[_ENQUEUED_KEY] = True
+
+
+def _wake_committed(session: Session) -> None:
+    if session.info.pop(_ENQUEUED_KEY, False):
+        for wakeup in _wakeups:
+            wakeup()
+
+
+def _discard_wakeup(session: Session, _previous_transaction) -> None:
+    session.info.pop(_ENQUEUED_KEY, None)
+
+
+def register_translation_wakeup(wakeup: Callable[[], None]) -> None:
+    # In-process wake-up for workers sharing the app's process (and for SQLite, which has no NOTIFY).
+    if not event.contains(Session, "after_commit", _wake_committed):
+        event.listen(Session, "after_commit", _wake_committed)
+        event.listen(Session, "after_soft_rollback", _discard_wakeup)
+    _wakeups.append(wakeup)
+
+
+def unregister_translation_wakeup(wakeup: Callable[[], None]) -> None:
+    if wakeup in _wakeups:
+        _wakeups.remove(wakeup)
+
+
+def note_missing_post_translation(post_id: str, language: str) -> None:
     if language not in _languages():
         return
-    if await _get_post_translation(db, post_id, language) is None:
-        await enqueue_missing_post_translations(db, post_id)
+    translation_demand.add(post_id, 1)
+
+
+async def _flush_translation_demand(demand: dict, _items: list) -> None:
+    async with SessionLocal() as db:
+        created = await enqueue_missing_post_translations_batch(db, set(demand))
         await db.commit()
+    if created:
+        logger.info("Enqueued translations for %s posts from read demand", created)
+
+
+# Readers only record which posts lack a translation; jobs are upserted off the request path in one batch.
+translation_demand = CoalescingBuffer(
+    "translation_demand",
+    _flush_translation_demand,
+    settings.translation_demand_flush_ms,
+    settings.translation_demand_max_events,
+)
 
 
 async def ensure_pending_reply_translation(db: AsyncSession, reply_id: str, language: str) -> None:
@@ -122,82 +237,231 @@ async def ensure_pending_reply_translation(db: AsyncSession, reply_id: str, lang
         return
     if await _get_reply_translation(db, reply_id, language) is None:
         await enqueue_reply_translations(db, reply_id)
-        await db.commit()
 
 
 async def process_next_post_translation(db: AsyncSession) -> bool:
     return await process_next_translation_job(db)
 
 
-async def process_next_translation_job(db: AsyncSession) -> bool:
+async def process_next_translation_job(db: AsyncSession, worker_id: str = "inline") -> bool:
+    job_ids = await claim_translation_jobs(db, worker_id)
+    if not job_ids:
+        return False
+    await run_translation_jobs(db, job_ids, worker_id)
+    return True
+
+
+async def claim_translation_jobs(db: AsyncSession, worker_id: str) -> list[str]:
     now = datetime.now(timezone.utc)
-    result = await db.execute(
-        select(TranslationJob)
-        .where(
-            TranslationJob.status == "pending",
-            or_(TranslationJob.next_run_at.is_(None), TranslationJob.next_run_at <= now),
-        )
+    due = and_(
+        TranslationJob.status == "pending",
+        or_(TranslationJob.next_run_at.is_(None), TranslationJob.next_run_at <= now),
+    )
+    first = (
+        select(TranslationJob.id, TranslationJob.target_type, TranslationJob.target_id)
+        .where(due)
         .order_by(TranslationJob.created_at.asc())
         .limit(1)
     )
-    job = result.scalar_one_or_none()
-    if job is None:
-        return False
-
-    job.status = "processing"
-    job.locked_at = now
+    claim = update(TranslationJob).values(status="processing", locked_at=now, locked_by=worker_id)
+    connection = await db.connection()
+    postgres = connection.dialect.name == "postgresql"
+    target = None
+    if postgres:
+        # Concurrent workers skip rows another transaction is claiming instead of queueing behind it.
+        result = await db.execute(
+            claim.where(
+                TranslationJob.id == first.with_only_columns(TranslationJob.id)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            .returning(TranslationJob.target_type, TranslationJob.target_id)
+            .execution_options(synchronize_session=False)
+        )
+        target = result.one_or_none()
+    else:
+        for _ in range(settings.translation_claim_attempts):
+            candidate = (await db.execute(first)).one_or_none()
+            if candidate is None:
+                break
+            # Guarded update: only one worker can move the row out of "pending".
+            result = await db.execute(
+                claim.where(TranslationJob.id == candidate.id, TranslationJob.status == "pending")
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 1:
+                target = (candidate.target_type, candidate.target_id)
+                break
+            await db.commit()
+    if target is None:
+        await db.commit()
+        return []
+
+    target_type, target_id = target
+    extra = settings.translation_batch_max_languages - 1
+    if extra > 0:
+        # Take the target's other due languages too, so one model call covers all of them.
+        siblings = (
+            select(TranslationJob.id)
+            .where(due, TranslationJob.target_type == target_type, TranslationJob.target_id == target_id)
+            .order_by(TranslationJob.language.asc())
+            .limit(extra)
+        )
+        if postgres:
+            siblings = siblings.with_for_update(skip_locked=True)
+        await db.execute(
+            claim.where(TranslationJob.id.in_(siblings), TranslationJob.status == "pending")
+            .execution_options(synchronize_session=False)
+        )
+    result = await db.execute(
+        select(TranslationJob.id).where(
+            TranslationJob.target_type == target_type,
+            TranslationJob.target_id == target_id,
+            TranslationJob.status == "processing",
+            TranslationJob.locked_by == worker_id,
+        )
+    )
+    job_ids = list(result.scalars().all())
     await db.commit()
+    return job_ids
+
 
-    job_id = job.id
+async def run_translation_jobs(db: AsyncSession, job_ids: list[str], worker_id: str) -> None:
+    target_type = None
     try:
-        result = await db.execute(select(TranslationJob).where(TranslationJob.id == job_id))
-        job = result.scalar_one_or_none()
-        if job is None:
-            return True
-        if job.target_type == "post":
-            await _process_post_job(db, job)
-        elif job.target_type == "reply":
-            await _process_reply_job(db, job)
+        result = await db.execute(select(TranslationJob).where(TranslationJob.id.in_(job_ids)))
+        jobs = list(result.scalars().all())
+        if not jobs:
+            return
+        target_type = jobs[0].target_type
+        target_id = jobs[0].target_id
+        languages = [job.language for job in jobs]
+        if target_type == "post":
+            translated = await _translate_post(db, target_id, languages)
+        elif target_type == "reply":
+            translated = await _translate_reply(db, target_id, languages)
         else:
-            raise ValueError(f"Unsupported translation target: {job.target_type}")
-        if job.status == "processing":
-            job.status = "completed"
-            job.completed_at = datetime.now(timezone.utc)
-        job.last_error = None
+            raise ValueError(f"Unsupported translation target: {target_type}")
+
+        held = await _held_leases(db, job_ids, worker_id)
+        if len(held) < len(jobs):
+            # Those leases expired and another worker reclaimed the jobs; its results win.
+            logger.warning("Lost lease on %s translation jobs for %s %s", len(jobs) - len(held), target_type, target_id)
+            jobs = [job for job in jobs if job.id in held]
+        if translated is not None:
+            translated = {job.language: translated[job.language] for job in jobs if job.language in translated}
+            if target_type == "post":
+                applied = await _apply_post_translations(db, target_id, translated)
+            else:
+                applied = await _apply_reply_translations(db, target_id, translated)
+            if not applied:
+                translated = None
+
+        outcomes: dict[str, list[str]] = {"completed": [], "skipped": []}
+        missing = []
+        for job in jobs:
+            if translated is None:
+                outcomes["skipped"].append(job.id)
+            elif job.language in translated:
+                outcomes["completed"].append(job.id)
+            else:
+                missing.append(job.id)
+        finished = 0
+        for status, ids in outcomes.items():
+            if ids:
+                finished += await _finish_jobs(db, ids, worker_id, status)
+        if finished < sum(len(ids) for ids in outcomes.values()):
+            # A lease was reclaimed after the check above; drop our writes so the new owner's results win.
+            await db.rollback()
+            logger.warning("Lost lease before commit on translation jobs for %s %s", target_type, target_id)
+            return
         await db.commit()
-        return True
+        for job_id in missing:
+            await _schedule_retry(db, job_id, worker_id, ValueError("Language missing from batch translation"))
     except Exception as exc:
         logger.exception(
             "Translation job failed",
-            extra={"job_id": job_id, "target_type": getattr(job, "target_type", None)},
+            extra={"job_ids": job_ids, "target_type": target_type},
         )
         await db.rollback()
-        await _schedule_retry(db, job_id, exc)
-        return True
+        for job_id in job_ids:
+            await _schedule_retry(db, job_id, worker_id, exc)
 
 
-async def reset_stale_processing_translations(db: AsyncSession) -> None:
-    stale_before = datetime.now(timezone.utc) - timedelta(minutes=15)
+async def renew_translation_lease(db: AsyncSession, job_ids: list[str], worker_id: str) -> bool:
     result = await db.execute(
-        select(TranslationJob).where(
+        update(TranslationJob)
+        .where(
+            TranslationJob.id.in_(job_ids),
+            TranslationJob.status == "processing",
+            TranslationJob.locked_by == worker_id,
+        )
+        .values(locked_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+
+async def release_translation_jobs(db: AsyncSession, job_ids: list[str], worker_id: str) -> None:
+    await db.execute(
+        update(TranslationJob)
+        .where(
+            TranslationJob.id.in_(job_ids),
+            TranslationJob.status == "processing",
+            TranslationJob.locked_by == worker_id,
+        )
+        .values(status="pending", locked_at=None, locked_by=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+async def _finish_jobs(db: AsyncSession, job_ids: list[str], worker_id: str, status: str) -> int:
+    # Guarded by lease ownership in the same statement that records the outcome.
+    values = {"status": status, "locked_by": None, "last_error": None}
+    if status == "completed":
+        values["completed_at"] = datetime.now(timezone.utc)
+    result = await db.execute(
+        update(TranslationJob)
+        .where(
+            TranslationJob.id.in_(job_ids),
+            TranslationJob.status == "processing",
+            TranslationJob.locked_by == worker_id,
+        )
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def _held_leases(db: AsyncSession, job_ids: list[str], worker_id: str) -> set[str]:
+    result = await db.execute(
+        select(TranslationJob.id).where(TranslationJob.id.in_(job_ids), TranslationJob.locked_by == worker_id)
+    )
+    return set(result.scalars().all())
+
+
+async def reset_stale_processing_translations(db: AsyncSession) -> int:
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.translation_lease_seconds)
+    result = await db.execute(
+        update(TranslationJob)
+        .where(
             TranslationJob.status == "processing",
             or_(TranslationJob.locked_at.is_(None), TranslationJob.locked_at <= stale_before),
         )
+        .values(status="pending", locked_at=None, locked_by=None)
+        .execution_options(synchronize_session=False)
     )
-    rows = result.scalars().all()
-    for row in rows:
-        row.status = "pending"
-        row.locked_at = None
-    if rows:
-        await db.commit()
+    await db.commit()
+    return result.rowcount
 
 
-async def _process_post_job(db: AsyncSession, job: TranslationJob) -> None:
-    result = await db.execute(select(Post).where(Post.id == job.target_id))
+async def _translate_post(db: AsyncSession, post_id: str, languages: list[str]) -> dict[str, tuple[str, str]] | None:
+    result = await db.execute(select(Post).where(Post.id == post_id))
     post = result.scalar_one_or_none()
     if post is None or post.status != "published":
-        job.status = "skipped"
-        return
+        return None
 
     source = await _get_post_translation(db, post.id, post.original_language)
     if source is None:
@@ -206,97 +470,115 @@ async def _process_post_job(db: AsyncSession, job: TranslationJob) -> None:
     source_title = source.title
     source_content = source.content
     source_language = post.original_language
-    target_language = job.language
-    post_id = post.id
     await db.commit()
 
-    translated_title, translated_content = await translate_post_async(
-        source_title,
-        source_content,
-        source_language,
-        target_language,
-    )
+    if len(languages) == 1:
+        return {languages[0]: await translate_post_async(source_title, source_content, source_language, languages[0])}
+    return await translate_post_multi_async(source_title, source_content, source_language, languages)
+
 
+async def _apply_post_translations(db: AsyncSession, post_id: str, translated: dict[str, tuple[str, str]]) -> bool:
     result = await db.execute(select(Post).where(Post.id == post_id))
     post = result.scalar_one_or_none()
     if post is None or post.status != "published":
-        job.status = "skipped"
-        return
-
-    target = await _get_post_translation(db, post_id, target_language)
-    if target is None:
-        target = PostTranslation(
-            post_id=post_id,
-            language=target_language,
-            title="",
-            content="",
-            translated_by="ai",
-        )
-        db.add(target)
-    target.title = translated_title
-    target.content = translated_content
-    target.status = "ready"
-    target.model = settings.openai_model
-    logger.info("Translated post %s to %s", post_id, target_language)
-
+        return False
 
-async def _process_reply_job(db: AsyncSession, job: TranslationJob) -> None:
-    reply = await _get_reply(db, job.target_id)
+    for language, (title, content) in translated.items():
+        target = await _get_post_translation(db, post_id, language)
+        if target is None:
+            target = PostTranslation(
+                post_id=post_id,
+                language=language,
+                title="",
+                content="",
+                translated_by="ai",
+            )
+            db.add(target)
+        target.title = title
+        target.content = content
+        target.status = "ready"
+        target.model = settings.openai_model
+    if translated:
+        invalidate_post(db, post_id)
+        logger.info("Translated post %s to %s", post_id, ", ".join(translated))
+    return True
+
+
+async def _translate_reply(db: AsyncSession, reply_id: str, languages: list[str]) -> dict[str, str] | None:
+    reply = await _get_reply(db, reply_id)
     if reply is None or reply.status != "visible":
-        job.status = "skipped"
-        return
+        return None
 
     source_language = await _reply_source_language(db, reply)
     source_content = reply.content
-    target_language = job.language
-    reply_id = reply.id
     await db.commit()
 
-    translated_content = await translate_content_preserving_structure_async(
-        source_content, source_language, target_language
-    )
+    if len(languages) == 1:
+        return {
+            languages[0]: await translate_content_preserving_structure_async(
+                source_content, source_language, languages[0]
+            )
+        }
+    return await translate_content_multi_async(source_content, source_language, languages)
+
 
+async def _apply_reply_translations(db: AsyncSession, reply_id: str, translated: dict[str, str]) -> bool:
     reply = await _get_reply(db, reply_id)
     if reply is None or reply.status != "visible":
-        job.status = "skipped"
-        return
-
-    target = await _get_reply_translation(db, reply_id, target_language)
-    if target is None:
-        target = ReplyTranslation(
-            reply_id=reply_id,
-            language=target_language,
-            content="",
-            translated_by="ai",
-        )
-        db.add(target)
-    target.content = translated_content
-    target.status = "ready"
-    logger.info("Translated reply %s to %s", reply_id, target_language)
-
+        return False
 
-async def _schedule_retry(db: AsyncSession, job_id: str, exc: Exception) -> None:
-    result = await db.execute(select(TranslationJob).where(TranslationJob.id == job_id))
+    for language, content in translated.items():
+        target = await _get_reply_translation(db, reply_id, language)
+        if target is None:
+            target = ReplyTranslation(
+                reply_id=reply_id,
+                language=language,
+                content="",
+                translated_by="ai",
+            )
+            db.add(target)
+        target.content = content
+        target.status = "ready"
+    if translated:
+        logger.info("Translated reply %s to %s", reply_id, ", ".join(translated))
+    return True
+
+
+async def _schedule_retry(db: AsyncSession, job_id: str, worker_id: str, exc: Exception) -> None:
+    lease = (
+        TranslationJob.id == job_id,
+        TranslationJob.status == "processing",
+        TranslationJob.locked_by == worker_id,
+    )
+    result = await db.execute(
+        select(TranslationJob).where(*lease).execution_options(populate_existing=True)
+    )
     job = result.scalar_one_or_none()
     if job is None:
         return
-    job.attempts += 1
-    job.last_error = str(exc)[:2000]
-    job.locked_at = None
-    if job.attempts >= job.max_attempts:
-        job.status = "failed"
-        job.next_run_at = None
-        await _mark_target_failed(db, job)
+    attempts = job.attempts + 1
+    values = {"attempts": attempts, "last_error": str(exc)[:2000], "locked_at": None, "locked_by": None}
+    if attempts >= job.max_attempts:
+        values.update(status="failed", next_run_at=None)
     else:
-        delay = RETRY_DELAYS[min(job.attempts - 1, len(RETRY_DELAYS) - 1)]
-        job.status = "pending"
-        job.next_run_at = datetime.now(timezone.utc) + delay
+        delay = RETRY_DELAYS[min(attempts - 1, len(RETRY_DELAYS) - 1)]
+        values.update(status="pending", next_run_at=datetime.now(timezone.utc) + delay)
+    result = await db.execute(
+        update(TranslationJob).where(*lease).values(**values).execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        # Reclaimed by another worker between the read and the update; its attempt owns the job now.
+        await db.rollback()
+        return
+    if values["status"] == "failed":
+        await _mark_target_failed(db, job)
     await db.commit()
 
 
 async def _mark_target_failed(db: AsyncSession, job: TranslationJob) -> None:
     if job.target_type == "post":
         translation = await _get_post_translation(db, job.target_id, job.language)
+        invalidate_post(db, job.target_id)
     elif job.target_type == "reply":
         translation = await _get_reply_translation(db, job.target_id, job.language)
     else:
@@ -317,22 +599,29 @@ async def _upsert_job(
     )
     job = result.scalar_one_or_none()
     if job is None:
-        db.add(
-            TranslationJob(
-                target_type=target_type,
-                target_id=target_id,
-                language=language,
-                status="pending",
-                attempts=0,
-                max_attempts=3,
-            )
-        )
+        db.add(_new_job(target_type, target_id, language))
         return True
+    return _revive_job(job, reset)
+
+
+def _new_job(target_type: str, target_id: str, language: str) -> TranslationJob:
+    return TranslationJob(
+        target_type=target_type,
+        target_id=target_id,
+        language=language,
+        status="pending",
+        attempts=0,
+        max_attempts=3,
+    )
+
+
+def _revive_job(job: TranslationJob, reset: bool) -> bool:
     if reset or job.status in {"failed", "skipped"}:
         job.status = "pending"
         job.attempts = 0
         job.last_error = None
         job.locked_at = None
+        job.locked_by = None
         job.next_run_at = None
         job.completed_at = None
         return True
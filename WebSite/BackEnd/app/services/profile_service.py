@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.errors import AppError
 from app.models.models import Profile
 from app.schemas.profile import ProfileUpdateRequest
+from app.services.post_cache_service import invalidate_author_posts
 
 
 async def get_profile(db: AsyncSession, user_id: str) -> Profile:
@@ -19,7 +20,9 @@ async def update_profile(db: AsyncSession, user_id: str, payload: ProfileUpdateR
     data = payload.model_dump(exclude_unset=True)
     for key, value in data.items():
         setattr(profile, key, value)
-    await db.commit()
+    if "display_name" in data:
+        invalidate_author_posts(db, user_id)
+    await db.flush()
     await db.refresh(profile)
     return profile
 
@@ -2,41 +2,45 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import AppError
-from app.models.models import Post, PostTranslation, Profile, Reply
+from app.core.pagination import paginate
+from app.models.models import Post, PostTranslation, Profile, Reply, ReplyTranslation
 from app.services.notification_service import create_notification
 from app.schemas.reply import ReplyCreateRequest, ReplyUpdateRequest
 
 
 async def list_replies(
-    db: AsyncSession, post_id: str, limit: int, offset: int, include_hidden: bool = False
+    db: AsyncSession,
+    post_id: str,
+    limit: int,
+    offset: int,
+    include_hidden: bool = False,
+    cursor: str | None = None,
 ) -> list[Reply]:
     stmt = select(Reply).where(Reply.post_id == post_id)
     if not include_hidden:
         stmt = stmt.where(Reply.status == "visible")
     result = await db.execute(
-        stmt.order_by(Reply.created_at.asc()).limit(limit).offset(offset)
+        paginate(stmt, Reply.created_at, Reply.id, limit, offset, cursor, ascending=True)
     )
     return list(result.scalars().all())
 
 
-async def list_user_replies(db: AsyncSession, user_id: str, limit: int, offset: int) -> list[Reply]:
+async def list_user_replies(
+    db: AsyncSession, user_id: str, limit: int, offset: int, cursor: str | None = None
+) -> list[Reply]:
     result = await db.execute(
-        select(Reply)
-        .where(Reply.author_id == user_id)
-        .order_by(Reply.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        paginate(select(Reply).where(Reply.author_id == user_id), Reply.created_at, Reply.id, limit, offset, cursor)
     )
     return list(result.scalars().all())
 
 
 async def list_all_replies(
-    db: AsyncSession, limit: int, offset: int, status: str | None = None
+    db: AsyncSession, limit: int, offset: int, status: str | None = None, cursor: str | None = None
 ) -> list[Reply]:
     stmt = select(Reply)
     if status and status != "all":
         stmt = stmt.where(Reply.status == status)
-    result = await db.execute(stmt.order_by(Reply.created_at.desc()).limit(limit).offset(offset))
+    result = await db.execute(paginate(stmt, Reply.created_at, Reply.id, limit, offset, cursor))
     return list(result.scalars().all())
 
 
@@ -51,7 +55,7 @@ async def create_reply(
         raise AppError(code="post_not_found", message="Post not found", status_code=404)
     reply = Reply(post_id=post_id, author_id=author_id, content=payload.content, status="visible")
     db.add(reply)
-    await db.commit()
+    await db.flush()
     await db.refresh(reply)
 
     excerpt = " ".join(payload.content.split()).strip()
@@ -92,7 +96,7 @@ async def update_reply(db: AsyncSession, reply_id: str, author_id: str, payload:
     data = payload.model_dump(exclude_unset=True)
     for key, value in data.items():
         setattr(reply, key, value)
-    await db.commit()
+    await db.flush()
     await db.refresh(reply)
     return reply
 
@@ -104,8 +108,9 @@ async def delete_reply(db: AsyncSession, reply_id: str, author_id: str) -> None:
         raise AppError(code="reply_not_found", message="Reply not found", status_code=404)
     if reply.author_id != author_id:
         raise AppError(code="forbidden", message="Not allowed", status_code=403)
+    await db.execute(ReplyTranslation.__table__.delete().where(ReplyTranslation.reply_id == reply.id))
     await db.delete(reply)
-    await db.commit()
+    await db.flush()
 
 
 async def admin_hide_reply(db: AsyncSession, reply_id: str) -> Reply:
@@ -114,7 +119,7 @@ async def admin_hide_reply(db: AsyncSession, reply_id: str) -> Reply:
     if reply is None:
         raise AppError(code="reply_not_found", message="Reply not found", status_code=404)
     reply.status = "hidden"
-    await db.commit()
+    await db.flush()
     await db.refresh(reply)
     return reply
 
@@ -125,7 +130,7 @@ async def admin_restore_reply(db: AsyncSession, reply_id: str) -> Reply:
     if reply is None:
         raise AppError(code="reply_not_found", message="Reply not found", status_code=404)
     reply.status = "visible"
-    await db.commit()
+    await db.flush()
     await db.refresh(reply)
     return reply
 
@@ -135,6 +140,7 @@ async def admin_delete_reply(db: AsyncSession, reply_id: str) -> None:
     reply = result.scalar_one_or_none()
     if reply is None:
         raise AppError(code="reply_not_found", message="Reply not found", status_code=404)
+    await db.execute(ReplyTranslation.__table__.delete().where(ReplyTranslation.reply_id == reply.id))
     await db.delete(reply)
-    await db.commit()
+    await db.flush()
 
@@ -4,8 +4,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import AppError
+from app.core.pagination import paginate
 from app.models.models import ModerationAction, Post, PostTranslation, Report, Reply
 from app.services.notification_service import create_notification
+from app.services.post_cache_service import invalidate_post
 
 
 async def create_report(
@@ -27,25 +29,28 @@ async def create_report(
         original_status=await _get_target_status(db, target_type, target_id),
     )
     db.add(report)
-    await db.commit()
+    await db.flush()
     await db.refresh(report)
     return report
 
 
-async def list_reports(db: AsyncSession, limit: int, offset: int) -> list[Report]:
-    result = await db.execute(
-        select(Report).order_by(Report.created_at.desc()).limit(limit).offset(offset)
-    )
+async def list_reports(db: AsyncSession, limit: int, offset: int, cursor: str | None = None) -> list[Report]:
+    result = await db.execute(paginate(select(Report), Report.created_at, Report.id, limit, offset, cursor))
     return list(result.scalars().all())
 
 
-async def list_my_reports(db: AsyncSession, reporter_id: str, limit: int, offset: int) -> list[Report]:
+async def list_my_reports(
+    db: AsyncSession, reporter_id: str, limit: int, offset: int, cursor: str | None = None
+) -> list[Report]:
     result = await db.execute(
-        select(Report)
-        .where(Report.reporter_id == reporter_id)
-        .order_by(Report.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        paginate(
+            select(Report).where(Report.reporter_id == reporter_id),
+            Report.created_at,
+            Report.id,
+            limit,
+            offset,
+            cursor,
+        )
     )
     return list(result.scalars().all())
 
@@ -87,7 +92,7 @@ async def resolve_report(
             reason=note,
         )
     )
-    await db.commit()
+    await db.flush()
     await db.refresh(report)
     target_title = None
     target_excerpt = None
@@ -146,6 +151,7 @@ async def _apply_content_status(db: AsyncSession, target_type: str, target_id: s
         if post is None:
             raise AppError(code="post_not_found", message="Post not found", status_code=404)
         post.status = status
+        invalidate_post(db, target_id)
     if target_type == "reply":
         result = await db.execute(select(Reply).where(Reply.id == target_id))
         reply = result.scalar_one_or_none()
@@ -0,0 +1,331 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+import logging
+import math
+import os
+import pickle
+import re
+import unicodedata
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.periodic import start_periodic
+from app.models.models import Post, PostTranslation
+from app.services.fulltext_service import search_document_text
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 3
+# Rebuild a language's postings once this share of its documents are superseded tombstones.
+COMPACT_RATIO = 0.25
+# Catch-up window on snapshot load, covering clock skew and writes racing the save.
+CATCH_UP_MARGIN = timedelta(minutes=5)
+# Periodic catch-up re-reads this much before the last seen update, for transactions that committed late.
+CATCH_UP_OVERLAP = timedelta(seconds=30)
+
+_CJK_RUN_RE = re.compile(r"[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-䶿一-鿿가-힯]+")
+_PENDING_KEY = "search_index_pending"
+
+
+def _strip_punctuation(value: str) -> str:
+    return "".join(" " if unicodedata.category(char)[0] in "PSZC" else char for char in value)
+
+
+def _cjk_bigrams(run: str) -> list[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[index : index + 2] for index in range(len(run) - 1)]
+
+
+def _tokenize_spaced(value: str) -> list[str]:
+    tokens: list[str] = []
+    position = 0
+    for match in _CJK_RUN_RE.finditer(value):
+        tokens.extend(_strip_punctuation(value[position : match.start()]).split())
+        tokens.extend(_cjk_bigrams(match.group()))
+        position = match.end()
+    tokens.extend(_strip_punctuation(value[position:]).split())
+    return tokens
+
+
+def _normalize(value: str) -> str:
+    return unicodedata.normalize("NFKC", value).casefold()
+
+
+def tokenize_default(value: str) -> list[str]:
+    return _tokenize_spaced(_normalize(value))
+
+
+def tokenize_vi(value: str) -> list[str]:
+    # Vietnamese is commonly typed without tones, so both sides are folded to bare letters.
+    decomposed = unicodedata.normalize("NFKD", _normalize(value)).replace("đ", "d")
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _tokenize_spaced(folded)
+
+
+def tokenize_ne(value: str) -> list[str]:
+    # Devanagari vowel signs are combining marks, so tokens are split on whitespace and punctuation only.
+    return _tokenize_spaced(unicodedata.normalize("NFC", value).casefold())
+
+
+TOKENIZERS = {
+    "vi": tokenize_vi,
+    "ne": tokenize_ne,
+}
+
+
+def tokenize(language: str, value: str) -> list[str]:
+    return TOKENIZERS.get(language, tokenize_default)(value)
+
+
+class LanguageIndex:
+    def __init__(self) -> None:
+        self.doc_keys: list[str | None] = []
+        self.doc_lengths = array("I")
+        self.key_to_doc: dict[str, int] = {}
+        self.postings: dict[str, tuple[array, array]] = {}
+        self.live_docs = 0
+        self.total_length = 0
+
+    def add(self, key: str, tokens: list[str]) -> None:
+        self.remove(key)
+        doc = len(self.doc_keys)
+        self.doc_keys.append(key)
+        self.doc_lengths.append(len(tokens))
+        self.key_to_doc[key] = doc
+        self.live_docs += 1
+        self.total_length += len(tokens)
+        counts: dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, count in counts.items():
+            docs, freqs = self.postings.setdefault(token, (array("I"), array("I")))
+            # New documents always take the highest number, so appends keep postings sorted.
+            docs.append(doc)
+            freqs.append(count)
+
+    def remove(self, key: str) -> None:
+        doc = self.key_to_doc.pop(key, None)
+        if doc is None:
+            return
+        self.doc_keys[doc] = None
+        self.live_docs -= 1
+        self.total_length -= self.doc_lengths[doc]
+        if len(self.doc_keys) - self.live_docs > len(self.doc_keys) * COMPACT_RATIO:
+            self.compact()
+
+    def compact(self) -> None:
+        remap = array("i", [-1]) * len(self.doc_keys)
+        doc_keys: list[str | None] = []
+        doc_lengths = array("I")
+        for doc, key in enumerate(self.doc_keys):
+            if key is None:
+                continue
+            remap[doc] = len(doc_keys)
+            doc_keys.append(key)
+            doc_lengths.append(self.doc_lengths[doc])
+        postings: dict[str, tuple[array, array]] = {}
+        for token, (docs, freqs) in self.postings.items():
+            new_docs, new_freqs = array("I"), array("I")
+            for doc, freq in zip(docs, freqs):
+                if remap[doc] >= 0:
+                    new_docs.append(remap[doc])
+                    new_freqs.append(freq)
+            if new_docs:
+                postings[token] = (new_docs, new_freqs)
+        self.doc_keys = doc_keys
+        self.doc_lengths = doc_lengths
+        self.key_to_doc = {key: doc for doc, key in enumerate(doc_keys)}
+        self.postings = postings
+
+    def search(self, tokens: list[str], limit: int) -> list[tuple[str, float]]:
+        if not self.live_docs:
+            return []
+        average_length = self.total_length / self.live_docs or 1.0
+        scores: dict[int, float] = {}
+        for token in set(tokens):
+            entry = self.postings.get(token)
+            if entry is None:
+                continue
+            docs, freqs = entry
+            idf = math.log(1 + (self.live_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc, freq in zip(docs, freqs):
+                if self.doc_keys[doc] is None:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc] / average_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * freq * (BM25_K1 + 1) / (freq + norm)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self.doc_keys[doc], score) for doc, score in ranked]
+
+
+class SearchIndex:
+    def __init__(self) -> None:
+        self.languages: dict[str, LanguageIndex] = {}
+        self.built_at: datetime | None = None
+
+    def upsert(self, post_id: str, language: str, title: str, content: str) -> None:
+        tokens = tokenize(language, title) * TITLE_WEIGHT + tokenize(language, search_document_text(content))
+        self.languages.setdefault(language, LanguageIndex()).add(post_id, tokens)
+
+    def remove(self, post_id: str, language: str | None = None) -> None:
+        languages = [language] if language else list(self.languages)
+        for item in languages:
+            index = self.languages.get(item)
+            if index is not None:
+                index.remove(post_id)
+
+    def search(self, language: str, query: str, limit: int) -> list[tuple[str, float]]:
+        index = self.languages.get(language)
+        if index is None:
+            return []
+        return index.search(tokenize(language, query), limit)
+
+    def save(self, path: str) -> None:
+        state = {"version": SNAPSHOT_VERSION, "built_at": self.built_at, "languages": self.languages}
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as handle:
+            pickle.dump(state, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SearchIndex | None":
+        try:
+            with open(path, "rb") as handle:
+                state = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("Ignoring unreadable search index snapshot %s", path, exc_info=True)
+            return None
+        if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+            return None
+        index = cls()
+        index.built_at = state["built_at"]
+        index.languages = state["languages"]
+        return index
+
+
+_search_index: SearchIndex | None = None
+_caught_up_to: datetime | None = None
+
+
+def get_search_index() -> SearchIndex | None:
+    return _search_index
+
+
+async def _index_translations(db: AsyncSession, index: SearchIndex, since: datetime | None) -> int:
+    stmt = select(
+        PostTranslation.post_id,
+        PostTranslation.language,
+        PostTranslation.title,
+        PostTranslation.content,
+        PostTranslation.status,
+    )
+    if since is not None:
+        stmt = stmt.where(PostTranslation.updated_at >= since)
+    count = 0
+    for post_id, language, title, content, status in (await db.execute(stmt)).all():
+        if status == "ready" and content:
+            index.upsert(post_id, language, title or "", content)
+        else:
+            index.remove(post_id, language)
+        count += 1
+    return count
+
+
+async def load_search_index(db: AsyncSession, snapshot_path: str | None) -> SearchIndex:
+    global _search_index, _caught_up_to
+    started_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    _caught_up_to = (await db.execute(select(func.max(PostTranslation.updated_at)))).scalar_one_or_none()
+    index = SearchIndex.load(snapshot_path) if snapshot_path else None
+    if index is not None and index.built_at is not None:
+        count = await _index_translations(db, index, index.built_at - CATCH_UP_MARGIN)
+        logger.info("Loaded search index snapshot, re-indexed %s recent translations", count)
+    else:
+        index = SearchIndex()
+        count = await _index_translations(db, index, None)
+        logger.info("Built search index from %s translations", count)
+    index.built_at = started_at
+    _search_index = index
+    return index
+
+
+async def catch_up_search_index(db: AsyncSession) -> int:
+    # Translations written by other processes (e.g. the standalone translation worker) never pass through
+    # this process's session events, so pick them up by updated_at instead.
+    global _caught_up_to
+    if _search_index is None:
+        return 0
+    latest = (await db.execute(select(func.max(PostTranslation.updated_at)))).scalar_one_or_none()
+    if latest is None:
+        return 0
+    since = _caught_up_to - CATCH_UP_OVERLAP if _caught_up_to is not None else None
+    count = await _index_translations(db, _search_index, since)
+    _caught_up_to = latest
+    return count
+
+
+def save_search_index(snapshot_path: str | None) -> None:
+    if _search_index is None or not snapshot_path:
+        return
+    _search_index.built_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    _search_index.save(snapshot_path)
+
+
+def _collect_index_changes(session: Session, _flush_context) -> None:
+    if _search_index is None:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, [])
+    for item in list(session.new) + list(session.dirty):
+        if isinstance(item, PostTranslation) and item.post_id is not None:
+            if item.status == "ready" and item.content:
+                pending.append(("upsert", item.post_id, item.language, item.title or "", item.content))
+            else:
+                pending.append(("remove", item.post_id, item.language, "", ""))
+    for item in session.deleted:
+        if isinstance(item, PostTranslation):
+            pending.append(("remove", item.post_id, item.language, "", ""))
+        elif isinstance(item, Post):
+            pending.append(("remove", item.id, None, "", ""))
+
+
+def _apply_index_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or _search_index is None:
+        return
+    for action, post_id, language, title, content in pending:
+        if action == "upsert":
+            _search_index.upsert(post_id, language, title, content)
+        else:
+            _search_index.remove(post_id, language)
+
+
+def _discard_index_changes(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def _catch_up_job() -> None:
+    async with SessionLocal() as session:
+        count = await catch_up_search_index(session)
+    if count:
+        logger.debug("Search index caught up on %s translations", count)
+
+
+def start_search_index_catch_up() -> None:
+    start_periodic("search_index_catch_up", settings.search_catch_up_seconds, _catch_up_job)
+
+
+def register_search_index_sync() -> None:
+    # Changes are staged per flush and only reach the index once the transaction commits.
+    if not event.contains(Session, "after_flush", _collect_index_changes):
+        event.listen(Session, "after_flush", _collect_index_changes)
+        event.listen(Session, "after_commit", _apply_index_changes)
+        event.listen(Session, "after_soft_rollback", _discard_index_changes)
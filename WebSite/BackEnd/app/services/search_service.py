@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+import json
+import time
+
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
 from app.models.models import Post, PostTag, PostTranslation, Tag
 from app.schemas.post import PostResponse
-from app.services.post_service import _to_response
+from app.services.fulltext_service import build_match_query, get_fulltext_backend
+from app.services.post_service import _to_responses
+from app.services.search_index_service import get_search_index
+from app.services.suggestion_service import get_suggestion_index
+from app.services.trending_service import trending_post_ids
+
+# Upper bound on ranked candidates taken from the in-memory index before database filters apply.
+MEMORY_SEARCH_CANDIDATES = 1000
+# Without planner statistics (SQLite), "estimate" counts at most this many rows.
+ESTIMATE_COUNT_CAP = 1000
+COUNT_CACHE_MAX_ENTRIES = 1024
+
+_count_cache: dict[tuple, tuple[float, int]] = {}
+
+search_flight = SingleFlight("search")
+trending_flight = SingleFlight("trending")
 
 
 def _normalize_tags(tags: str | None) -> list[str]:
@@ -24,7 +44,29 @@ async def search_posts(
     sort: str,
     limit: int,
     offset: int,
-) -> tuple[list[PostResponse], int]:
+    total_mode: str = "exact",
+) -> tuple[list[PostResponse], int | None, bool]:
+    # Replica and primary sessions may legitimately disagree, so they never share a flight.
+    key = (
+        query, language, category_id, tags, sort, limit, offset, total_mode, bool(db.info.get("read_only"))
+    )
+    return await search_flight.do(
+        key,
+        lambda: _search_posts(db, query, language, category_id, tags, sort, limit, offset, total_mode),
+    )
+
+
+async def _search_posts(
+    db: AsyncSession,
+    query: str | None,
+    language: str,
+    category_id: str | None,
+    tags: str | None,
+    sort: str,
+    limit: int,
+    offset: int,
+    total_mode: str,
+) -> tuple[list[PostResponse], int | None, bool]:
     stmt = (
         select(Post)
         .join(PostTranslation, PostTranslation.post_id == Post.id)
@@ -32,7 +74,17 @@ async def search_posts(
         .where(Post.status == "published")
     )
 
-    if query:
+    relevance = None
+    ranked: list[str] | None = None
+    backend = get_fulltext_backend()
+    match_query = build_match_query(query) if query else ""
+    search_index = get_search_index() if settings.search_engine == "memory" else None
+    if query and search_index is not None:
+        ranked = [post_id for post_id, _ in search_index.search(language, query, MEMORY_SEARCH_CANDIDATES)]
+        stmt = stmt.where(Post.id.in_(ranked))
+    elif match_query and backend is not None:
+        stmt, relevance = backend.apply(stmt, match_query, language)
+    elif query:
         pattern = f"%{query}%"
         stmt = stmt.where(
             or_(
@@ -52,23 +104,106 @@ async def search_posts(
             .where(Tag.slug.in_(tag_list))
         )
 
-    if sort == "helpful":
+    if sort == "relevance" and ranked is not None:
+        return await _rank_in_memory(db, stmt, ranked, language, limit, offset)
+    filtered = stmt
+    if sort == "relevance" and relevance is not None:
+        stmt = stmt.order_by(relevance, Post.created_at.desc())
+    elif sort == "helpful":
         stmt = stmt.order_by(Post.helpful_count.desc(), Post.created_at.desc())
     elif sort == "accuracy":
         stmt = stmt.order_by(Post.accuracy_avg.desc(), Post.accuracy_count.desc(), Post.created_at.desc())
     else:
         stmt = stmt.order_by(Post.created_at.desc())
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total = (await db.execute(count_stmt)).scalar_one()
+    result = await db.execute(stmt.limit(limit + 1).offset(offset))
+    posts = list(result.scalars().all())
+    has_more = len(posts) > limit
+    posts = posts[:limit]
+
+    total = None
+    if total_mode != "none":
+        if not has_more:
+            # The page already reaches the end of the result set, so the total is known for free.
+            total = offset + len(posts) if posts or offset == 0 else None
+        if total is None:
+            key = _count_cache_key(query, language, category_id, tag_list)
+            total = _cached_count(key)
+            if total is None and total_mode == "estimate":
+                total = await _estimate_count(db, filtered)
+            elif total is None:
+                total = int((await db.execute(select(func.count()).select_from(filtered.subquery()))).scalar_one() or 0)
+                _store_count(key, total)
+
+    items = await _to_responses(db, posts, language)
+    return items, total, has_more
+
+
+def _count_cache_key(query: str | None, language: str, category_id: str | None, tag_list: list[str]) -> tuple:
+    normalized_query = " ".join((query or "").casefold().split())
+    return normalized_query, language, category_id, tuple(sorted(set(tag_list))), settings.search_engine
 
-    result = await db.execute(stmt.limit(limit).offset(offset))
-    posts = result.scalars().all()
-    items = [await _to_response(db, post, language) for post in posts]
-    return items, int(total or 0)
 
+def _cached_count(key: tuple) -> int | None:
+    entry = _count_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, total = entry
+    if expires_at < time.monotonic():
+        _count_cache.pop(key, None)
+        return None
+    return total
 
-async def suggest_terms(db: AsyncSession, query: str | None, limit: int) -> list[str]:
+
+def _store_count(key: tuple, total: int) -> None:
+    if settings.search_count_cache_seconds <= 0:
+        return
+    _count_cache.pop(key, None)
+    while len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+        _count_cache.pop(next(iter(_count_cache)))
+    _count_cache[key] = (time.monotonic() + settings.search_count_cache_seconds, total)
+
+
+async def _estimate_count(db: AsyncSession, stmt) -> int:
+    connection = await db.connection()
+    if connection.dialect.name == "postgresql":
+        compiled = stmt.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+        params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    capped = stmt.with_only_columns(Post.id).limit(ESTIMATE_COUNT_CAP).subquery()
+    return int((await db.execute(select(func.count()).select_from(capped))).scalar_one() or 0)
+
+
+async def _rank_in_memory(
+    db: AsyncSession,
+    stmt,
+    ranked: list[str],
+    language: str,
+    limit: int,
+    offset: int,
+) -> tuple[list[PostResponse], int, bool]:
+    matched = set((await db.execute(stmt.with_only_columns(Post.id).distinct())).scalars().all())
+    ordered = [post_id for post_id in ranked if post_id in matched]
+    page_ids = ordered[offset : offset + limit]
+    posts_by_id = {}
+    if page_ids:
+        result = await db.execute(select(Post).where(Post.id.in_(page_ids)))
+        posts_by_id = {post.id: post for post in result.scalars().all()}
+    posts = [posts_by_id[post_id] for post_id in page_ids if post_id in posts_by_id]
+    items = await _to_responses(db, posts, language)
+    return items, len(ordered), offset + limit < len(ordered)
+
+
+async def suggest_terms(
+    db: AsyncSession, query: str | None, limit: int, language: str | None = None
+) -> list[str]:
+    suggestion_index = get_suggestion_index()
+    if suggestion_index is not None:
+        return suggestion_index.suggest(query or "", language, limit)
     if not query:
         tag_stmt = select(Tag.slug).order_by(Tag.slug.asc()).limit(limit)
         result = await db.execute(tag_stmt)
@@ -100,13 +235,24 @@ async def trending_posts(
     language: str,
     limit: int,
 ) -> list[PostResponse]:
-    stmt = (
-        select(Post)
-        .where(Post.status == "published")
-        .order_by(Post.helpful_count.desc(), Post.accuracy_avg.desc(), Post.created_at.desc())
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    posts = result.scalars().all()
-    return [await _to_response(db, post, language) for post in posts]
+    key = (language, limit, bool(db.info.get("read_only")))
+    return await trending_flight.do(key, lambda: _trending_posts(db, language, limit))
+
+
+async def _trending_posts(db: AsyncSession, language: str, limit: int) -> list[PostResponse]:
+    post_ids = await trending_post_ids(db, limit)
+    if not post_ids:
+        # Scores have not been computed yet (first start before the refresh job ran).
+        stmt = (
+            select(Post)
+            .where(Post.status == "published")
+            .order_by(Post.helpful_count.desc(), Post.accuracy_avg.desc(), Post.created_at.desc())
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return await _to_responses(db, list(result.scalars().all()), language)
+    result = await db.execute(select(Post).where(Post.id.in_(post_ids)))
+    posts_by_id = {post.id: post for post in result.scalars().all()}
+    posts = [posts_by_id[post_id] for post_id in post_ids if post_id in posts_by_id]
+    return await _to_responses(db, posts, language)
 
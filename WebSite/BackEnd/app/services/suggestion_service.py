@@ -0,0 +1,296 @@
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from datetime import timedelta
+import heapq
+import logging
+import re
+import unicodedata
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.periodic import start_periodic
+from app.models.models import Post, PostTag, PostTranslation, Tag
+
+
+logger = logging.getLogger(__name__)
+
+# Tags are language independent and are merged into every language's answer.
+TAG_PARTITION = "*"
+MAX_KEY_LENGTH = 48
+MAX_KEYS_PER_ENTRY = 32
+# Answers are cached per prefix until an entry is added, renamed or removed.
+CACHED_PREFIXES = 4096
+CACHED_ANSWER_SIZE = 50
+# Very broad prefixes rank only the first keys in their range instead of walking all of it.
+MAX_SCANNED_KEYS = 5000
+
+_WORD_START_RE = re.compile(r"(?:^|(?<=[\s\-_/.,:;!?()\[\]]))\w|[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-䶿一-鿿가-힯]")
+_PENDING_KEY = "suggestion_index_pending"
+# Periodic catch-up re-reads this much before the last seen update, for transactions that committed late.
+CATCH_UP_OVERLAP = timedelta(seconds=30)
+
+
+def normalize_suggestion(value: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+
+
+def _entry_keys(normalized: str) -> list[str]:
+    # Every word start (and every CJK character) is a key, so "visa" also completes "student visa guide".
+    starts = sorted({match.start() for match in _WORD_START_RE.finditer(normalized)} | {0})
+    return [normalized[start : start + MAX_KEY_LENGTH] for start in starts[:MAX_KEYS_PER_ENTRY]]
+
+
+class _Partition:
+    def __init__(self) -> None:
+        self.keys: list[tuple[str, str]] = []
+        self.entries: dict[str, tuple[str, float, list[str]]] = {}
+        self.cache: OrderedDict[str, list[tuple[float, str]]] = OrderedDict()
+
+    def put(self, entry_id: str, text: str, weight: float) -> None:
+        current = self.entries.get(entry_id)
+        if current is not None and current[0] == text:
+            # Weight-only changes keep cached answers; their order catches up on the next membership change.
+            self.entries[entry_id] = (text, weight, current[2])
+            return
+        self.remove(entry_id)
+        keys = _entry_keys(normalize_suggestion(text))
+        for key in keys:
+            insort(self.keys, (key, entry_id))
+        self.entries[entry_id] = (text, weight, keys)
+        self.cache.clear()
+
+    def remove(self, entry_id: str) -> None:
+        current = self.entries.pop(entry_id, None)
+        if current is None:
+            return
+        for key in current[2]:
+            index = bisect_left(self.keys, (key, entry_id))
+            if index < len(self.keys) and self.keys[index] == (key, entry_id):
+                del self.keys[index]
+        self.cache.clear()
+
+    def top(self, prefix: str, limit: int) -> list[tuple[float, str]]:
+        cached = self.cache.get(prefix)
+        if cached is not None:
+            self.cache.move_to_end(prefix)
+            return cached[:limit]
+        start = bisect_left(self.keys, (prefix,))
+        end = min(bisect_left(self.keys, (prefix + "\U0010ffff",)), start + MAX_SCANNED_KEYS)
+        seen = {entry_id for _, entry_id in self.keys[start:end]}
+        ranked = heapq.nlargest(
+            CACHED_ANSWER_SIZE, ((self.entries[entry_id][1], self.entries[entry_id][0]) for entry_id in seen)
+        )
+        self.cache[prefix] = ranked
+        if len(self.cache) > CACHED_PREFIXES:
+            self.cache.popitem(last=False)
+        return ranked[:limit]
+
+
+class SuggestionIndex:
+    def __init__(self) -> None:
+        self.partitions: dict[str, _Partition] = {}
+
+    def put(self, language: str, entry_id: str, text: str, weight: float) -> None:
+        if text.strip():
+            self.partitions.setdefault(language, _Partition()).put(entry_id, text, weight)
+        else:
+            self.remove(language, entry_id)
+
+    def remove(self, language: str | None, entry_id: str) -> None:
+        partitions = [self.partitions.get(language)] if language else list(self.partitions.values())
+        for partition in partitions:
+            if partition is not None:
+                partition.remove(entry_id)
+
+    def suggest(self, query: str, language: str | None, limit: int) -> list[str]:
+        prefix = normalize_suggestion(query)
+        if language:
+            names = [language, TAG_PARTITION]
+        else:
+            names = list(self.partitions)
+        candidates: list[tuple[float, str]] = []
+        for name in names:
+            partition = self.partitions.get(name)
+            if partition is not None:
+                candidates.extend(partition.top(prefix, limit))
+        merged: list[str] = []
+        for _, text in sorted(candidates, key=lambda item: item[0], reverse=True):
+            if text not in merged:
+                merged.append(text)
+            if len(merged) >= limit:
+                break
+        return merged
+
+
+_suggestion_index: SuggestionIndex | None = None
+
+
+_caught_up_to = None
+
+
+def get_suggestion_index() -> SuggestionIndex | None:
+    return _suggestion_index
+
+
+def _post_weight(helpful_count: int | None, accuracy_count: int | None) -> float:
+    return 1.0 + (helpful_count or 0) + (accuracy_count or 0)
+
+
+async def build_suggestion_index(db: AsyncSession) -> SuggestionIndex:
+    global _suggestion_index, _caught_up_to
+    index = SuggestionIndex()
+    _caught_up_to = (await db.execute(select(func.max(PostTranslation.updated_at)))).scalar_one_or_none()
+    titles = await db.execute(
+        select(
+            PostTranslation.post_id,
+            PostTranslation.language,
+            PostTranslation.title,
+            Post.helpful_count,
+            Post.accuracy_count,
+        )
+        .join(Post, Post.id == PostTranslation.post_id)
+        .where(Post.status == "published", PostTranslation.status == "ready")
+    )
+    for post_id, language, title, helpful_count, accuracy_count in titles.all():
+        index.put(language, f"post:{post_id}", title or "", _post_weight(helpful_count, accuracy_count))
+
+    tags = await db.execute(
+        select(Tag.slug, func.count(PostTag.post_id))
+        .outerjoin(PostTag, PostTag.tag_id == Tag.id)
+        .group_by(Tag.id, Tag.slug)
+    )
+    for slug, usage in tags.all():
+        index.put(TAG_PARTITION, f"tag:{slug}", slug, 1.0 + usage)
+    _suggestion_index = index
+    return index
+
+
+def _collect_suggestion_changes(session: Session, _flush_context) -> None:
+    if _suggestion_index is None:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, [])
+    post_ids: set[str] = set()
+    for item in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(item, PostTranslation) and item.post_id is not None:
+            post_ids.add(item.post_id)
+        elif isinstance(item, Post) and item.id is not None:
+            post_ids.add(item.id)
+        elif isinstance(item, Tag):
+            previous = inspect(item).attrs.slug.history.deleted
+            for slug in previous or ():
+                pending.append(("remove", TAG_PARTITION, f"tag:{slug}", "", 0.0))
+            if item in session.deleted:
+                pending.append(("remove", TAG_PARTITION, f"tag:{item.slug}", "", 0.0))
+            else:
+                pending.append(("put", TAG_PARTITION, f"tag:{item.slug}", item.slug, None))
+    if not post_ids:
+        return
+    # Runs inside the flush, so the rows reflect this transaction's writes (deleted posts return nothing).
+    rows = session.connection().execute(
+        select(
+            PostTranslation.post_id,
+            PostTranslation.language,
+            PostTranslation.title,
+            Post.helpful_count,
+            Post.accuracy_count,
+        )
+        .join(Post, Post.id == PostTranslation.post_id)
+        .where(
+            PostTranslation.post_id.in_(post_ids),
+            PostTranslation.status == "ready",
+            Post.status == "published",
+        )
+    )
+    for post_id in post_ids:
+        pending.append(("remove", None, f"post:{post_id}", "", 0.0))
+    for post_id, language, title, helpful_count, accuracy_count in rows.all():
+        pending.append(("put", language, f"post:{post_id}", title or "", _post_weight(helpful_count, accuracy_count)))
+
+
+def _apply_suggestion_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    index = _suggestion_index
+    if not pending or index is None:
+        return
+    for action, language, entry_id, text, weight in pending:
+        if action == "remove":
+            index.remove(language, entry_id)
+            continue
+        if weight is None:
+            # Tag usage counts are refreshed by the periodic rebuild; keep the known weight meanwhile.
+            partition = index.partitions.get(language)
+            current = partition.entries.get(entry_id) if partition else None
+            weight = current[1] if current else 1.0
+        index.put(language, entry_id, text, weight)
+
+
+def _discard_suggestion_changes(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_suggestion_sync() -> None:
+    if not event.contains(Session, "after_flush", _collect_suggestion_changes):
+        event.listen(Session, "after_flush", _collect_suggestion_changes)
+        event.listen(Session, "after_commit", _apply_suggestion_changes)
+        event.listen(Session, "after_soft_rollback", _discard_suggestion_changes)
+
+
+async def catch_up_suggestions(db: AsyncSession) -> int:
+    # Titles translated by other processes (e.g. the standalone translation worker) never pass through
+    # this process's session events, so pick them up by updated_at between rebuilds.
+    global _caught_up_to
+    index = _suggestion_index
+    if index is None:
+        return 0
+    latest = (await db.execute(select(func.max(PostTranslation.updated_at)))).scalar_one_or_none()
+    if latest is None:
+        return 0
+    stmt = select(PostTranslation.post_id).distinct()
+    if _caught_up_to is not None:
+        stmt = stmt.where(PostTranslation.updated_at >= _caught_up_to - CATCH_UP_OVERLAP)
+    post_ids = set((await db.execute(stmt)).scalars().all())
+    _caught_up_to = latest
+    if not post_ids:
+        return 0
+    rows = await db.execute(
+        select(
+            PostTranslation.post_id,
+            PostTranslation.language,
+            PostTranslation.title,
+            Post.helpful_count,
+            Post.accuracy_count,
+        )
+        .join(Post, Post.id == PostTranslation.post_id)
+        .where(
+            PostTranslation.post_id.in_(post_ids),
+            PostTranslation.status == "ready",
+            Post.status == "published",
+        )
+    )
+    for post_id in post_ids:
+        index.remove(None, f"post:{post_id}")
+    for post_id, language, title, helpful_count, accuracy_count in rows.all():
+        index.put(language, f"post:{post_id}", title or "", _post_weight(helpful_count, accuracy_count))
+    return len(post_ids)
+
+
+async def _catch_up_job() -> None:
+    async with SessionLocal() as session:
+        count = await catch_up_suggestions(session)
+    if count:
+        logger.debug("Suggestion index caught up on %s posts", count)
+
+
+async def _rebuild_job() -> None:
+    async with SessionLocal() as session:
+        index = await build_suggestion_index(session)
+    logger.info("Rebuilt suggestion index with %s partitions", len(index.partitions))
+
+
+def start_suggestion_refresh() -> None:
+    start_periodic("suggestion_rebuild", settings.suggestion_rebuild_seconds, _rebuild_job)
+    start_periodic("suggestion_catch_up", settings.search_catch_up_seconds, _catch_up_job)
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta, timezone
+import hashlib
+import logging
+import unicodedata
+
+from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.periodic import start_periodic
+from app.models.models import TranslationMemory
+
+
+logger = logging.getLogger(__name__)
+
+_LOOKUP_CHUNK = 500
+# Hits refresh last_used_at at most this often, so a hot segment does not cost a write on every read.
+_TOUCH_INTERVAL = timedelta(hours=1)
+
+
+def normalize_segment(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def segment_hash(text: str) -> str:
+    return hashlib.sha256(normalize_segment(text).encode("utf-8")).hexdigest()
+
+
+async def recall_segments(
+    segments: list[str], source_language: str, target_languages: list[str]
+) -> dict[str, dict[str, str]]:
+    if not settings.translation_memory_enabled or not segments or not target_languages:
+        return {}
+    hashes = sorted({segment_hash(segment) for segment in segments})
+    try:
+        async with SessionLocal() as db:
+            found = await _recall(db, hashes, source_language, target_languages)
+            await db.commit()
+    except Exception:
+        # The memory only saves model calls; if it is unavailable every segment is simply a miss.
+        logger.exception("Translation memory lookup failed")
+        return {}
+    return found
+
+
+async def _recall(
+    db: AsyncSession, hashes: list[str], source_language: str, target_languages: list[str]
+) -> dict[str, dict[str, str]]:
+    now = datetime.now(timezone.utc)
+    found: dict[str, dict[str, str]] = {}
+    for start in range(0, len(hashes), _LOOKUP_CHUNK):
+        chunk = hashes[start : start + _LOOKUP_CHUNK]
+        key = and_(
+            TranslationMemory.segment_hash.in_(chunk),
+            TranslationMemory.source_language == source_language,
+            TranslationMemory.target_language.in_(target_languages),
+            TranslationMemory.model == settings.openai_model,
+        )
+        result = await db.execute(
+            select(
+                TranslationMemory.target_language,
+                TranslationMemory.segment_hash,
+                TranslationMemory.translation,
+            ).where(key)
+        )
+        for language, digest, translation in result.all():
+            found.setdefault(language, {})[digest] = translation
+        await db.execute(
+            update(TranslationMemory)
+            .where(key, TranslationMemory.last_used_at < now - _TOUCH_INTERVAL)
+            .values(last_used_at=now)
+            .execution_options(synchronize_session=False)
+        )
+    return found
+
+
+async def remember_segments(source_language: str, translations: dict[str, dict[str, str]]) -> None:
+    if not settings.translation_memory_enabled:
+        return
+    now = datetime.now(timezone.utc)
+    rows = {
+        (segment_hash(segment), language): translation
+        for language, pairs in translations.items()
+        for segment, translation in pairs.items()
+        if segment.strip() and translation.strip()
+    }
+    if not rows:
+        return
+    try:
+        async with SessionLocal() as db:
+            dialect = (await db.connection()).dialect.name
+            statement = (postgresql_insert if dialect == "postgresql" else sqlite_insert)(TranslationMemory)
+            # Another worker may have stored some of these segments first; keep its translation and only
+            # mark the entry as used, so one duplicate never discards the rest of the batch.
+            await db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["segment_hash", "source_language", "target_language", "model"],
+                    set_={"last_used_at": statement.excluded.last_used_at},
+                ),
+                [
+                    {
+                        "segment_hash": digest,
+                        "source_language": source_language,
+                        "target_language": language,
+                        "model": settings.openai_model,
+                        "translation": translation,
+                        "last_used_at": now,
+                    }
+                    for (digest, language), translation in rows.items()
+                ],
+            )
+            await db.commit()
+    except Exception:
+        logger.exception("Translation memory write failed")
+
+
+async def prune_translation_memory(db: AsyncSession) -> int:
+    expired_before = datetime.now(timezone.utc) - timedelta(days=settings.translation_memory_ttl_days)
+    result = await db.execute(delete(TranslationMemory).where(TranslationMemory.last_used_at < expired_before))
+    removed = result.rowcount
+    total = (await db.execute(select(func.count()).select_from(TranslationMemory))).scalar_one()
+    if total > settings.translation_memory_max_entries:
+        # Least recently used entries go first once the table outgrows its budget.
+        cutoff = (await db.execute(_lru_cutoff(settings.translation_memory_max_entries))).scalar_one_or_none()
+        if cutoff is not None:
+            result = await db.execute(delete(TranslationMemory).where(TranslationMemory.last_used_at < cutoff))
+            removed += result.rowcount
+    await db.commit()
+    return removed
+
+
+def _lru_cutoff(keep: int):
+    return select(TranslationMemory.last_used_at).order_by(TranslationMemory.last_used_at.desc()).offset(keep).limit(1)
+
+
+async def _prune_job() -> None:
+    async with SessionLocal() as session:
+        removed = await prune_translation_memory(session)
+    if removed:
+        logger.info("Pruned %s translation memory entries", removed)
+
+
+def start_translation_memory_pruning() -> None:
+    if settings.translation_memory_enabled:
+        start_periodic("translation_memory_prune", settings.translation_memory_prune_seconds, _prune_job)
@@ -0,0 +1,206 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+import logging
+import math
+import time
+
+from sqlalchemy import delete, func, insert, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.coalescing import CoalescingBuffer
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.periodic import start_periodic
+from app.models.models import AccuracyFeedback, HelpfulnessVote, Post, PostTrendingScore, PostView
+
+
+logger = logging.getLogger(__name__)
+
+HELPFUL_WEIGHT = 3.0
+# Scaled by rating / 5, so a 5-star rating counts as one helpful vote.
+ACCURACY_WEIGHT = 3.0
+VIEW_WEIGHT = 0.1
+PUBLISH_WEIGHT = 1.0
+# Scores are sum(weight * 2 ** ((event_time - epoch) / half_life)). Every row shares the epoch, so
+# ranking is unaffected by time passing and new events are plain additions. The epoch steps forward
+# once per era to keep the factors small; the refresh job rebases every row onto the new epoch.
+ERA_BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+ERA_LENGTH = timedelta(days=60)
+# Events older than this contribute less than 2 ** -10 of a fresh event and are skipped by the refresh.
+HALF_LIVES_KEPT = 10
+
+
+def _utc(value: datetime | None) -> datetime:
+    if value is None:
+        return datetime.now(timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _epoch(now: datetime) -> datetime:
+    eras = (now - ERA_BASE) // ERA_LENGTH
+    return ERA_BASE + ERA_LENGTH * eras
+
+
+def _growth(at: datetime | None, epoch: datetime) -> float:
+    half_life = settings.trending_half_life_hours * 3600
+    return math.pow(2.0, (_utc(at) - epoch).total_seconds() / half_life)
+
+
+def trending_amount(weight: float, at: datetime | None = None) -> float:
+    now = datetime.now(timezone.utc)
+    return weight * _growth(at or now, _epoch(now))
+
+
+async def bump_trending_score(
+    db: AsyncSession, post_id: str, weight: float, at: datetime | None = None
+) -> None:
+    await add_trending_amount(db, post_id, trending_amount(weight, at))
+
+
+async def add_trending_amount(db: AsyncSession, post_id: str, amount: float) -> None:
+    result = await db.execute(
+        update(PostTrendingScore)
+        .where(PostTrendingScore.post_id == post_id)
+        .values(score=PostTrendingScore.score + amount)
+    )
+    if result.rowcount == 0 and amount > 0:
+        # The refresh job backfills anything lost if two writers race to create the row.
+        async with db.begin_nested():
+            await db.execute(insert(PostTrendingScore).values(post_id=post_id, score=amount))
+
+
+async def trending_post_ids(db: AsyncSession, limit: int) -> list[str]:
+    result = await db.execute(
+        select(Post.id)
+        .join(PostTrendingScore, PostTrendingScore.post_id == Post.id)
+        .where(Post.status == "published")
+        .order_by(PostTrendingScore.score.desc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+def _growth_sql(column, epoch: datetime, dialect: str):
+    # SQL form of _growth(): exp((t - epoch) * ln 2 / half_life), with t in seconds since the Unix epoch.
+    if dialect == "postgresql":
+        seconds = func.extract("epoch", column)
+    else:
+        seconds = (func.julianday(column) - 2440587.5) * 86400
+    rate = math.log(2) / (settings.trending_half_life_hours * 3600)
+    return func.exp((seconds - epoch.timestamp()) * rate)
+
+
+async def refresh_trending_scores(db: AsyncSession) -> int:
+    now = datetime.now(timezone.utc)
+    epoch = _epoch(now)
+    cutoff = now - timedelta(hours=settings.trending_half_life_hours * HALF_LIVES_KEPT)
+    dialect = (await db.connection()).dialect.name
+
+    events = union_all(
+        select(
+            Post.id.label("post_id"),
+            (PUBLISH_WEIGHT * _growth_sql(func.coalesce(Post.published_at, Post.created_at), epoch, dialect)).label(
+                "amount"
+            ),
+        ).where(Post.status == "published"),
+        select(
+            HelpfulnessVote.target_id,
+            HELPFUL_WEIGHT * _growth_sql(HelpfulnessVote.created_at, epoch, dialect),
+        ).where(HelpfulnessVote.target_type == "post", HelpfulnessVote.created_at >= cutoff),
+        select(
+            AccuracyFeedback.post_id,
+            ACCURACY_WEIGHT * AccuracyFeedback.rating / 5.0 * _growth_sql(AccuracyFeedback.created_at, epoch, dialect),
+        ).where(AccuracyFeedback.created_at >= cutoff),
+        select(PostView.post_id, VIEW_WEIGHT * _growth_sql(PostView.created_at, epoch, dialect)).where(
+            PostView.created_at >= cutoff
+        ),
+    ).subquery()
+    scores = (
+        select(events.c.post_id, func.sum(events.c.amount))
+        .join(Post, Post.id == events.c.post_id)
+        .where(Post.status == "published")
+        .group_by(events.c.post_id)
+    )
+    # One statement recomputes and upserts every score, so increments committed meanwhile are never lost
+    # to a truncate-and-reload; the WHERE above also keeps SQLite's INSERT ... SELECT ... ON CONFLICT unambiguous.
+    upsert = (postgresql_insert if dialect == "postgresql" else sqlite_insert)(PostTrendingScore).from_select(
+        ["post_id", "score"], scores
+    )
+    result = await db.execute(
+        upsert.on_conflict_do_update(index_elements=["post_id"], set_={"score": upsert.excluded.score})
+    )
+    await db.execute(
+        delete(PostTrendingScore).where(
+            PostTrendingScore.post_id.not_in(select(Post.id).where(Post.status == "published"))
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+
+_recent_viewers: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+
+def _seen_recently(post_id: str, user_id: str | None, ip: str | None) -> bool:
+    viewer = f"user:{user_id}" if user_id else f"ip:{ip}" if ip else None
+    if viewer is None:
+        return False
+    key = (post_id, viewer)
+    now = time.monotonic()
+    seen = _recent_viewers.get(key)
+    if seen is not None and now - seen < settings.post_view_dedupe_seconds:
+        return True
+    _recent_viewers[key] = now
+    _recent_viewers.move_to_end(key)
+    while len(_recent_viewers) > settings.post_view_dedupe_size:
+        _recent_viewers.popitem(last=False)
+    return False
+
+
+async def record_post_view(post_id: str, user_id: str | None, ip: str | None) -> None:
+    # Repeat views by the same viewer within the window do not count, so reloading cannot inflate trending.
+    if _seen_recently(post_id, user_id, ip):
+        return
+    view_buffer.append((post_id, user_id, ip, datetime.now(timezone.utc)))
+    if not view_buffer.running:
+        await view_buffer.flush()
+
+
+async def _flush_post_views(_deltas: dict, views: list) -> None:
+    amounts: dict[str, float] = {}
+    for post_id, _, _, viewed_at in views:
+        amounts[post_id] = amounts.get(post_id, 0.0) + trending_amount(VIEW_WEIGHT, viewed_at)
+    async with SessionLocal() as db:
+        # Posts deleted since the view was buffered would fail the whole batch on their foreign key.
+        result = await db.execute(select(Post.id).where(Post.id.in_(amounts)))
+        existing = set(result.scalars().all())
+        rows = [
+            {"post_id": post_id, "user_id": user_id, "ip": ip, "created_at": viewed_at}
+            for post_id, user_id, ip, viewed_at in views
+            if post_id in existing
+        ]
+        if rows:
+            await db.execute(insert(PostView), rows)
+        for post_id in sorted(existing):
+            await add_trending_amount(db, post_id, amounts[post_id])
+        await db.commit()
+
+
+# Views are written in batches: one insert and one score update per post per flush, off the read path.
+view_buffer = CoalescingBuffer(
+    "post_views", _flush_post_views, settings.post_view_flush_ms, settings.post_view_max_events
+)
+
+
+async def _refresh_job() -> None:
+    async with SessionLocal() as session:
+        count = await refresh_trending_scores(session)
+    logger.info("Refreshed trending scores for %s posts", count)
+
+
+def start_trending_refresh() -> None:
+    start_periodic("trending_refresh", settings.trending_refresh_seconds, _refresh_job)
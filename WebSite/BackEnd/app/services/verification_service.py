@@ -14,7 +14,7 @@ async def submit_verification(db: AsyncSession, user_id: str, docs_url: str) ->
 
     request = VerificationRequest(user_id=user_id, docs_file_id=file_record.id)
     db.add(request)
-    await db.commit()
+    await db.flush()
     await db.refresh(request)
     return request
 
@@ -54,7 +54,7 @@ async def approve_verification(db: AsyncSession, request_id: str, reviewer_id: s
         dedupe_key=str(request.id),
     )
     await log_action(db, reviewer_id, "verification", request.id, "verification_approve", None)
-    await db.commit()
+    await db.flush()
 
 
 async def reject_verification(db: AsyncSession, request_id: str, reviewer_id: str) -> None:
@@ -72,5 +72,5 @@ async def reject_verification(db: AsyncSession, request_id: str, reviewer_id: st
         dedupe_key=str(request.id),
     )
     await log_action(db, reviewer_id, "verification", request.id, "verification_reject", None)
-    await db.commit()
+    await db.flush()
 
@@ -0,0 +1,62 @@
+import argparse
+import statistics
+import sys
+import time
+
+from argon2 import PasswordHasher
+
+from app.core.config import settings
+
+# OWASP's minimum Argon2id memory; calibration never goes below it to meet a latency target.
+MIN_MEMORY_KIB = 19456
+MAX_TIME_COST = 10
+
+
+def _measure_ms(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, memory_cost: int, parallelism: int, samples: int) -> tuple[int, int, float]:
+    while memory_cost > MIN_MEMORY_KIB and _measure_ms(1, memory_cost, parallelism, samples) > target_ms:
+        memory_cost = max(MIN_MEMORY_KIB, memory_cost // 2)
+    time_cost = 1
+    elapsed = _measure_ms(time_cost, memory_cost, parallelism, samples)
+    while time_cost < MAX_TIME_COST:
+        candidate = _measure_ms(time_cost + 1, memory_cost, parallelism, samples)
+        if candidate > target_ms:
+            break
+        time_cost, elapsed = time_cost + 1, candidate
+    return time_cost, memory_cost, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Choose Argon2 parameters for a target hashing latency.")
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--memory-kib", type=int, default=settings.argon2_memory_cost)
+    parser.add_argument("--parallelism", type=int, default=settings.argon2_parallelism)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+    time_cost, memory_cost, elapsed = calibrate(args.target_ms, args.memory_kib, args.parallelism, args.samples)
+    current = _measure_ms(
+        settings.argon2_time_cost, settings.argon2_memory_cost, settings.argon2_parallelism, args.samples
+    )
+    print(
+        f"Current: t={settings.argon2_time_cost} m={settings.argon2_memory_cost} "
+        f"p={settings.argon2_parallelism} -> {current:.1f} ms"
+    )
+    print(f"Chosen:  t={time_cost} m={memory_cost} p={args.parallelism} -> {elapsed:.1f} ms")
+    print("Add to .env (existing hashes are upgraded on the next successful login):")
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(f"ARGON2_PARALLELISM={args.parallelism}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
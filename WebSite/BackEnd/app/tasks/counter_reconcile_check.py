@@ -0,0 +1,82 @@
+import asyncio
+import sys
+
+from sqlalchemy import func, select
+
+from app.core.database import SessionLocal, engine
+from app.models.base import Base
+from app.models.models import Post, PostTranslation, Profile, User
+from app.services.interaction_service import mark_helpful_post, reconcile_interaction_counters, vote_buffer
+
+
+async def _seed() -> tuple[str, str, str]:
+    async with SessionLocal() as session:
+        author = User(email="reconcile-author@example.com", password_hash="x")
+        voter = User(email="reconcile-voter@example.com", password_hash="x")
+        session.add_all([author, voter])
+        await session.flush()
+        session.add_all(
+            [
+                Profile(user_id=author.id, display_name="Author"),
+                Profile(user_id=voter.id, display_name="Voter"),
+            ]
+        )
+        post = Post(author_id=author.id, original_language="en", status="published")
+        session.add(post)
+        await session.flush()
+        session.add(
+            PostTranslation(
+                post_id=post.id, language="en", title="Reconcile check", content="{}", status="ready", translated_by="user"
+            )
+        )
+        await session.commit()
+        return author.id, voter.id, post.id
+
+
+async def _counters(author_id: str, post_id: str) -> tuple[int, int]:
+    async with SessionLocal() as session:
+        helpful_count = (await session.execute(select(Post.helpful_count).where(Post.id == post_id))).scalar_one()
+        score = (
+            await session.execute(select(Profile.helpfulness_score).where(Profile.user_id == author_id))
+        ).scalar_one()
+    return helpful_count, score
+
+
+async def run() -> int:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as session:
+        if (await session.execute(select(func.count()).select_from(User))).scalar_one():
+            print("Refusing to run against a database that already has users; point DATABASE_URL at an empty one.")
+            return 1
+    author_id, voter_id, post_id = await _seed()
+
+    vote_buffer.start()
+    if not vote_buffer.running:
+        print("VOTE_BUFFER_FLUSH_MS must be above 0 so the vote stays buffered during the reconcile pass.")
+        return 1
+    try:
+        async with SessionLocal() as session:
+            await mark_helpful_post(session, voter_id, post_id)
+        # The vote row is committed while its counter delta still waits in the buffer.
+        pending = vote_buffer.pending(("helpful", "post", post_id))
+        async with SessionLocal() as session:
+            await reconcile_interaction_counters(session)
+    finally:
+        await vote_buffer.stop()
+
+    helpful_count, score = await _counters(author_id, post_id)
+    await engine.dispose()
+    print(f"buffered={pending} helpful_count={helpful_count} helpfulness_score={score}")
+    if (helpful_count, score) != (1, 1):
+        print("Counters drifted: the buffered vote was counted more than once.")
+        return 1
+    return 0
+
+
+def main() -> int:
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import argparse
+import sys
+import time
+
+from app.core import security
+from app.core.security import TOKEN_VERIFIERS, create_access_token, decode_token
+
+
+def _per_call_us(fn, token: str, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(token)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def run_benchmark(iterations: int) -> dict[str, float]:
+    token = create_access_token("benchmark-user", {"role": "user", "is_root": False})
+    results = {name: _per_call_us(verify, token, iterations) for name, verify in TOKEN_VERIFIERS.items()}
+    security._verified_tokens.clear()
+    decode_token(token)
+    results["cached decode_token"] = _per_call_us(decode_token, token, iterations)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare access token verification paths.")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    results = run_benchmark(args.iterations)
+    baseline = results["jose"]
+    for name, per_call in results.items():
+        print(f"{name:<20} {per_call:9.2f} us/call  {baseline / per_call:6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
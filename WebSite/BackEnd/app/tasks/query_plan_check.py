@@ -0,0 +1,349 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+import sys
+from typing import Awaitable, Callable
+import uuid
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.database import engine
+from app.core.errors import AppError
+from app.core.pagination import encode_cursor
+from app.models.models import (
+    AccuracyFeedback,
+    Category,
+    EmailVerificationCode,
+    HelpfulnessVote,
+    ModerationAction,
+    ModerationLog,
+    Notification,
+    Post,
+    PostTag,
+    PostTranslation,
+    PostTrendingScore,
+    Profile,
+    Reply,
+    Report,
+    Tag,
+    TranslationJob,
+    TranslationMemory,
+    User,
+)
+from app.services.audit_query_service import list_audit_logs
+from app.services.auth_service import issue_tokens, refresh_access_token, revoke_user_sessions, verify_email_code
+from app.services.interaction_service import reconcile_interaction_counters
+from app.services.moderation_service import list_logs, list_user_logs
+from app.services.notification_service import create_notification, list_notifications
+from app.services.post_service import get_post, list_post_versions, list_user_posts, touch_tagged_posts
+from app.services.post_translation_service import claim_translation_jobs, enqueue_missing_post_translations
+from app.services.reply_service import list_replies, list_user_replies
+from app.services.report_service import list_my_reports, list_reports
+from app.services.translation_memory_service import _lru_cutoff, _recall
+from app.services.trending_service import trending_post_ids
+
+HotCall = Callable[[AsyncSession], Awaitable[object]]
+
+_USERS = 200
+_POSTS = 2000
+_LANGUAGES = ("en", "zh", "ko")
+
+
+def _ids(count: int) -> list[str]:
+    return [str(uuid.uuid4()) for _ in range(count)]
+
+
+async def _seed(db: AsyncSession) -> dict[str, str]:
+    # Enough rows per table that the planner's choices match a populated database; rolled back afterwards.
+    now = datetime.now(timezone.utc)
+
+    def ago(minutes: int) -> datetime:
+        return now - timedelta(minutes=minutes)
+
+    users = _ids(_USERS)
+    posts = _ids(_POSTS)
+    replies = _ids(_POSTS * 2)
+    tags = _ids(50)
+    category = str(uuid.uuid4())
+    tokens = {}
+
+    await db.execute(
+        insert(User),
+        [{"id": user_id, "email": f"plan-{user_id}@example.com", "password_hash": "x"} for user_id in users],
+    )
+    await db.execute(insert(Profile), [{"user_id": user_id, "display_name": "Plan"} for user_id in users])
+    await db.execute(insert(Category), [{"id": category, "name": "Plan", "slug": f"plan-{category}"}])
+    await db.execute(insert(Tag), [{"id": tag_id, "name": tag_id[:8], "slug": f"plan-{tag_id}"} for tag_id in tags])
+    await db.execute(
+        insert(Post),
+        [
+            {
+                "id": post_id,
+                "author_id": users[index % _USERS],
+                "category_id": category,
+                "original_language": "en",
+                "status": "published" if index % 10 else "hidden",
+                "created_at": ago(index),
+            }
+            for index, post_id in enumerate(posts)
+        ],
+    )
+    await db.execute(
+        insert(PostTranslation),
+        [
+            {"post_id": post_id, "language": language, "title": "Plan", "content": "{}", "status": "ready"}
+            for index, post_id in enumerate(posts)
+            for language in _LANGUAGES[: 1 + index % len(_LANGUAGES)]
+        ],
+    )
+    await db.execute(
+        insert(PostTag),
+        [{"post_id": post_id, "tag_id": tags[index % len(tags)]} for index, post_id in enumerate(posts)],
+    )
+    await db.execute(
+        insert(PostTrendingScore), [{"post_id": post_id, "score": float(index)} for index, post_id in enumerate(posts)]
+    )
+    await db.execute(
+        insert(Reply),
+        [
+            {
+                "id": reply_id,
+                "post_id": posts[index % _POSTS],
+                "author_id": users[index % _USERS],
+                "content": "Plan",
+                "created_at": ago(index),
+            }
+            for index, reply_id in enumerate(replies)
+        ],
+    )
+    await db.execute(
+        insert(HelpfulnessVote),
+        [
+            {"user_id": users[index % _USERS], "target_type": target_type, "target_id": target_id}
+            for target_type, targets in (("post", posts), ("reply", replies))
+            for index, target_id in enumerate(targets)
+        ],
+    )
+    await db.execute(
+        insert(AccuracyFeedback),
+        [{"user_id": users[index % _USERS], "post_id": post_id, "rating": 4} for index, post_id in enumerate(posts)],
+    )
+    await db.execute(
+        insert(Notification),
+        [
+            {
+                "user_id": users[index % _USERS],
+                "type": "post_helpful",
+                "dedupe_key": f"post_helpful:{index}",
+                "created_at": ago(index),
+            }
+            for index in range(_POSTS * 2)
+        ],
+    )
+    await db.execute(
+        insert(EmailVerificationCode),
+        [
+            {
+                "email": f"plan-{user_id}@example.com",
+                "purpose": "register",
+                "code": "123456",
+                "expires_at": now + timedelta(minutes=10),
+            }
+            for user_id in users
+        ],
+    )
+    await db.execute(
+        insert(Report),
+        [
+            {"reporter_id": users[index % _USERS], "target_type": "post", "target_id": post_id, "reason": "Plan"}
+            for index, post_id in enumerate(posts[:500])
+        ],
+    )
+    await db.execute(
+        insert(ModerationLog),
+        [
+            {
+                "target_type": "post",
+                "target_id": post_id,
+                "user_id": users[index % _USERS],
+                "decision": "allow",
+                "created_at": ago(index),
+            }
+            for index, post_id in enumerate(posts)
+        ],
+    )
+    await db.execute(
+        insert(ModerationAction),
+        [
+            {"moderator_id": users[0], "target_type": "post", "target_id": post_id, "action": "hide"}
+            for post_id in posts[:500]
+        ],
+    )
+    await db.execute(
+        insert(TranslationJob),
+        [
+            {
+                "target_type": "post",
+                "target_id": post_id,
+                "language": "es",
+                "status": ("completed", "pending", "processing", "failed")[index % 4],
+                "created_at": ago(index),
+            }
+            for index, post_id in enumerate(posts)
+        ],
+    )
+    await db.execute(
+        insert(TranslationMemory),
+        [
+            {
+                "segment_hash": f"{index:064x}",
+                "source_language": "en",
+                "target_language": language,
+                "model": "plan",
+                "translation": "Plan",
+                "last_used_at": ago(index),
+            }
+            for index in range(_POSTS)
+            for language in _LANGUAGES[1:]
+        ],
+    )
+    for user_id in users[:20]:
+        tokens[user_id] = (await issue_tokens(db, user_id))[1]
+    await db.flush()
+    return {
+        "user": users[1],
+        "post": posts[1],
+        "tag": tags[1],
+        "email": f"plan-{users[1]}@example.com",
+        "refresh_token": tokens[users[1]],
+        "cursor": encode_cursor(ago(100).replace(tzinfo=None), posts[100]),
+    }
+
+
+def _hot_calls(seeded: dict[str, str]) -> dict[str, HotCall]:
+    user, post, cursor = seeded["user"], seeded["post"], seeded["cursor"]
+    return {
+        "posts_feed": lambda db: list_post_versions(db, "zh", 20, 0),
+        "posts_feed_cursor": lambda db: list_post_versions(db, "zh", 20, 0, cursor=cursor),
+        "post_detail": lambda db: get_post(db, post, "zh"),
+        "posts_by_author": lambda db: list_user_posts(db, user, "zh", 20, 0),
+        "trending_top": lambda db: trending_post_ids(db, 10),
+        "tag_touch_posts": lambda db: touch_tagged_posts(db, seeded["tag"]),
+        "notifications_list": lambda db: list_notifications(db, user, 20, 0),
+        "notifications_cursor": lambda db: list_notifications(db, user, 20, 0, cursor=cursor),
+        "notification_dedupe": lambda db: create_notification(db, user, "post_helpful", None, "post_helpful:1"),
+        "replies_list": lambda db: list_replies(db, post, 20, 0),
+        "replies_by_author": lambda db: list_user_replies(db, user, 20, 0),
+        "email_code_lookup": lambda db: verify_email_code(db, seeded["email"], "123456", "register"),
+        "refresh_session_lookup": lambda db: refresh_access_token(db, seeded["refresh_token"]),
+        "user_sessions_by_user": lambda db: revoke_user_sessions(db, user),
+        "reports_list": lambda db: list_reports(db, 20, 0),
+        "my_reports": lambda db: list_my_reports(db, user, 20, 0),
+        "moderation_logs_list": lambda db: list_logs(db, 20, 0),
+        "moderation_logs_by_user": lambda db: list_user_logs(db, user, 20, 0),
+        "audit_logs_cursor": lambda db: list_audit_logs(db, 50, 0, cursor=cursor),
+        "translation_job_claim": lambda db: claim_translation_jobs(db, "query-plan-check"),
+        "translation_job_upsert": lambda db: enqueue_missing_post_translations(db, post),
+        "translation_memory_lookup": lambda db: _recall(db, [f"{index:064x}" for index in range(3)], "en", ["zh"]),
+        "translation_memory_lru": lambda db: db.execute(_lru_cutoff(1000)),
+        "counter_reconcile": lambda db: reconcile_interaction_counters(db, 500),
+    }
+
+
+async def _capture(connection: AsyncConnection, db: AsyncSession, call: HotCall) -> list[tuple[str, tuple]]:
+    statements: dict[str, tuple] = {}
+
+    def record(_conn, _cursor, statement, parameters, _context, executemany) -> None:
+        # The first parameters seen for each statement are enough to explain it.
+        if not executemany and statement.lstrip().split(None, 1)[0].upper() in {"SELECT", "UPDATE", "DELETE", "WITH"}:
+            statements.setdefault(statement, tuple(parameters or ()))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", record)
+    try:
+        await call(db)
+    except AppError:
+        # A business-rule rejection still ran the lookup we want to explain.
+        pass
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", record)
+    return list(statements.items())
+
+
+async def _sqlite_full_scans(connection: AsyncConnection, sql: str, params: tuple) -> list[str]:
+    result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)
+    scans = []
+    for row in result.all():
+        detail = str(row[-1])
+        # "SCAN posts USING INDEX ..." walks an index in order; a bare "SCAN posts" reads the whole table.
+        if detail.startswith("SCAN ") and "USING" not in detail:
+            scans.append(detail)
+    return scans
+
+
+async def _postgres_full_scans(connection: AsyncConnection, sql: str, params: tuple) -> list[str]:
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", params)
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    scans: list[str] = []
+    _collect_seq_scans(plan[0]["Plan"], scans)
+    return scans
+
+
+def _collect_seq_scans(node: dict, scans: list[str]) -> None:
+    if node.get("Node Type") == "Seq Scan":
+        scans.append(f"Seq Scan on {node.get('Relation Name')}")
+    for child in node.get("Plans", []):
+        _collect_seq_scans(child, scans)
+
+
+async def check_query_plans() -> tuple[int, dict[str, list[str]]]:
+    regressions: dict[str, list[str]] = {}
+    checked = 0
+    async with engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            explain = _postgres_full_scans
+        elif connection.dialect.name == "sqlite":
+            explain = _sqlite_full_scans
+        else:
+            raise RuntimeError(f"Unsupported dialect: {connection.dialect.name}")
+        transaction = await connection.begin()
+        if connection.dialect.name == "sqlite":
+            # pysqlite defers BEGIN to the first write; without it the session's savepoint release would commit.
+            await connection.exec_driver_sql("BEGIN")
+        try:
+            db = AsyncSession(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            seeded = await _seed(db)
+            await connection.exec_driver_sql("ANALYZE")
+            captured = {name: await _capture(connection, db, call) for name, call in _hot_calls(seeded).items()}
+            if connection.dialect.name == "postgresql":
+                # With seq scans priced out, a remaining Seq Scan means no usable index exists.
+                await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            for name, statements in captured.items():
+                for index, (sql, params) in enumerate(statements):
+                    checked += 1
+                    scans = await explain(connection, sql, params)
+                    if scans:
+                        label = name if len(statements) == 1 else f"{name}[{index}]"
+                        regressions[label] = scans + [" ".join(sql.split())[:200]]
+            await db.close()
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+    return checked, regressions
+
+
+def main() -> int:
+    checked, regressions = asyncio.run(check_query_plans())
+    if regressions:
+        for name, scans in regressions.items():
+            print(f"FULL SCAN {name}: {'; '.join(scans)}")
+        print(f"Query plan check failed: {len(regressions)}/{checked} hot statements regressed to a full scan.")
+        return 1
+    print(f"Query plan check passed: {checked} hot statements use indexes.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
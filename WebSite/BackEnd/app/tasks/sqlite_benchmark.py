@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+from sqlalchemy import exc, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import create_engines
+from app.models.base import Base
+from app.models.models import Post, PostTranslation, PostView, User
+
+
+async def _seed(session_factory, posts: int) -> list[str]:
+    async with session_factory() as session:
+        author = User(email="benchmark@example.com", password_hash="x")
+        session.add(author)
+        await session.flush()
+        post_ids = []
+        for index in range(posts):
+            post = Post(author_id=author.id, original_language="en", status="published")
+            session.add(post)
+            await session.flush()
+            session.add(
+                PostTranslation(
+                    post_id=post.id,
+                    language="en",
+                    title=f"Benchmark post {index}",
+                    content="{}",
+                    status="ready",
+                    translated_by="user",
+                )
+            )
+            post_ids.append(post.id)
+        await session.commit()
+    return post_ids
+
+
+async def _reader(session_factory, post_ids: list[str], deadline: float, counts: dict) -> None:
+    while time.perf_counter() < deadline:
+        try:
+            async with session_factory() as session:
+                await session.execute(
+                    select(Post.id, PostTranslation.title)
+                    .join(PostTranslation, PostTranslation.post_id == Post.id)
+                    .where(Post.status == "published")
+                    .order_by(Post.created_at.desc())
+                    .limit(20)
+                )
+                await session.execute(select(Post).where(Post.id == random.choice(post_ids)))
+            counts["reads"] += 1
+        except exc.OperationalError:
+            counts["read_errors"] += 1
+
+
+async def _writer(session_factory, post_ids: list[str], deadline: float, counts: dict) -> None:
+    while time.perf_counter() < deadline:
+        post_id = random.choice(post_ids)
+        try:
+            async with session_factory() as session:
+                session.add(PostView(post_id=post_id))
+                await session.execute(
+                    update(Post).where(Post.id == post_id).values(helpful_count=Post.helpful_count + 1)
+                )
+                await session.commit()
+            counts["writes"] += 1
+        except exc.OperationalError:
+            counts["write_errors"] += 1
+
+
+async def run_profile(profile: str, seconds: float, readers: int, writers: int, posts: int) -> dict:
+    directory = tempfile.mkdtemp(prefix="bridgeus-sqlite-bench-")
+    url = f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}"
+    writer_engine, reader_engine = create_engines(url, profile)
+    write_sessions = async_sessionmaker(writer_engine, expire_on_commit=False, class_=AsyncSession)
+    read_sessions = async_sessionmaker(reader_engine, expire_on_commit=False, class_=AsyncSession)
+    async with writer_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    post_ids = await _seed(write_sessions, posts)
+
+    counts = {"reads": 0, "read_errors": 0, "writes": 0, "write_errors": 0}
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(
+        *[_reader(read_sessions, post_ids, deadline, counts) for _ in range(readers)],
+        *[_writer(write_sessions, post_ids, deadline, counts) for _ in range(writers)],
+    )
+    await writer_engine.dispose()
+    if reader_engine is not writer_engine:
+        await reader_engine.dispose()
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Mixed read/write throughput of the SQLite profiles.")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--posts", type=int, default=500)
+    args = parser.parse_args()
+    for profile in ("default", "throughput"):
+        counts = asyncio.run(run_profile(profile, args.seconds, args.readers, args.writers, args.posts))
+        print(
+            f"{profile:<11} reads/s={counts['reads'] / args.seconds:8.1f}  "
+            f"writes/s={counts['writes'] / args.seconds:7.1f}  "
+            f"read_errors={counts['read_errors']}  write_errors={counts['write_errors']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
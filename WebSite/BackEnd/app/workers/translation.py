@@ -0,0 +1,181 @@
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import uuid
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.core.logging import setup_logging
+from app.services.fulltext_service import init_fulltext_backend, register_fulltext_sync
+from app.services.post_translation_service import (
+    JOB_CHANNEL,
+    claim_translation_jobs,
+    register_translation_wakeup,
+    release_translation_jobs,
+    renew_translation_lease,
+    reset_stale_processing_translations,
+    run_translation_jobs,
+    unregister_translation_wakeup,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Runs `concurrency` claim/translate loops; idle loops sleep until NOTIFY, an in-process wake-up or the poll interval.
+class TranslationWorker:
+    def __init__(self, concurrency: int, name: str | None = None) -> None:
+        self.concurrency = max(concurrency, 1)
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.processed = 0
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._loops: list[asyncio.Task] = []
+        self._reaper: asyncio.Task | None = None
+        self._listener = None
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    async def start(self) -> None:
+        register_translation_wakeup(self.wake)
+        await self._listen()
+        self._reaper = asyncio.create_task(self._reap())
+        self._loops = [asyncio.create_task(self._loop(f"{self.name}/{index}")) for index in range(self.concurrency)]
+        logger.info("Translation worker %s started with %s loops", self.name, self.concurrency)
+
+    async def stop(self, drain_seconds: float) -> None:
+        # Stop claiming, let in-flight jobs finish, then hand whatever is left back to the queue.
+        self._stopping = True
+        self._wake.set()
+        if self._loops:
+            _, pending = await asyncio.wait(self._loops, timeout=drain_seconds if drain_seconds > 0 else None)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._loops = []
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
+        unregister_translation_wakeup(self.wake)
+        logger.info("Translation worker %s stopped after %s jobs", self.name, self.processed)
+
+    async def _listen(self) -> None:
+        if engine.dialect.name != "postgresql":
+            return
+        connection = await engine.connect()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.add_listener(JOB_CHANNEL, lambda *_: self._wake.set())
+        self._listener = connection
+
+    async def _loop(self, worker_id: str) -> None:
+        while not self._stopping:
+            # Clear before claiming so a job enqueued after this point still wakes us.
+            self._wake.clear()
+            try:
+                async with SessionLocal() as db:
+                    job_ids = await claim_translation_jobs(db, worker_id)
+            except Exception:
+                logger.exception("Claiming translation jobs failed")
+                job_ids = []
+            if not job_ids:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=settings.translation_worker_poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job_ids, worker_id)
+
+    async def _run(self, job_ids: list[str], worker_id: str) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(job_ids, worker_id))
+        try:
+            async with SessionLocal() as db:
+                await run_translation_jobs(db, job_ids, worker_id)
+            self.processed += len(job_ids)
+        except asyncio.CancelledError:
+            async with SessionLocal() as db:
+                await release_translation_jobs(db, job_ids, worker_id)
+            raise
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job_ids: list[str], worker_id: str) -> None:
+        while True:
+            await asyncio.sleep(settings.translation_lease_heartbeat_seconds)
+            try:
+                async with SessionLocal() as db:
+                    if not await renew_translation_lease(db, job_ids, worker_id):
+                        logger.warning("Leases on translation jobs %s were taken over", job_ids)
+                        return
+            except Exception:
+                logger.exception("Renewing leases on translation jobs %s failed", job_ids)
+
+    async def _reap(self) -> None:
+        while True:
+            try:
+                async with SessionLocal() as db:
+                    released = await reset_stale_processing_translations(db)
+                if released:
+                    logger.info("Released %s translation jobs with expired leases", released)
+                    self._wake.set()
+            except Exception:
+                logger.exception("Releasing expired translation leases failed")
+            await asyncio.sleep(settings.translation_lease_seconds)
+
+
+_embedded: TranslationWorker | None = None
+
+
+async def start_embedded_worker() -> None:
+    global _embedded
+    if settings.translation_worker_embedded_loops <= 0 or _embedded is not None:
+        return
+    _embedded = TranslationWorker(settings.translation_worker_embedded_loops)
+    await _embedded.start()
+
+
+async def stop_embedded_worker() -> None:
+    global _embedded
+    if _embedded is None:
+        return
+    await _embedded.stop(settings.translation_worker_drain_seconds)
+    _embedded = None
+
+
+async def _serve(concurrency: int, drain_seconds: float) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    # Translations written here must reach the full-text table just as they do in the API process.
+    register_fulltext_sync()
+    await init_fulltext_backend(engine)
+    worker = TranslationWorker(concurrency)
+    await worker.start()
+    try:
+        await stop.wait()
+    finally:
+        await worker.stop(drain_seconds)
+        await engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the translation job worker.")
+    parser.add_argument("--concurrency", type=int, default=settings.translation_worker_concurrency)
+    parser.add_argument("--drain-seconds", type=float, default=settings.translation_worker_drain_seconds)
+    args = parser.parse_args()
+    setup_logging(settings.log_level)
+    asyncio.run(_serve(args.concurrency, args.drain_seconds))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
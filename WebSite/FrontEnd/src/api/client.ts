@@ -17,6 +17,11 @@ const API_BASE_URL = RAW_API_BASE_URL.replace(/\/+$/, '');
 
 let refreshPromise: Promise<boolean> | null = null;
 
+// After a write the API returns this header; echoing it until it expires keeps our reads on the
+// primary database while replicas catch up.
+const PRIMARY_UNTIL_HEADER = 'X-Primary-Until';
+let primaryUntil: string | null = null;
+
 async function refreshTokens(): Promise<boolean> {
   if (refreshPromise) {
     return refreshPromise;
@@ -69,6 +74,11 @@ export async function apiFetch<T>(
   if (auth && accessToken) {
     headers.set('Authorization', `Bearer ${accessToken}`);
   }
+  if (primaryUntil && Number(primaryUntil) * 1000 > Date.now()) {
+    headers.set(PRIMARY_UNTIL_HEADER, primaryUntil);
+  } else {
+    primaryUntil = null;
+  }
   if (
     fetchOptions.body &&
     !(headers.has('Content-Type') || headers.has('content-type'))
@@ -80,6 +90,7 @@ export async function apiFetch<T>(
     ...fetchOptions,
     headers,
   });
+  primaryUntil = response.headers.get(PRIMARY_UNTIL_HEADER) ?? primaryUntil;
 
   if (response.status === 401 && auth && retryOnUnauthorized) {
     const refreshed = await refreshTokens();